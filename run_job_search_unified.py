@@ -12,7 +12,6 @@ from dotenv import load_dotenv
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from job_finder.logging_config import setup_logging
-from job_finder.search_orchestrator import JobSearchOrchestrator
 
 
 def main():
@@ -75,6 +74,10 @@ def main():
         print(f"  - Remote only: {config.get('search', {}).get('remote_only')}")
         print(f"  - Min match score: {config.get('ai', {}).get('min_match_score')}")
 
+    # Imported here so --help and bad arguments don't load the AI provider
+    # SDKs and Firestore client that the orchestrator pulls in
+    from job_finder.search_orchestrator import JobSearchOrchestrator
+
     # Create and run orchestrator
     orchestrator = JobSearchOrchestrator(config)
 
@@ -11,6 +11,7 @@ Steps:
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
@@ -73,32 +74,39 @@ class StagingDBCleanup:
         logger.info(f"Backed up to: {backup_file}")
         return job_matches
 
-    def delete_collection(self, collection_name: str, batch_size: int = 100):
+    def delete_collection(self, collection_name: str, batch_size: int = 500, max_workers: int = 10):
         """
         Delete all documents in a collection.
 
+        Document references are streamed without their payloads and deleted in
+        WriteBatches (one commit per batch_size documents), with batches
+        committed concurrently.
+
         Args:
             collection_name: Name of collection to delete
-            batch_size: Number of documents to delete per batch
+            batch_size: Number of documents to delete per batch (Firestore max: 500)
+            max_workers: Number of batches to commit concurrently
         """
         logger.info(f"Deleting {collection_name} collection...")
 
         collection_ref = self.db.collection(collection_name)
 
-        deleted = 0
-        while True:
-            # Get batch of documents
-            docs = list(collection_ref.limit(batch_size).stream())
-
-            if not docs:
-                break
+        # select([]) returns document references only, no field data
+        refs = [doc.reference for doc in collection_ref.select([]).stream()]
+        chunks = [refs[i : i + batch_size] for i in range(0, len(refs), batch_size)]
 
-            # Delete batch
-            for doc in docs:
-                doc.reference.delete()
-                deleted += 1
+        def commit_deletes(chunk) -> int:
+            batch = self.db.batch()
+            for ref in chunk:
+                batch.delete(ref)
+            batch.commit()
+            return len(chunk)
 
-            logger.info(f"Deleted {deleted} documents from {collection_name}...")
+        deleted = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for count in executor.map(commit_deletes, chunks):
+                deleted += count
+                logger.info(f"Deleted {deleted} documents from {collection_name}...")
 
         logger.info(f"Deleted {deleted} total documents from {collection_name}")
 
@@ -13,6 +13,7 @@ This script:
 import json
 import logging
 import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
@@ -274,11 +275,12 @@ class PipelineTester:
         # Sort by match score
         jobs_list.sort(key=lambda x: x["match_score"], reverse=True)
 
+        priority_counts = Counter(j["priority"] for j in jobs_list)
         analysis = {
             "total_matched": len(jobs_list),
-            "high_priority": sum(1 for j in jobs_list if j["priority"] == "High"),
-            "medium_priority": sum(1 for j in jobs_list if j["priority"] == "Medium"),
-            "low_priority": sum(1 for j in jobs_list if j["priority"] == "Low"),
+            "high_priority": priority_counts["High"],
+            "medium_priority": priority_counts["Medium"],
+            "low_priority": priority_counts["Low"],
             "avg_match_score": (
                 sum(j["match_score"] for j in jobs_list) / len(jobs_list) if jobs_list else 0
             ),
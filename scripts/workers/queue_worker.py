@@ -29,6 +29,9 @@ from job_finder.storage import FirestoreJobStorage  # noqa: E402
 from job_finder.storage.companies_manager import CompaniesManager  # noqa: E402
 from job_finder.storage.job_sources_manager import JobSourcesManager  # noqa: E402
 
+# Use the libyaml C loader when available (same semantics as yaml.safe_load)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Load environment variables
 load_dotenv()
 
@@ -51,14 +54,13 @@ def signal_handler(signum, frame):
 def load_config() -> dict:
     """Load configuration from file."""
     config_path = os.getenv("CONFIG_PATH", "config/config.yaml")
-    slogger.logger.info(f"Loading configuration from: {config_path}")
+    slogger.logger.info("Loading configuration from: %s", config_path)
 
     if not Path(config_path).exists():
-        slogger.logger.error(f"Configuration file not found: {config_path}")
+        slogger.logger.error("Configuration file not found: %s", config_path)
         sys.exit(1)
 
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    return yaml.load(Path(config_path).read_bytes(), Loader=_YAML_LOADER)  # nosec B506
 
 
 def initialize_components(config: dict) -> Tuple[QueueManager, QueueItemProcessor, ConfigLoader]:
@@ -198,7 +200,7 @@ def run_worker_loop(
                     elif hasattr(item, 'sub_task') and item.sub_task:
                         item_info["sub_task"] = item.sub_task.value if hasattr(item.sub_task, 'value') else str(item.sub_task)
 
-                    slogger.logger.info(f"[QUEUE] Item {i}/{len(items)}: {item_info}")
+                    slogger.logger.info("[QUEUE] Item %d/%d: %s", i, len(items), item_info)
 
                 # Process items
                 for item in items:
@@ -210,7 +212,9 @@ def run_worker_loop(
                         processor.process_item(item)
                         items_processed_total += 1
                     except Exception as e:
-                        slogger.logger.error(f"Error processing item {item.id}: {e}", exc_info=True)
+                        slogger.logger.error(
+                            "Error processing item %s: %s", item.id, e, exc_info=True
+                        )
 
                 # Get updated stats
                 stats = queue_manager.get_queue_stats()
@@ -232,7 +236,7 @@ def run_worker_loop(
             slogger.worker_status("keyboard_interrupt")
             break
         except Exception as e:
-            slogger.logger.error(f"Error in worker loop: {e}", exc_info=True)
+            slogger.logger.error("Error in worker loop: %s", e, exc_info=True)
             slogger.worker_status("error_recovery")
             time.sleep(poll_interval)
 
@@ -261,7 +265,7 @@ def main():
         return 0
 
     except Exception as e:
-        slogger.logger.error(f"Fatal error in queue worker: {e}", exc_info=True)
+        slogger.logger.error("Fatal error in queue worker: %s", e, exc_info=True)
         return 1
 
 
@@ -59,6 +59,7 @@ TIER_C_THRESHOLD = 50  # Points needed for C-tier company
 # Queue/Pipeline
 GRANULAR_PIPELINE_MEMORY_KB = 100  # Average memory per granular pipeline step
 MONOLITHIC_PIPELINE_MEMORY_KB = 585  # Memory for old monolithic pipeline
+QUEUE_ITEM_TTL_DAYS = 7  # Days a successful queue item is kept before Firestore TTL deletes it
 
 # Scraping
 DEFAULT_REQUEST_TIMEOUT = 30  # HTTP request timeout in seconds
@@ -8,6 +8,8 @@ This worker provides:
 - Process status and statistics
 - Same job processing logic as the daemon worker
 """
+import copy
+import functools
 import os
 import signal
 import sys
@@ -34,6 +36,12 @@ from job_finder.storage import FirestoreJobStorage
 from job_finder.storage.companies_manager import CompaniesManager
 from job_finder.storage.job_sources_manager import JobSourcesManager
 
+# Use the libyaml C loader when available (same semantics as yaml.safe_load)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# flask_worker.py -> job_finder/ (parents[0]) -> src/ (parents[1])
+_CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "config.dev.yaml"
+
 # Load environment variables
 load_dotenv()
 
@@ -64,6 +72,7 @@ worker_state = {
     "last_error": None,
     "poll_interval": 60,
     "iteration": 0,
+    "ready": False,
 }
 
 # Global components (initialized in main)
@@ -75,11 +84,23 @@ worker_thread: Optional[threading.Thread] = None
 app = Flask(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file; cached per (path, mtime, size)."""
+    return yaml.load(Path(config_path).read_bytes(), Loader=_YAML_LOADER)  # nosec B506
+
+
 def load_config() -> Dict[str, Any]:
-    """Load configuration from YAML file."""
-    config_path = Path(__file__).parent.parent / "config" / "config.dev.yaml"
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    """
+    Load configuration from YAML file.
+
+    The parsed file is memoized by path, mtime and size, so repeated calls
+    only stat the file and re-parse only when it has changed.
+    """
+    stat = _CONFIG_PATH.stat()
+    config = _load_config_cached(str(_CONFIG_PATH), stat.st_mtime_ns, stat.st_size)
+    # Callers get their own copy so they can't mutate the cached config
+    return copy.deepcopy(config)
 
 
 def initialize_components(config: Dict[str, Any]) -> tuple:
@@ -128,12 +149,29 @@ def initialize_components(config: Dict[str, Any]) -> tuple:
     return queue_manager, processor, config
 
 
+def warm_up_firestore() -> None:
+    """
+    Force Firestore credential resolution before the worker starts polling.
+
+    The first RPC on a fresh client resolves application default credentials
+    and opens the gRPC channel, which can stall for several hundred ms. Issuing
+    a cheap single-document read here moves that cost out of the first poll.
+    """
+    try:
+        queue_manager.db.collection(queue_manager.collection_name).limit(1).get()
+        slogger.worker_status("firestore_warmed")
+    except Exception as e:
+        # Not fatal - the worker loop will retry on its first poll
+        slogger.logger.warning("Firestore warm-up failed: %s", e)
+
+
 def worker_loop():
     """Main worker loop - runs in background thread."""
     global worker_state, queue_manager, processor  # noqa: F824
 
     slogger.worker_status("started")
     worker_state["running"] = True
+    worker_state["ready"] = False
     worker_state["iteration"] = 0
 
     while not worker_state["shutdown_requested"]:
@@ -143,6 +181,7 @@ def worker_loop():
 
             # Get pending items
             items = queue_manager.get_pending_items()
+            worker_state["ready"] = True
 
             if items:
                 slogger.worker_status(
@@ -160,7 +199,9 @@ def worker_loop():
                         processor.process_item(item)
                         worker_state["items_processed_total"] += 1
                     except Exception as e:
-                        slogger.logger.error(f"Error processing item {item.id}: {e}", exc_info=True)
+                        slogger.logger.error(
+                            "Error processing item %s: %s", item.id, e, exc_info=True
+                        )
                         worker_state["last_error"] = str(e)
 
                 # Get updated stats
@@ -179,7 +220,7 @@ def worker_loop():
             time.sleep(worker_state["poll_interval"])
 
         except Exception as e:
-            slogger.logger.error(f"Error in worker loop: {e}", exc_info=True)
+            slogger.logger.error("Error in worker loop: %s", e, exc_info=True)
             worker_state["last_error"] = str(e)
             slogger.worker_status("error_recovery")
             time.sleep(worker_state["poll_interval"])
@@ -204,6 +245,13 @@ def health():
     )
 
 
+@app.route("/ready")
+def ready():
+    """Readiness check endpoint - 200 only once the first poll has completed."""
+    is_ready = worker_state["running"] and worker_state["ready"]
+    return jsonify({"ready": is_ready}), 200 if is_ready else 503
+
+
 @app.route("/status")
 def status():
     """Detailed status endpoint."""
@@ -303,6 +351,9 @@ def main():
         # Set poll interval from config
         worker_state["poll_interval"] = config.get("queue", {}).get("poll_interval", 60)
 
+        # Warm credentials/channel before reporting as started
+        warm_up_firestore()
+
         # Start worker automatically
         worker_state["start_time"] = time.time()
         worker_thread = threading.Thread(target=worker_loop, daemon=True)
@@ -316,7 +367,7 @@ def main():
         app.run(host=host, port=port, debug=False, use_reloader=False)
 
     except Exception as e:
-        slogger.logger.error(f"Fatal error in Flask worker: {e}", exc_info=True)
+        slogger.logger.error("Fatal error in Flask worker: %s", e, exc_info=True)
         return 1
 
     return 0
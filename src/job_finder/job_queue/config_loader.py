@@ -1,13 +1,217 @@
 """Load queue configuration from Firestore."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence
 
 from job_finder.constants import DEFAULT_STRIKE_THRESHOLD
 from job_finder.storage.firestore_client import FirestoreClient
+from job_finder.utils.cache_dir import get_cache_dir, read_private_json, write_private_json
 
 logger = logging.getLogger(__name__)
 
+# Documents in the config collection, fetched together by prefetch_all()
+CONFIG_DOCUMENTS = (
+    "stop-list",
+    "queue-settings",
+    "ai-settings",
+    "job-filters",
+    "technology-ranks",
+    "scheduler-settings",
+)
+
+# Prefetched config documents are also written to a local JSON file in the
+# per-user cache directory so that a restarted worker on the same host can
+# skip the Firestore read while the file is younger than CONFIG_CACHE_TTL_SECONDS.
+CONFIG_CACHE_TTL_SECONDS = 300
+
+# Marker key for datetimes (e.g. Firestore timestamps) in the local cache file
+_DATETIME_KEY = "__datetime__"
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Return a read-only view of a settings value for sharing from the cache.
+
+    Dicts become MappingProxyType and lists become tuples (recursively), so
+    callers - including concurrent worker threads - can't mutate the cached
+    settings and the same object can be handed out on every call.
+
+    Args:
+        value: Settings value built from a config document
+
+    Returns:
+        Read-only equivalent of value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _to_cache_json(value: Any) -> Any:
+    """
+    Convert config document data to JSON-safe values for the local cache.
+
+    Datetimes are stored as {"__datetime__": isoformat} so _from_cache_json
+    can restore them; any other non-JSON value makes the cache write fail.
+
+    Args:
+        value: Config document data
+
+    Returns:
+        JSON-safe equivalent of value
+    """
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+    if isinstance(value, dict):
+        return {key: _to_cache_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_cache_json(item) for item in value]
+    return value
+
+
+def _from_cache_json(value: Any) -> Any:
+    """
+    Restore config document data written by _to_cache_json.
+
+    Args:
+        value: Data read from the local cache file
+
+    Returns:
+        Data with datetimes restored
+    """
+    if isinstance(value, dict):
+        if value.keys() == {_DATETIME_KEY}:
+            return datetime.fromisoformat(value[_DATETIME_KEY])
+        return {key: _from_cache_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_from_cache_json(item) for item in value]
+    return value
+
+
+# Settings returned when a config document is missing or can't be read.
+# Frozen like cached settings, so the same object is returned every time.
+_DEFAULT_STOP_LIST = _freeze(
+    {"excludedCompanies": [], "excludedKeywords": [], "excludedDomains": []}
+)
+
+_DEFAULT_QUEUE_SETTINGS = _freeze(
+    {"maxRetries": 3, "retryDelaySeconds": 60, "processingTimeout": 300}
+)
+
+_DEFAULT_AI_SETTINGS = _freeze(
+    {
+        "provider": "claude",
+        "model": "claude-3-haiku-20240307",
+        "minMatchScore": 70,
+        "costBudgetDaily": 50.0,
+    }
+)
+
+# Strike-based job filter defaults
+_DEFAULT_JOB_FILTERS = _freeze(
+    {
+        # Meta
+        "enabled": True,
+        "strikeThreshold": DEFAULT_STRIKE_THRESHOLD,
+        # Hard Rejections
+        "hardRejections": {
+            "excludedJobTypes": ["sales", "hr", "recruiter", "support", "customer success"],
+            "excludedSeniority": [
+                "associate",
+                "junior",
+                "intern",
+                "entry-level",
+                "entry level",
+                "co-op",
+            ],
+            "excludedCompanies": [],
+            "excludedKeywords": [
+                "clearance required",
+                "security clearance",
+                "relocation required",
+                "must relocate",
+            ],
+            "minSalaryFloor": 100000,
+            "rejectCommissionOnly": True,
+        },
+        # Remote Policy
+        "remotePolicy": {
+            "allowRemote": True,
+            "allowHybridPortland": True,
+            "allowOnsite": False,
+        },
+        # Strike: Salary
+        "salaryStrike": {"enabled": True, "threshold": 150000, "points": 2},
+        # Strike: Experience
+        "experienceStrike": {"enabled": True, "minPreferred": 6, "points": 1},
+        # Strike: Seniority
+        "seniorityStrikes": {
+            "mid-level": 2,
+            "mid level": 2,
+            "principal": 1,
+            "director": 1,
+            "manager": 1,
+            "engineering manager": 1,
+        },
+        # Strike: Quality
+        "qualityStrikes": {
+            "minDescriptionLength": 200,
+            "shortDescriptionPoints": 1,
+            "buzzwords": ["rockstar", "ninja", "guru", "10x engineer", "code wizard"],
+            "buzzwordPoints": 1,
+        },
+        # Strike: Age
+        "ageStrike": {
+            "enabled": True,
+            "strikeDays": 1,  # > 1 day = strike
+            "rejectDays": 7,  # > 7 days = hard reject
+            "points": 1,
+        },
+    }
+)
+
+_DEFAULT_TECHNOLOGY_RANKS = _freeze(
+    {
+        "technologies": {
+            # Required (must have at least one)
+            "Python": {"rank": "required", "points": 0, "mentions": 0},
+            "TypeScript": {"rank": "required", "points": 0, "mentions": 0},
+            "JavaScript": {"rank": "required", "points": 0, "mentions": 0},
+            "React": {"rank": "required", "points": 0, "mentions": 0},
+            "Angular": {"rank": "required", "points": 0, "mentions": 0},
+            "Node.js": {"rank": "required", "points": 0, "mentions": 0},
+            "GCP": {"rank": "required", "points": 0, "mentions": 0},
+            "Google Cloud": {"rank": "required", "points": 0, "mentions": 0},
+            "Kubernetes": {"rank": "required", "points": 0, "mentions": 0},
+            "Docker": {"rank": "required", "points": 0, "mentions": 0},
+            # OK (neutral)
+            "C++": {"rank": "ok", "points": 0, "mentions": 0},
+            "Go": {"rank": "ok", "points": 0, "mentions": 0},
+            "Rust": {"rank": "ok", "points": 0, "mentions": 0},
+            "PostgreSQL": {"rank": "ok", "points": 0, "mentions": 0},
+            "MySQL": {"rank": "ok", "points": 0, "mentions": 0},
+            "MongoDB": {"rank": "ok", "points": 0, "mentions": 0},
+            "Redis": {"rank": "ok", "points": 0, "mentions": 0},
+            # Strike (prefer to avoid)
+            "Java": {"rank": "strike", "points": 2, "mentions": 0},
+            "PHP": {"rank": "strike", "points": 2, "mentions": 0},
+            "Ruby": {"rank": "strike", "points": 2, "mentions": 0},
+            "Rails": {"rank": "strike", "points": 2, "mentions": 0},
+            "Ruby on Rails": {"rank": "strike", "points": 2, "mentions": 0},
+            "WordPress": {"rank": "strike", "points": 2, "mentions": 0},
+            ".NET": {"rank": "strike", "points": 2, "mentions": 0},
+            "C#": {"rank": "strike", "points": 2, "mentions": 0},
+            "Perl": {"rank": "strike", "points": 2, "mentions": 0},
+        },
+        "strikes": {"missingAllRequired": 1, "perBadTech": 2},
+    }
+)
+
 
 class ConfigLoader:
     """
@@ -30,8 +234,96 @@ class ConfigLoader:
         self.db = FirestoreClient.get_client(database_name, credentials_path)
         self.collection_name = "job-finder-config"
         self._cache: Dict[str, Any] = {}
+        # One cache file per database so staging and production never mix
+        cache_dir = get_cache_dir()
+        self._disk_cache_path = (
+            cache_dir / f"job-finder-config-{database_name}.json" if cache_dir else None
+        )
+        # Raw document data by document id (None = document missing),
+        # filled by prefetch_all() or a fresh disk cache
+        self._documents: Optional[Dict[str, Optional[Dict[str, Any]]]] = self._read_disk_cache()
+
+    def prefetch_all(self) -> None:
+        """
+        Fetch every config document with a single collection stream.
+
+        The config collection only holds a handful of documents, so streaming
+        it whole is one RPC with no document references to build, and a cold
+        cache costs that one RPC no matter how many getters are called.
+        Documents not listed in CONFIG_DOCUMENTS are ignored.
+        """
+        documents: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(CONFIG_DOCUMENTS)
+        for snapshot in self.db.collection(self.collection_name).stream():
+            if snapshot.id in documents:
+                documents[snapshot.id] = snapshot.to_dict()
+
+        self._documents = documents
+        self._write_disk_cache(documents)
+
+    def _read_disk_cache(self) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """
+        Read prefetched config documents from the local cache file.
+
+        Returns:
+            Document data by id, or None if there is no cache directory or the
+            file is missing, older than CONFIG_CACHE_TTL_SECONDS, not private
+            to this user or unreadable
+        """
+        if self._disk_cache_path is None:
+            return None
+
+        try:
+            if time.time() - self._disk_cache_path.stat().st_mtime > CONFIG_CACHE_TTL_SECONDS:
+                return None
+            documents = read_private_json(self._disk_cache_path)
+        except (OSError, ValueError):
+            return None  # Missing, foreign or corrupt cache - fetch from Firestore
 
-    def get_stop_list(self) -> Dict[str, List[str]]:
+        if not isinstance(documents, dict):
+            return None
+
+        try:
+            documents = _from_cache_json(documents)
+        except (TypeError, ValueError):
+            return None  # Malformed timestamp - fetch from Firestore
+
+        logger.info(f"Loaded config documents from local cache: {self._disk_cache_path}")
+        return documents
+
+    def _write_disk_cache(self, documents: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """
+        Atomically write prefetched config documents to the local cache file.
+
+        Datetimes are stored in ISO format and restored on read. Failure to
+        write (e.g. read-only filesystem or a value JSON can't represent) is
+        ignored.
+
+        Args:
+            documents: Document data by id
+        """
+        if self._disk_cache_path is None:
+            return
+
+        try:
+            write_private_json(self._disk_cache_path, _to_cache_json(documents))
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write config cache {self._disk_cache_path}: {e}")
+
+    def _get_document(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get raw config document data, prefetching all documents on first use.
+
+        Args:
+            name: Document id in the config collection
+
+        Returns:
+            Document data, or None if the document doesn't exist
+        """
+        if self._documents is None:
+            self.prefetch_all()
+        return self._documents.get(name)
+
+    def get_stop_list(self) -> Mapping[str, Sequence[str]]:
         """
         Get stop list (excluded companies, keywords, domains).
 
@@ -42,31 +334,30 @@ class ConfigLoader:
             return self._cache["stop_list"]
 
         try:
-            doc = self.db.collection(self.collection_name).document("stop-list").get()
+            data = self._get_document("stop-list")
 
-            if doc.exists:
-                data = doc.to_dict()
+            if data is not None:
                 stop_list = {
                     "excludedCompanies": data.get("excludedCompanies", []),
                     "excludedKeywords": data.get("excludedKeywords", []),
                     "excludedDomains": data.get("excludedDomains", []),
                 }
-                self._cache["stop_list"] = stop_list
+                self._cache["stop_list"] = _freeze(stop_list)
                 logger.info(
                     f"Loaded stop list: {len(stop_list['excludedCompanies'])} companies, "
                     f"{len(stop_list['excludedKeywords'])} keywords, "
                     f"{len(stop_list['excludedDomains'])} domains"
                 )
-                return stop_list
+                return self._cache["stop_list"]
             else:
                 logger.warning("Stop list document not found, using empty lists")
-                return {"excludedCompanies": [], "excludedKeywords": [], "excludedDomains": []}
+                return _DEFAULT_STOP_LIST
 
         except Exception as e:
             logger.error(f"Error loading stop list from Firestore: {e}")
-            return {"excludedCompanies": [], "excludedKeywords": [], "excludedDomains": []}
+            return _DEFAULT_STOP_LIST
 
-    def get_queue_settings(self) -> Dict[str, int]:
+    def get_queue_settings(self) -> Mapping[str, int]:
         """
         Get queue processing settings.
 
@@ -77,27 +368,26 @@ class ConfigLoader:
             return self._cache["queue_settings"]
 
         try:
-            doc = self.db.collection(self.collection_name).document("queue-settings").get()
+            data = self._get_document("queue-settings")
 
-            if doc.exists:
-                data = doc.to_dict()
+            if data is not None:
                 settings = {
                     "maxRetries": data.get("maxRetries", 3),
                     "retryDelaySeconds": data.get("retryDelaySeconds", 60),
                     "processingTimeout": data.get("processingTimeout", 300),
                 }
-                self._cache["queue_settings"] = settings
+                self._cache["queue_settings"] = _freeze(settings)
                 logger.info(f"Loaded queue settings: {settings}")
-                return settings
+                return self._cache["queue_settings"]
             else:
                 logger.warning("Queue settings document not found, using defaults")
-                return {"maxRetries": 3, "retryDelaySeconds": 60, "processingTimeout": 300}
+                return _DEFAULT_QUEUE_SETTINGS
 
         except Exception as e:
             logger.error(f"Error loading queue settings from Firestore: {e}")
-            return {"maxRetries": 3, "retryDelaySeconds": 60, "processingTimeout": 300}
+            return _DEFAULT_QUEUE_SETTINGS
 
-    def get_ai_settings(self) -> Dict[str, Any]:
+    def get_ai_settings(self) -> Mapping[str, Any]:
         """
         Get AI processing settings.
 
@@ -108,38 +398,27 @@ class ConfigLoader:
             return self._cache["ai_settings"]
 
         try:
-            doc = self.db.collection(self.collection_name).document("ai-settings").get()
+            data = self._get_document("ai-settings")
 
-            if doc.exists:
-                data = doc.to_dict()
+            if data is not None:
                 settings = {
                     "provider": data.get("provider", "claude"),
                     "model": data.get("model", "claude-3-haiku-20240307"),
                     "minMatchScore": data.get("minMatchScore", 70),
                     "costBudgetDaily": data.get("costBudgetDaily", 50.0),
                 }
-                self._cache["ai_settings"] = settings
+                self._cache["ai_settings"] = _freeze(settings)
                 logger.info(f"Loaded AI settings: {settings}")
-                return settings
+                return self._cache["ai_settings"]
             else:
                 logger.warning("AI settings document not found, using defaults")
-                return {
-                    "provider": "claude",
-                    "model": "claude-3-haiku-20240307",
-                    "minMatchScore": 70,
-                    "costBudgetDaily": 50.0,
-                }
+                return _DEFAULT_AI_SETTINGS
 
         except Exception as e:
             logger.error(f"Error loading AI settings from Firestore: {e}")
-            return {
-                "provider": "claude",
-                "model": "claude-3-haiku-20240307",
-                "minMatchScore": 70,
-                "costBudgetDaily": 50.0,
-            }
-
-    def get_job_filters(self) -> Dict[str, Any]:
+            return _DEFAULT_AI_SETTINGS
+
+    def get_job_filters(self) -> Mapping[str, Any]:
         """
         Get job filter configuration.
 
@@ -150,10 +429,9 @@ class ConfigLoader:
             return self._cache["job_filters"]
 
         try:
-            doc = self.db.collection(self.collection_name).document("job-filters").get()
+            data = self._get_document("job-filters")
 
-            if doc.exists:
-                data = doc.to_dict()
+            if data is not None:
                 filters = {
                     # Exclusions
                     "excludedCompanies": data.get("excludedCompanies", []),
@@ -181,84 +459,22 @@ class ConfigLoader:
                     # Meta
                     "enabled": data.get("enabled", True),
                 }
-                self._cache["job_filters"] = filters
+                self._cache["job_filters"] = _freeze(filters)
                 logger.info(
                     f"Loaded job filters: enabled={filters['enabled']}, "
                     f"remotePolicy={filters['remotePolicy']}, "
                     f"requiredTech={len(filters['requiredTech'])} items"
                 )
-                return filters
+                return self._cache["job_filters"]
             else:
                 logger.warning("Job filters document not found, using defaults")
-                return self._get_default_job_filters()
+                return _DEFAULT_JOB_FILTERS
 
         except Exception as e:
             logger.error(f"Error loading job filters from Firestore: {e}")
-            return self._get_default_job_filters()
+            return _DEFAULT_JOB_FILTERS
 
-    def _get_default_job_filters(self) -> Dict[str, Any]:
-        """Get default job filter configuration (strike-based system)."""
-        return {
-            # Meta
-            "enabled": True,
-            "strikeThreshold": DEFAULT_STRIKE_THRESHOLD,
-            # Hard Rejections
-            "hardRejections": {
-                "excludedJobTypes": ["sales", "hr", "recruiter", "support", "customer success"],
-                "excludedSeniority": [
-                    "associate",
-                    "junior",
-                    "intern",
-                    "entry-level",
-                    "entry level",
-                    "co-op",
-                ],
-                "excludedCompanies": [],
-                "excludedKeywords": [
-                    "clearance required",
-                    "security clearance",
-                    "relocation required",
-                    "must relocate",
-                ],
-                "minSalaryFloor": 100000,
-                "rejectCommissionOnly": True,
-            },
-            # Remote Policy
-            "remotePolicy": {
-                "allowRemote": True,
-                "allowHybridPortland": True,
-                "allowOnsite": False,
-            },
-            # Strike: Salary
-            "salaryStrike": {"enabled": True, "threshold": 150000, "points": 2},
-            # Strike: Experience
-            "experienceStrike": {"enabled": True, "minPreferred": 6, "points": 1},
-            # Strike: Seniority
-            "seniorityStrikes": {
-                "mid-level": 2,
-                "mid level": 2,
-                "principal": 1,
-                "director": 1,
-                "manager": 1,
-                "engineering manager": 1,
-            },
-            # Strike: Quality
-            "qualityStrikes": {
-                "minDescriptionLength": 200,
-                "shortDescriptionPoints": 1,
-                "buzzwords": ["rockstar", "ninja", "guru", "10x engineer", "code wizard"],
-                "buzzwordPoints": 1,
-            },
-            # Strike: Age
-            "ageStrike": {
-                "enabled": True,
-                "strikeDays": 1,  # > 1 day = strike
-                "rejectDays": 7,  # > 7 days = hard reject
-                "points": 1,
-            },
-        }
-
-    def get_technology_ranks(self) -> Dict[str, Any]:
+    def get_technology_ranks(self) -> Mapping[str, Any]:
         """
         Get technology ranking configuration.
 
@@ -269,65 +485,27 @@ class ConfigLoader:
             return self._cache["technology_ranks"]
 
         try:
-            doc = self.db.collection(self.collection_name).document("technology-ranks").get()
+            data = self._get_document("technology-ranks")
 
-            if doc.exists:
-                data = doc.to_dict()
+            if data is not None:
                 tech_ranks = {
                     "technologies": data.get("technologies", {}),
                     "strikes": data.get("strikes", {"missingAllRequired": 1, "perBadTech": 2}),
                 }
-                self._cache["technology_ranks"] = tech_ranks
+                self._cache["technology_ranks"] = _freeze(tech_ranks)
                 logger.info(
                     f"Loaded technology ranks: {len(tech_ranks['technologies'])} technologies"
                 )
-                return tech_ranks
+                return self._cache["technology_ranks"]
             else:
                 logger.warning("Technology ranks document not found, using defaults")
-                return self._get_default_technology_ranks()
+                return _DEFAULT_TECHNOLOGY_RANKS
 
         except Exception as e:
             logger.error(f"Error loading technology ranks from Firestore: {e}")
-            return self._get_default_technology_ranks()
-
-    def _get_default_technology_ranks(self) -> Dict[str, Any]:
-        """Get default technology ranking configuration."""
-        return {
-            "technologies": {
-                # Required (must have at least one)
-                "Python": {"rank": "required", "points": 0, "mentions": 0},
-                "TypeScript": {"rank": "required", "points": 0, "mentions": 0},
-                "JavaScript": {"rank": "required", "points": 0, "mentions": 0},
-                "React": {"rank": "required", "points": 0, "mentions": 0},
-                "Angular": {"rank": "required", "points": 0, "mentions": 0},
-                "Node.js": {"rank": "required", "points": 0, "mentions": 0},
-                "GCP": {"rank": "required", "points": 0, "mentions": 0},
-                "Google Cloud": {"rank": "required", "points": 0, "mentions": 0},
-                "Kubernetes": {"rank": "required", "points": 0, "mentions": 0},
-                "Docker": {"rank": "required", "points": 0, "mentions": 0},
-                # OK (neutral)
-                "C++": {"rank": "ok", "points": 0, "mentions": 0},
-                "Go": {"rank": "ok", "points": 0, "mentions": 0},
-                "Rust": {"rank": "ok", "points": 0, "mentions": 0},
-                "PostgreSQL": {"rank": "ok", "points": 0, "mentions": 0},
-                "MySQL": {"rank": "ok", "points": 0, "mentions": 0},
-                "MongoDB": {"rank": "ok", "points": 0, "mentions": 0},
-                "Redis": {"rank": "ok", "points": 0, "mentions": 0},
-                # Strike (prefer to avoid)
-                "Java": {"rank": "strike", "points": 2, "mentions": 0},
-                "PHP": {"rank": "strike", "points": 2, "mentions": 0},
-                "Ruby": {"rank": "strike", "points": 2, "mentions": 0},
-                "Rails": {"rank": "strike", "points": 2, "mentions": 0},
-                "Ruby on Rails": {"rank": "strike", "points": 2, "mentions": 0},
-                "WordPress": {"rank": "strike", "points": 2, "mentions": 0},
-                ".NET": {"rank": "strike", "points": 2, "mentions": 0},
-                "C#": {"rank": "strike", "points": 2, "mentions": 0},
-                "Perl": {"rank": "strike", "points": 2, "mentions": 0},
-            },
-            "strikes": {"missingAllRequired": 1, "perBadTech": 2},
-        }
+            return _DEFAULT_TECHNOLOGY_RANKS
 
-    def get_scheduler_settings(self) -> Optional[Dict[str, Any]]:
+    def get_scheduler_settings(self) -> Optional[Mapping[str, Any]]:
         """
         Get scheduler settings for cron-based scraping.
 
@@ -339,10 +517,9 @@ class ConfigLoader:
             return self._cache["scheduler_settings"]
 
         try:
-            doc = self.db.collection(self.collection_name).document("scheduler-settings").get()
+            data = self._get_document("scheduler-settings")
 
-            if doc.exists:
-                data = doc.to_dict()
+            if data is not None:
                 settings = {
                     # Enable/disable scheduler
                     "enabled": data.get("enabled", True),
@@ -360,13 +537,13 @@ class ConfigLoader:
                     "last_updated": data.get("updatedAt"),
                     "updated_by": data.get("updatedBy"),
                 }
-                self._cache["scheduler_settings"] = settings
+                self._cache["scheduler_settings"] = _freeze(settings)
                 logger.info(
                     f"Loaded scheduler settings: enabled={settings['enabled']}, "
                     f"target_matches={settings['target_matches']}, "
                     f"max_sources={settings['max_sources']}"
                 )
-                return settings
+                return self._cache["scheduler_settings"]
             else:
                 logger.error(
                     "Scheduler settings document not found in Firestore. "
@@ -378,7 +555,35 @@ class ConfigLoader:
             logger.error(f"Error loading scheduler settings from Firestore: {e}")
             return None
 
+    def get_all_settings(self) -> Dict[str, Any]:
+        """
+        Get every settings group in one call.
+
+        All groups are served from the same prefetched documents, so a cold
+        cache costs a single Firestore read.
+
+        Returns:
+            Dictionary with stop_list, queue_settings, ai_settings, job_filters,
+            technology_ranks and scheduler_settings (None if not configured)
+        """
+        return {
+            "stop_list": self.get_stop_list(),
+            "queue_settings": self.get_queue_settings(),
+            "ai_settings": self.get_ai_settings(),
+            "job_filters": self.get_job_filters(),
+            "technology_ranks": self.get_technology_ranks(),
+            "scheduler_settings": self.get_scheduler_settings(),
+        }
+
     def refresh_cache(self) -> None:
         """Clear cache to force reload of all settings on next access."""
         self._cache.clear()
+        self._documents = None
+        if self._disk_cache_path is not None:
+            try:
+                self._disk_cache_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove config cache {self._disk_cache_path}: {e}")
         logger.info("Configuration cache cleared")
@@ -1,12 +1,20 @@
 """Firestore-backed queue manager for job processing."""
 
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
 
+from google.api_core.exceptions import FailedPrecondition, NotFound
 from google.cloud import firestore as gcloud_firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
 
+from job_finder.constants import (
+    FIRESTORE_BATCH_WRITE_MAX,
+    FIRESTORE_IN_QUERY_MAX,
+    QUEUE_ITEM_TTL_DAYS,
+)
 from job_finder.exceptions import QueueProcessingError
 from job_finder.job_queue.models import (
     CompanySubTask,
@@ -20,6 +28,38 @@ from job_finder.storage.firestore_client import FirestoreClient
 
 logger = logging.getLogger(__name__)
 
+# Statuses that mean an item is still queued or being worked on
+_ACTIVE_STATUSES = frozenset({QueueStatus.PENDING.value, QueueStatus.PROCESSING.value})
+
+# Final statuses that block re-spawning the same work in a lineage
+_TERMINAL_STATUSES = frozenset(
+    {
+        QueueStatus.FILTERED.value,
+        QueueStatus.SKIPPED.value,
+        QueueStatus.FAILED.value,
+    }
+)
+
+# Statuses that finish processing and get a completed_at timestamp
+_COMPLETED_STATUSES = frozenset(
+    {
+        QueueStatus.SUCCESS,
+        QueueStatus.FAILED,
+        QueueStatus.SKIPPED,
+        QueueStatus.FILTERED,
+    }
+)
+
+# Final statuses whose items are deleted by the Firestore TTL policy on expires_at.
+# Only successful steps expire: a saved job is deduplicated through job-matches,
+# and a step that spawned more work is followed by a later item for the same URL.
+# Filtered/skipped items are intake's only record that a URL was rejected
+# (see ScraperIntake.submit_jobs), and failed items can still be retried.
+_EXPIRING_STATUSES = frozenset({QueueStatus.SUCCESS})
+
+# Fields read by the loop-prevention checks in can_spawn_item
+_LINEAGE_FIELDS = ["status", "pipeline_stage"]
+
 
 class QueueManager:
     """
@@ -41,6 +81,8 @@ class QueueManager:
         """
         self.db = FirestoreClient.get_client(database_name, credentials_path)
         self.collection_name = "job-queue"
+        # Shared reference reused by every query and write
+        self.collection = self.db.collection(self.collection_name)
 
     def add_item(self, item: JobQueueItem) -> str:
         """
@@ -52,19 +94,10 @@ class QueueManager:
         Returns:
             Document ID of added item
         """
-        # Set timestamps
-        now = datetime.now(timezone.utc)
-        item.created_at = now
-        item.updated_at = now
-        item.status = QueueStatus.PENDING
-
-        # Convert to Firestore format
-        data = item.to_firestore()
-        data["created_at"] = gcloud_firestore.SERVER_TIMESTAMP
-        data["updated_at"] = gcloud_firestore.SERVER_TIMESTAMP
+        data = self._new_item_document(item)
 
         try:
-            doc_ref = self.db.collection(self.collection_name).add(data)
+            doc_ref = self.collection.add(data)
             doc_id = doc_ref[1].id
             logger.info(
                 f"Added queue item: {item.type} - {item.url[:50]}... "
@@ -76,6 +109,132 @@ class QueueManager:
             logger.error(f"Error adding queue item: {e}")
             raise
 
+    def add_items(self, items: List[JobQueueItem]) -> List[str]:
+        """
+        Add several items to the queue with batched writes.
+
+        Document IDs are generated client-side (or taken from item.id when the
+        caller already reserved one), so the whole list costs one commit per
+        FIRESTORE_BATCH_WRITE_MAX items instead of one RPC per item.
+
+        Args:
+            items: Queue items to add
+
+        Returns:
+            Document IDs of the items that were added, in order. Items whose
+            write failed are logged and left out.
+        """
+        writes = []
+        for item in items:
+            doc_ref = self.collection.document(item.id) if item.id else self.collection.document()
+            writes.append((doc_ref, self._new_item_document(item)))
+
+        item_ids = self._create_documents(writes)
+
+        if writes:
+            logger.info(f"Added {len(item_ids)} of {len(writes)} queue items")
+
+        return item_ids
+
+    def _create_documents(self, writes: List[tuple]) -> List[str]:
+        """
+        Create (document reference, data) pairs in WriteBatches of at most
+        FIRESTORE_BATCH_WRITE_MAX operations.
+
+        If a batch commit fails, its documents are retried with one create()
+        each, so a single bad write doesn't drop the rest of the batch.
+
+        Args:
+            writes: Document references and the data to create them with
+
+        Returns:
+            IDs of the documents that were created, in order
+        """
+        created: List[str] = []
+
+        for start in range(0, len(writes), FIRESTORE_BATCH_WRITE_MAX):
+            chunk = writes[start : start + FIRESTORE_BATCH_WRITE_MAX]
+            batch = self.db.batch()
+            for doc_ref, data in chunk:
+                batch.create(doc_ref, data)
+
+            try:
+                batch.commit()
+                created.extend(doc_ref.id for doc_ref, _ in chunk)
+                continue
+            except Exception as e:
+                logger.warning(
+                    f"Batch create of {len(chunk)} queue items failed, "
+                    f"retrying individually: {e}"
+                )
+
+            for doc_ref, data in chunk:
+                try:
+                    doc_ref.create(data)
+                    created.append(doc_ref.id)
+                except Exception as e:
+                    logger.error(f"Error adding queue item {doc_ref.id}: {e}")
+
+        return created
+
+    @staticmethod
+    def _new_item_document(item: JobQueueItem) -> Dict[str, Any]:
+        """
+        Mark item as a new pending item and convert it to Firestore format.
+
+        Args:
+            item: Queue item about to be written
+
+        Returns:
+            Document data with server-side created_at/updated_at timestamps
+        """
+        item.status = QueueStatus.PENDING
+
+        # Convert to Firestore format; timestamps come from the server clock
+        data = item.to_firestore()
+        data["created_at"] = gcloud_firestore.SERVER_TIMESTAMP
+        data["updated_at"] = gcloud_firestore.SERVER_TIMESTAMP
+        return data
+
+    def iter_pending_items(self, page_size: int = 50) -> Iterator[JobQueueItem]:
+        """
+        Iterate over pending items in FIFO order (oldest first), one page at a time.
+
+        Pages are fetched lazily with query cursors (start_after the last
+        document of the previous page), so only one page is held in memory and
+        callers can start processing before later pages are read.
+
+        Args:
+            page_size: Number of items fetched per query
+
+        Yields:
+            Pending queue items
+        """
+        last_doc = None
+        while True:
+            try:
+                query = (
+                    self.collection.where(
+                        filter=FieldFilter("status", "==", QueueStatus.PENDING.value)
+                    )
+                    .order_by("created_at")
+                    .limit(page_size)
+                )
+                if last_doc is not None:
+                    query = query.start_after(last_doc)
+
+                docs = list(query.stream())
+                page = [JobQueueItem.from_firestore(doc.id, doc.to_dict()) for doc in docs]
+            except Exception as e:
+                logger.error(f"Error getting pending items: {e}")
+                return
+
+            yield from page
+
+            if len(docs) < page_size:
+                return
+            last_doc = docs[-1]
+
     def get_pending_items(self, limit: int = 10) -> List[JobQueueItem]:
         """
         Get pending items in FIFO order (oldest first).
@@ -86,30 +245,12 @@ class QueueManager:
         Returns:
             List of pending queue items
         """
-        try:
-            query = (
-                self.db.collection(self.collection_name)
-                .where(filter=FieldFilter("status", "==", QueueStatus.PENDING.value))
-                .order_by("created_at")
-                .limit(limit)
-            )
-
-            docs = query.stream()
+        items = list(islice(self.iter_pending_items(page_size=limit), limit))
 
-            items = []
-            for doc in docs:
-                data = doc.to_dict()
-                item = JobQueueItem.from_firestore(doc.id, data)
-                items.append(item)
+        if items:
+            logger.debug(f"Retrieved {len(items)} pending queue items")
 
-            if items:
-                logger.debug(f"Retrieved {len(items)} pending queue items")
-
-            return items
-
-        except Exception as e:
-            logger.error(f"Error getting pending items: {e}")
-            return []
+        return items
 
     def update_status(
         self,
@@ -131,7 +272,40 @@ class QueueManager:
             error_details: Optional detailed error information for debugging
             pipeline_stage: Optional pipeline stage for E2E test monitoring (scrape/filter/analyze/save)
         """
-        update_data = {
+        update_data = self._status_update_data(
+            status, result_message, scraped_data, error_details, pipeline_stage
+        )
+
+        try:
+            self.collection.document(item_id).update(update_data)
+            logger.debug(f"Updated queue item {item_id}: {status.value}")
+
+        except Exception as e:
+            logger.error(f"Error updating queue item {item_id}: {e}")
+            raise
+
+    @staticmethod
+    def _status_update_data(
+        status: QueueStatus,
+        result_message: Optional[str] = None,
+        scraped_data: Optional[dict] = None,
+        error_details: Optional[str] = None,
+        pipeline_stage: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the Firestore update payload for a status change.
+
+        Args:
+            status: New status
+            result_message: Optional message describing result
+            scraped_data: Optional scraped data to store
+            error_details: Optional detailed error information for debugging
+            pipeline_stage: Optional pipeline stage for E2E test monitoring
+
+        Returns:
+            Field updates to apply to the queue item document
+        """
+        update_data: Dict[str, Any] = {
             "status": status.value,
             "updated_at": gcloud_firestore.SERVER_TIMESTAMP,
         }
@@ -153,21 +327,18 @@ class QueueManager:
             update_data["processed_at"] = gcloud_firestore.SERVER_TIMESTAMP
 
         # Set completed_at when finishing (success/failed/skipped/filtered)
-        if status in [
-            QueueStatus.SUCCESS,
-            QueueStatus.FAILED,
-            QueueStatus.SKIPPED,
-            QueueStatus.FILTERED,
-        ]:
+        if status in _COMPLETED_STATUSES:
             update_data["completed_at"] = gcloud_firestore.SERVER_TIMESTAMP
 
-        try:
-            self.db.collection(self.collection_name).document(item_id).update(update_data)
-            logger.debug(f"Updated queue item {item_id}: {status.value}")
+        # Let the TTL policy delete successful items; clear it if an item is requeued
+        if status in _EXPIRING_STATUSES:
+            update_data["expires_at"] = datetime.now(timezone.utc) + timedelta(
+                days=QUEUE_ITEM_TTL_DAYS
+            )
+        elif status in (QueueStatus.PENDING, QueueStatus.PROCESSING):
+            update_data["expires_at"] = gcloud_firestore.DELETE_FIELD
 
-        except Exception as e:
-            logger.error(f"Error updating queue item {item_id}: {e}")
-            raise
+        return update_data
 
     def increment_retry(self, item_id: str) -> None:
         """
@@ -177,7 +348,7 @@ class QueueManager:
             item_id: Queue item document ID
         """
         try:
-            self.db.collection(self.collection_name).document(item_id).update(
+            self.collection.document(item_id).update(
                 {
                     "retry_count": gcloud_firestore.Increment(1),
                     "updated_at": gcloud_firestore.SERVER_TIMESTAMP,
@@ -200,7 +371,7 @@ class QueueManager:
             JobQueueItem or None if not found
         """
         try:
-            doc = self.db.collection(self.collection_name).document(item_id).get()
+            doc = self.collection.document(item_id).get()
 
             if doc.exists:
                 data = doc.to_dict()
@@ -215,6 +386,38 @@ class QueueManager:
             logger.error(f"Error getting queue item {item_id}: {e}")
             return None
 
+    def get_items(self, item_ids: List[str]) -> Dict[str, JobQueueItem]:
+        """
+        Get several queue items by ID with a single batched read.
+
+        Args:
+            item_ids: Queue item document IDs
+
+        Returns:
+            Dictionary mapping document ID to JobQueueItem (missing items are omitted)
+        """
+        if not item_ids:
+            return {}
+
+        unique_ids = list(dict.fromkeys(item_ids))
+        items: Dict[str, JobQueueItem] = {}
+
+        try:
+            refs = [self.collection.document(item_id) for item_id in unique_ids]
+            for doc in self.db.get_all(refs):
+                data = doc.to_dict() if doc.exists else None
+                if data:
+                    items[doc.id] = JobQueueItem.from_firestore(doc.id, data)
+
+        except Exception as e:
+            logger.error(f"Error getting {len(unique_ids)} queue items: {e}")
+            return {}
+
+        if len(items) < len(unique_ids):
+            logger.debug(f"Found {len(items)} of {len(unique_ids)} requested queue items")
+
+        return items
+
     def url_exists_in_queue(self, url: str) -> bool:
         """
         Check if URL already exists in queue (any status).
@@ -227,13 +430,12 @@ class QueueManager:
         """
         try:
             query = (
-                self.db.collection(self.collection_name)
-                .where(filter=FieldFilter("url", "==", url))
+                self.collection.where(filter=FieldFilter("url", "==", url))
                 .limit(1)
+                .select([])  # Existence check only - no field data needed
             )
 
-            docs = list(query.stream())
-            return len(docs) > 0
+            return next(iter(query.stream()), None) is not None
 
         except Exception as e:
             logger.error(f"Error checking URL existence: {e}")
@@ -257,16 +459,19 @@ class QueueManager:
         }
 
         try:
-            # Get all documents
-            docs = self.db.collection(self.collection_name).stream()
+            # One server-side count() per status plus one for the whole collection,
+            # run concurrently so the stats cost a single round trip of latency
+            queries = {
+                status: self.collection.where(filter=FieldFilter("status", "==", status))
+                for status in stats
+                if status != "total"
+            }
+            queries["total"] = self.collection.select([])
 
-            for doc in docs:
-                data = doc.to_dict()
-                status = data.get("status", "unknown")
-                if status in stats:
-                    stats[status] += 1
-                stats["total"] += 1
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                counts = dict(zip(queries, executor.map(self._count_documents, queries.values())))
 
+            stats.update(counts)
             logger.info(f"Queue stats: {stats}")
             return stats
 
@@ -274,6 +479,21 @@ class QueueManager:
             logger.error(f"Error getting queue stats: {e}")
             return stats
 
+    @staticmethod
+    def _count_documents(query) -> int:
+        """
+        Count documents matching a query with a server-side aggregation.
+
+        Args:
+            query: Firestore query or collection reference
+
+        Returns:
+            Number of matching documents
+        """
+        # get() returns one result list per aggregation
+        results = query.count().get()
+        return int(results[0][0].value)
+
     def retry_item(self, item_id: str) -> bool:
         """
         Retry a failed queue item by resetting it to pending status.
@@ -288,17 +508,18 @@ class QueueManager:
             True if item was reset successfully, False otherwise
         """
         try:
-            # First check if item exists
-            item = self.get_item(item_id)
-            if not item:
+            doc_ref = self.collection.document(item_id)
+
+            # Only the status is needed to decide whether the item can be retried
+            snapshot = doc_ref.get(field_paths=["status"])
+            if not snapshot.exists:
                 logger.warning(f"Cannot retry: Queue item {item_id} not found")
                 return False
 
             # Only retry failed items
-            if item.status != QueueStatus.FAILED:
-                logger.warning(
-                    f"Cannot retry item {item_id}: status is {item.status.value}, not failed"
-                )
+            status = (snapshot.to_dict() or {}).get("status")
+            if status != QueueStatus.FAILED.value:
+                logger.warning(f"Cannot retry item {item_id}: status is {status}, not failed")
                 return False
 
             # Reset to pending
@@ -310,10 +531,16 @@ class QueueManager:
                 "error_details": gcloud_firestore.DELETE_FIELD,
             }
 
-            self.db.collection(self.collection_name).document(item_id).update(update_data)
+            # Precondition: the write fails if the item changed since it was read
+            write_option = self.db.write_option(last_update_time=snapshot.update_time)
+            doc_ref.update(update_data, option=write_option)
             logger.info(f"Reset queue item {item_id} to pending for retry")
             return True
 
+        except FailedPrecondition:
+            logger.warning(f"Cannot retry item {item_id}: it was modified while being reset")
+            return False
+
         except Exception as e:
             logger.error(f"Error retrying queue item {item_id}: {e}")
             return False
@@ -329,18 +556,15 @@ class QueueManager:
             True if item was deleted successfully, False otherwise
         """
         try:
-            # Check if item exists first
-            item = self.get_item(item_id)
-            if not item:
-                logger.warning(f"Cannot delete: Queue item {item_id} not found")
-                return False
-
-            # Delete the document
-            self.db.collection(self.collection_name).document(item_id).delete()
-            status_str = item.status.value if isinstance(item.status, QueueStatus) else item.status
-            logger.info(f"Deleted queue item {item_id} (was {status_str})")
+            # Precondition makes the delete fail with NotFound instead of a separate read
+            self.collection.document(item_id).delete(option=self.db.write_option(exists=True))
+            logger.info(f"Deleted queue item {item_id}")
             return True
 
+        except NotFound:
+            logger.warning(f"Cannot delete: Queue item {item_id} not found")
+            return False
+
         except Exception as e:
             logger.error(f"Error deleting queue item {item_id}: {e}")
             return False
@@ -353,17 +577,14 @@ class QueueManager:
             True if a pending SCRAPE exists, False otherwise
         """
         try:
-            from job_finder.job_queue.models import QueueItemType
-
             query = (
-                self.db.collection(self.collection_name)
-                .where(filter=FieldFilter("type", "==", QueueItemType.SCRAPE.value))
+                self.collection.where(filter=FieldFilter("type", "==", QueueItemType.SCRAPE.value))
                 .where(filter=FieldFilter("status", "==", QueueStatus.PENDING.value))
                 .limit(1)
+                .select([])  # Existence check only - no field data needed
             )
 
-            docs = list(query.stream())
-            return len(docs) > 0
+            return next(iter(query.stream()), None) is not None
 
         except Exception as e:
             logger.error(f"Error checking for pending scrape: {e}")
@@ -427,47 +648,133 @@ class QueueManager:
         Returns:
             Document ID of spawned item, or None if blocked
         """
+        new_item_data = self._next_step_item_data(
+            current_item, next_sub_task, pipeline_state, is_company
+        )
+
+        doc_id = self.spawn_item_safely(current_item, new_item_data)
+        if doc_id:
+            self._log_next_step(current_item, next_sub_task, is_company)
+        return doc_id
+
+    def complete_and_spawn(
+        self,
+        current_item: JobQueueItem,
+        next_sub_task: Optional[JobSubTask] = None,
+        pipeline_state: Optional[Dict[str, Any]] = None,
+        result_message: Optional[str] = None,
+        is_company: bool = False,
+    ) -> Optional[str]:
+        """
+        Mark the current pipeline step SUCCESS and spawn the next step in one write.
+
+        Equivalent to update_status(SUCCESS) followed by spawn_next_pipeline_step(),
+        but the status update and the child create are committed in a single
+        WriteBatch. If loop prevention blocks the spawn, only the status update
+        is written.
+
+        Args:
+            current_item: Current item that just completed
+            next_sub_task: Next pipeline step to create
+            pipeline_state: Updated state to pass to next step
+            result_message: Optional message describing result
+            is_company: If True, treat as company pipeline
+
+        Returns:
+            Document ID of spawned item, or None if blocked
+        """
+        new_item_data = self._next_step_item_data(
+            current_item, next_sub_task, pipeline_state, is_company
+        )
+        new_item = self._prepare_spawn(current_item, new_item_data, current_completed=True)
+
+        if new_item is None:
+            self.update_status(current_item.id, QueueStatus.SUCCESS, result_message)
+            return None
+
+        new_ref = self.collection.document()
+
+        try:
+            batch = self.db.batch()
+            batch.update(
+                self.collection.document(current_item.id),
+                self._status_update_data(QueueStatus.SUCCESS, result_message),
+            )
+            batch.create(new_ref, self._new_item_document(new_item))
+            batch.commit()
+
+        except Exception as e:
+            logger.error(f"Error completing queue item {current_item.id}: {e}")
+            raise
+
+        logger.debug(f"Updated queue item {current_item.id}: {QueueStatus.SUCCESS.value}")
+        logger.info(
+            f"Spawned item {new_ref.id} (depth: {new_item.spawn_depth}, "
+            f"tracking_id: {new_item.tracking_id}, "
+            f"chain length: {len(new_item.ancestry_chain)})"
+        )
+        self._log_next_step(current_item, next_sub_task, is_company)
+
+        return new_ref.id
+
+    @staticmethod
+    def _next_step_item_data(
+        current_item: JobQueueItem,
+        next_sub_task: Optional[JobSubTask],
+        pipeline_state: Optional[Dict[str, Any]],
+        is_company: bool,
+    ) -> Dict[str, Any]:
+        """
+        Build the data for the next pipeline step of current_item.
+
+        Args:
+            current_item: Current item that just completed
+            next_sub_task: Next pipeline step to create
+            pipeline_state: Updated state to pass to next step
+            is_company: If True, treat as company pipeline
+
+        Returns:
+            New item data for _prepare_spawn()
+
+        Raises:
+            QueueProcessingError: If next_sub_task is not a CompanySubTask for companies
+        """
+        new_item_data = {
+            "url": current_item.url,
+            "company_name": current_item.company_name,
+            "company_id": current_item.company_id,
+            "source": current_item.source,
+            "pipeline_state": pipeline_state,
+        }
+
         if is_company:
-            # Company pipeline
             if not isinstance(next_sub_task, CompanySubTask):
                 raise QueueProcessingError(
                     "next_sub_task must be CompanySubTask for company pipelines"
                 )
+            new_item_data["type"] = QueueItemType.COMPANY
+            new_item_data["company_sub_task"] = next_sub_task
+        else:
+            new_item_data["type"] = QueueItemType.JOB
+            new_item_data["sub_task"] = next_sub_task
 
-            new_item_data = {
-                "type": QueueItemType.COMPANY,
-                "url": current_item.url,
-                "company_name": current_item.company_name,
-                "company_id": current_item.company_id,
-                "source": current_item.source,
-                "company_sub_task": next_sub_task,
-                "pipeline_state": pipeline_state,
-            }
+        return new_item_data
 
-            doc_id = self.spawn_item_safely(current_item, new_item_data)
-            if doc_id:
-                logger.info(
-                    f"Created company pipeline item: {next_sub_task.value} for {current_item.company_name}"
-                )
-            return doc_id
+    @staticmethod
+    def _log_next_step(
+        current_item: JobQueueItem,
+        next_sub_task: Optional[JobSubTask],
+        is_company: bool,
+    ) -> None:
+        """Log creation of the next pipeline step."""
+        if is_company:
+            logger.info(
+                f"Created company pipeline item: {next_sub_task.value} for {current_item.company_name}"
+            )
         else:
-            # Job pipeline
-            new_item_data = {
-                "type": QueueItemType.JOB,
-                "url": current_item.url,
-                "company_name": current_item.company_name,
-                "company_id": current_item.company_id,
-                "source": current_item.source,
-                "sub_task": next_sub_task,
-                "pipeline_state": pipeline_state,
-            }
-
-            doc_id = self.spawn_item_safely(current_item, new_item_data)
-            if doc_id:
-                logger.info(
-                    f"Created job pipeline item: {next_sub_task.value if next_sub_task else 'next'} for {current_item.url[:50]}..."
-                )
-            return doc_id
+            logger.info(
+                f"Created job pipeline item: {next_sub_task.value if next_sub_task else 'next'} for {current_item.url[:50]}..."
+            )
 
     def get_items_by_tracking_id(
         self,
@@ -487,27 +794,56 @@ class QueueManager:
             List of queue items with matching tracking_id
         """
         try:
-            query = self.db.collection(self.collection_name).where(
-                filter=FieldFilter("tracking_id", "==", tracking_id)
-            )
+            query = self.collection.where(filter=FieldFilter("tracking_id", "==", tracking_id))
 
-            docs = query.stream()
-            items = []
-
-            for doc in docs:
-                data = doc.to_dict()
-                item = JobQueueItem.from_firestore(doc.id, data)
-
-                # Filter by status if specified
-                if status_filter is None or item.status in status_filter:
-                    items.append(item)
+            if status_filter is None:
+                queries = [query]
+            else:
+                # Filter by status on the server, within the 'in' operator's value limit
+                statuses = [QueueStatus(status).value for status in status_filter]
+                queries = [
+                    query.where(
+                        filter=FieldFilter("status", "in", statuses[i : i + FIRESTORE_IN_QUERY_MAX])
+                    )
+                    for i in range(0, len(statuses), FIRESTORE_IN_QUERY_MAX)
+                ]
 
-            return items
+            return [
+                JobQueueItem.from_firestore(doc.id, doc.to_dict())
+                for status_query in queries
+                for doc in status_query.stream()
+            ]
 
         except Exception as e:
             logger.error(f"Error getting items by tracking_id {tracking_id}: {e}")
             return []
 
+    def _get_lineage_docs_for_url(
+        self,
+        tracking_id: str,
+        url: str,
+        item_type: QueueItemType,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get raw queue documents for a URL and item type within one tracking lineage.
+
+        Args:
+            tracking_id: Tracking ID to scope the query
+            url: URL to match
+            item_type: Type of work to match
+
+        Returns:
+            Document data dicts with only the _LINEAGE_FIELDS fields, keyed by document ID
+        """
+        query = (
+            self.collection.where(filter=FieldFilter("tracking_id", "==", tracking_id))
+            .where(filter=FieldFilter("url", "==", url))
+            .where(filter=FieldFilter("type", "==", item_type.value))
+            # Only the fields the loop-prevention checks read, not scraped/pipeline data
+            .select(_LINEAGE_FIELDS)
+        )
+        return {doc.id: doc.to_dict() or {} for doc in query.stream()}
+
     def has_pending_work_for_url(
         self,
         url: str,
@@ -526,18 +862,8 @@ class QueueManager:
             True if work is pending or processing, False otherwise
         """
         try:
-            # Note: Firestore compound queries require indexes
-            # For now, get all items by tracking_id and filter in-memory
-            items = self.get_items_by_tracking_id(
-                tracking_id,
-                status_filter=[QueueStatus.PENDING, QueueStatus.PROCESSING],
-            )
-
-            for item in items:
-                if item.url == url and item.type == item_type:
-                    return True
-
-            return False
+            docs = self._get_lineage_docs_for_url(tracking_id, url, item_type)
+            return any(data.get("status") in _ACTIVE_STATUSES for data in docs.values())
 
         except Exception as e:
             logger.error(f"Error checking pending work for {url}: {e}")
@@ -548,6 +874,7 @@ class QueueManager:
         current_item: JobQueueItem,
         target_url: str,
         target_type: QueueItemType,
+        current_completed: bool = False,
     ) -> tuple[bool, str]:
         """
         Check if spawning a new item would create a loop.
@@ -558,10 +885,16 @@ class QueueManager:
         3. Duplicate pending work
         4. Already completed successfully
 
+        Checks 3 and 4 share a single query for the target URL and type within
+        the tracking lineage.
+
         Args:
             current_item: Current queue item attempting to spawn
             target_url: URL of item to spawn
             target_type: Type of item to spawn
+            current_completed: If True, current_item is being marked SUCCESS in the
+                same write as the spawn, so its own (still PROCESSING) document is
+                treated as already completed
 
         Returns:
             Tuple of (can_spawn, reason)
@@ -578,8 +911,22 @@ class QueueManager:
         # Check 3 (duplicate pending work) handles actual duplicate prevention
         # Check 4 (terminal states) prevents re-processing completed items
 
+        try:
+            docs = self._get_lineage_docs_for_url(current_item.tracking_id, target_url, target_type)
+        except Exception as e:
+            logger.error(f"Error checking lineage {current_item.tracking_id} for {target_url}: {e}")
+            docs = {}
+
+        if current_completed and current_item.id in docs:
+            docs[current_item.id] = {
+                **docs[current_item.id],
+                "status": QueueStatus.SUCCESS.value,
+            }
+
+        statuses = [data.get("status") for data in docs.values()]
+
         # Check 3: Duplicate pending work
-        if self.has_pending_work_for_url(target_url, target_type, current_item.tracking_id):
+        if any(status in _ACTIVE_STATUSES for status in statuses):
             return (
                 False,
                 f"Duplicate work: {target_type.value} for {target_url} already queued",
@@ -588,59 +935,43 @@ class QueueManager:
         # Check 4: Already reached terminal state
         # Only block if the URL has reached a FINAL state (save/filtered/skipped/failed)
         # Intermediate states (scrape/filter/analyze with SUCCESS) should allow re-spawning
-        terminal_states = [
-            QueueStatus.FILTERED,
-            QueueStatus.SKIPPED,
-            QueueStatus.FAILED,
-        ]
-
-        terminal_items = self.get_items_by_tracking_id(
-            current_item.tracking_id,
-            status_filter=terminal_states,
-        )
-
-        for item in terminal_items:
-            if item.url == target_url and item.type == target_type:
+        for status in statuses:
+            if status in _TERMINAL_STATUSES:
                 return (
                     False,
-                    f"Already in terminal state ({item.status.value}): {target_type.value} for {target_url}",
+                    f"Already in terminal state ({status}): {target_type.value} for {target_url}",
                 )
 
         # Also check for items that completed the SAVE stage (final SUCCESS state)
-        completed_items = self.get_items_by_tracking_id(
-            current_item.tracking_id,
-            status_filter=[QueueStatus.SUCCESS],
-        )
-
-        for item in completed_items:
-            if item.url == target_url and item.type == target_type:
-                # Check if this is the final save stage
-                if hasattr(item, "pipeline_stage") and item.pipeline_stage == "save":
-                    return (
-                        False,
-                        f"Already saved: {target_type.value} for {target_url}",
-                    )
+        for data in docs.values():
+            if (
+                data.get("status") == QueueStatus.SUCCESS.value
+                and data.get("pipeline_stage") == "save"
+            ):
+                return (
+                    False,
+                    f"Already saved: {target_type.value} for {target_url}",
+                )
 
         # All checks passed
         return (True, "OK")
 
-    def spawn_item_safely(
+    def _prepare_spawn(
         self,
         current_item: JobQueueItem,
         new_item_data: dict,
-    ) -> Optional[str]:
+        current_completed: bool = False,
+    ) -> Optional[JobQueueItem]:
         """
-        Spawn a new queue item with loop prevention.
-
-        Automatically inherits tracking_id, ancestry_chain, and spawn_depth from parent.
-        Performs loop prevention checks before spawning.
+        Run loop prevention checks and build a child item inheriting tracking data.
 
         Args:
             current_item: Current item spawning the new one
             new_item_data: Data for new item (must include 'type' and 'url')
+            current_completed: If True, current_item is completed in the same write
 
         Returns:
-            Document ID of spawned item, or None if blocked
+            New queue item (not yet written), or None if blocked
         """
         target_url = new_item_data.get("url", "")
         target_type = new_item_data.get("type")
@@ -653,7 +984,9 @@ class QueueManager:
             target_type = QueueItemType(target_type)
 
         # Check if spawning is allowed
-        can_spawn, reason = self.can_spawn_item(current_item, target_url, target_type)
+        can_spawn, reason = self.can_spawn_item(
+            current_item, target_url, target_type, current_completed=current_completed
+        )
 
         if not can_spawn:
             logger.warning(
@@ -668,7 +1001,29 @@ class QueueManager:
         new_item_data["spawn_depth"] = current_item.spawn_depth + 1
         new_item_data["parent_item_id"] = current_item.id
 
-        new_item = JobQueueItem(**new_item_data)
+        return JobQueueItem(**new_item_data)
+
+    def spawn_item_safely(
+        self,
+        current_item: JobQueueItem,
+        new_item_data: dict,
+    ) -> Optional[str]:
+        """
+        Spawn a new queue item with loop prevention.
+
+        Automatically inherits tracking_id, ancestry_chain, and spawn_depth from parent.
+        Performs loop prevention checks before spawning.
+
+        Args:
+            current_item: Current item spawning the new one
+            new_item_data: Data for new item (must include 'type' and 'url')
+
+        Returns:
+            Document ID of spawned item, or None if blocked
+        """
+        new_item = self._prepare_spawn(current_item, new_item_data)
+        if new_item is None:
+            return None
 
         # Add to queue
         item_id = self.add_item(new_item)
@@ -680,3 +1035,57 @@ class QueueManager:
         )
 
         return item_id
+
+    def spawn_items_safely(
+        self,
+        current_item: JobQueueItem,
+        new_items_data: List[dict],
+    ) -> List[Optional[str]]:
+        """
+        Spawn several queue items from one parent with loop prevention.
+
+        Same checks and inherited tracking data as spawn_item_safely(), but the
+        allowed items are written with batched commits (up to
+        FIRESTORE_BATCH_WRITE_MAX per commit) instead of one add() per item.
+        Repeated url/type pairs within new_items_data are only spawned once.
+
+        Args:
+            current_item: Current item spawning the new ones
+            new_items_data: Data for each new item (each must include 'type' and 'url')
+
+        Returns:
+            Document ID for each entry in new_items_data, or None where blocked or the write failed
+        """
+        item_ids: List[Optional[str]] = []
+        writes = []
+        seen = set()
+
+        for new_item_data in new_items_data:
+            new_item = self._prepare_spawn(current_item, new_item_data)
+            if new_item is not None and (new_item.url, new_item.type) in seen:
+                logger.warning(
+                    f"Blocked spawn to prevent loop: Duplicate work: {new_item.type} for "
+                    f"{new_item.url} already in this batch. Current item: {current_item.id}"
+                )
+                new_item = None
+
+            if new_item is None:
+                item_ids.append(None)
+                continue
+
+            seen.add((new_item.url, new_item.type))
+            doc_ref = self.collection.document()  # ID generated client-side
+            writes.append((doc_ref, self._new_item_document(new_item)))
+            item_ids.append(doc_ref.id)
+
+        created = set(self._create_documents(writes))
+
+        if writes:
+            logger.info(
+                f"Spawned {len(created)} items (depth: {current_item.spawn_depth + 1}, "
+                f"tracking_id: {current_item.tracking_id}, "
+                f"{len(new_items_data) - len(writes)} blocked, "
+                f"{len(writes) - len(created)} failed)"
+            )
+
+        return [item_id if item_id in created else None for item_id in item_ids]
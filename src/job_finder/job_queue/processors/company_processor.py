@@ -125,18 +125,12 @@ class CompanyProcessor(BaseProcessor):
                 "html_content": html_content,
             }
 
-            # Mark this step complete
-            self.queue_manager.update_status(
-                item.id,
-                QueueStatus.SUCCESS,
-                f"Fetched {len(html_content)} pages from company website",
-            )
-
-            # Spawn next pipeline step (EXTRACT)
-            self.queue_manager.spawn_next_pipeline_step(
+            # Mark this step complete and spawn next pipeline step (EXTRACT)
+            self.queue_manager.complete_and_spawn(
                 current_item=item,
                 next_sub_task=CompanySubTask.EXTRACT,
                 pipeline_state=pipeline_state,
+                result_message=f"Fetched {len(html_content)} pages from company website",
                 is_company=True,
             )
 
@@ -189,18 +183,12 @@ class CompanyProcessor(BaseProcessor):
                 "extracted_info": extracted_info,
             }
 
-            # Mark this step complete
-            self.queue_manager.update_status(
-                item.id,
-                QueueStatus.SUCCESS,
-                "Company information extracted successfully",
-            )
-
-            # Spawn next pipeline step (ANALYZE)
-            self.queue_manager.spawn_next_pipeline_step(
+            # Mark this step complete and spawn next pipeline step (ANALYZE)
+            self.queue_manager.complete_and_spawn(
                 current_item=item,
                 next_sub_task=CompanySubTask.ANALYZE,
                 pipeline_state=pipeline_state,
+                result_message="Company information extracted successfully",
                 is_company=True,
             )
 
@@ -274,24 +262,18 @@ class CompanyProcessor(BaseProcessor):
                 "analysis_result": analysis_result,
             }
 
-            # Mark this step complete
-            self.queue_manager.update_status(
-                item.id,
-                QueueStatus.SUCCESS,
-                f"Company analyzed (Tier {tier}, Score: {priority_score})",
-            )
-
             # If job board found, spawn SOURCE_DISCOVERY
             if job_board_url:
                 _, company_display = format_company_name(company_name)
                 logger.info(f"Found job board for {company_display}: {job_board_url}")
                 # Will be handled in COMPANY_SAVE step
 
-            # Spawn next pipeline step (SAVE)
-            self.queue_manager.spawn_next_pipeline_step(
+            # Mark this step complete and spawn next pipeline step (SAVE)
+            self.queue_manager.complete_and_spawn(
                 current_item=item,
                 next_sub_task=CompanySubTask.SAVE,
                 pipeline_state=pipeline_state,
+                result_message=f"Company analyzed (Tier {tier}, Score: {priority_score})",
                 is_company=True,
             )
 
@@ -369,10 +369,11 @@ class JobProcessor(BaseProcessor):
             "pipeline_stage": next_stage,
             "status": QueueStatus.PENDING.value,  # Requeue for processing
             "updated_at": gcloud_firestore.SERVER_TIMESTAMP,
+            "expires_at": gcloud_firestore.DELETE_FIELD,  # Set when the stage completed
         }
 
         try:
-            doc_ref = self.queue_manager.db.collection("job-queue").document(current_item.id)
+            doc_ref = self.queue_manager.collection.document(current_item.id)
             doc_ref.update(update_data)
 
             logger.info(
@@ -427,18 +428,12 @@ class JobProcessor(BaseProcessor):
                 "scrape_method": source.get("name") if source else "generic",
             }
 
-            # Mark this step complete
-            self.queue_manager.update_status(
-                item.id,
-                QueueStatus.SUCCESS,
-                "Job data scraped successfully",
-            )
-
-            # Spawn next pipeline step (FILTER)
-            self.queue_manager.spawn_next_pipeline_step(
+            # Mark this step complete and spawn next pipeline step (FILTER)
+            self.queue_manager.complete_and_spawn(
                 current_item=item,
                 next_sub_task=JobSubTask.FILTER,
                 pipeline_state=pipeline_state,
+                result_message="Job data scraped successfully",
             )
 
             logger.info(
@@ -495,18 +490,12 @@ class JobProcessor(BaseProcessor):
                 "filter_result": filter_result.to_dict(),
             }
 
-            # Mark this step complete
-            self.queue_manager.update_status(
-                item.id,
-                QueueStatus.SUCCESS,
-                "Passed filtering",
-            )
-
-            # Spawn next pipeline step (ANALYZE)
-            self.queue_manager.spawn_next_pipeline_step(
+            # Mark this step complete and spawn next pipeline step (ANALYZE)
+            self.queue_manager.complete_and_spawn(
                 current_item=item,
                 next_sub_task=JobSubTask.ANALYZE,
                 pipeline_state=pipeline_state,
+                result_message="Passed filtering",
             )
 
             logger.info(f"JOB_FILTER complete: Passed with {filter_result.total_strikes} strikes")
@@ -622,18 +611,12 @@ class JobProcessor(BaseProcessor):
                 "match_result": result.to_dict(),
             }
 
-            # Mark this step complete
-            self.queue_manager.update_status(
-                item.id,
-                QueueStatus.SUCCESS,
-                f"AI analysis complete (score: {result.match_score})",
-            )
-
-            # Spawn next pipeline step (SAVE)
-            self.queue_manager.spawn_next_pipeline_step(
+            # Mark this step complete and spawn next pipeline step (SAVE)
+            self.queue_manager.complete_and_spawn(
                 current_item=item,
                 next_sub_task=JobSubTask.SAVE,
                 pipeline_state=pipeline_state,
+                result_message=f"AI analysis complete (score: {result.match_score})",
             )
 
             logger.info(
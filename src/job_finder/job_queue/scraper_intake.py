@@ -5,7 +5,7 @@ import uuid
 from typing import Any, Dict, List, Optional
 
 from job_finder.job_queue.manager import QueueManager
-from job_finder.job_queue.models import JobQueueItem, QueueItemType, QueueSource
+from job_finder.job_queue.models import CompanySubTask, JobQueueItem, QueueItemType, QueueSource
 from job_finder.utils.url_utils import normalize_url
 
 logger = logging.getLogger(__name__)
@@ -56,6 +56,8 @@ class ScraperIntake:
         """
         added_count = 0
         skipped_count = 0
+        queue_items: List[JobQueueItem] = []
+        queued_urls = set()
 
         for job in jobs:
             try:
@@ -69,8 +71,10 @@ class ScraperIntake:
                 # Normalize URL for consistent comparison
                 normalized_url = normalize_url(url)
 
-                # Check if URL already in queue
-                if self.queue_manager.url_exists_in_queue(normalized_url):
+                # Check if URL already in queue (or earlier in this submission)
+                if normalized_url in queued_urls or self.queue_manager.url_exists_in_queue(
+                    normalized_url
+                ):
                     skipped_count += 1
                     logger.debug(f"Job already in queue: {normalized_url}")
                     continue
@@ -85,9 +89,14 @@ class ScraperIntake:
                 # Generate tracking_id for this root job (all spawned items will inherit it)
                 tracking_id = str(uuid.uuid4())
 
+                # Reserve the document ID client-side so the root can list itself as
+                # the first entry in its ancestry chain in the same write
+                doc_id = self.queue_manager.collection.document().id
+
                 # Note: State-driven processor will determine next step based on pipeline_state
                 # If scraped_data provided, it will skip scraping and go to filtering
                 queue_item = JobQueueItem(
+                    id=doc_id,
                     type=QueueItemType.JOB,
                     url=normalized_url,
                     company_name=job.get("company", ""),
@@ -97,23 +106,23 @@ class ScraperIntake:
                         job if len(job) > 2 else None
                     ),  # Include full job data if available
                     tracking_id=tracking_id,  # Root tracking ID
-                    ancestry_chain=[],  # Root has no ancestors
+                    ancestry_chain=[doc_id],  # Root is the first item in its own chain
                     spawn_depth=0,  # Root starts at depth 0
                 )
-
-                # Add to queue
-                doc_id = self.queue_manager.add_item(queue_item)
-                # Set tracking_id as first item in ancestry chain
-                queue_item.ancestry_chain = [doc_id]
-                self.queue_manager.db.collection("job-queue").document(doc_id).update(
-                    {"ancestry_chain": [doc_id]}
-                )
-                added_count += 1
+                queue_items.append(queue_item)
+                queued_urls.add(normalized_url)
 
             except Exception as e:
-                logger.error(f"Error adding job to queue: {e}")
+                logger.error(f"Error preparing job for queue: {e}")
                 continue
 
+        # Add all new jobs with batched writes
+        if queue_items:
+            try:
+                added_count = len(self.queue_manager.add_items(queue_items))
+            except Exception as e:
+                logger.error(f"Error adding jobs to queue: {e}")
+
         logger.info(
             f"Submitted {added_count} jobs to queue from {source} "
             f"({skipped_count} skipped as duplicates)"
@@ -163,9 +172,6 @@ class ScraperIntake:
                     )
                     return None
 
-            # Import CompanySubTask
-            from job_finder.job_queue.models import CompanySubTask
-
             # Generate tracking_id for this root company (all spawned items will inherit it)
             tracking_id = str(uuid.uuid4())
 
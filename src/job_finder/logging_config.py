@@ -1,18 +1,61 @@
 """Logging configuration with Google Cloud Logging JSON output."""
 
+import functools
 import json
 import logging
 import os
+import queue
 import sys
-import yaml
-from datetime import datetime
+import threading
+import time
+import unicodedata
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-
+from typing import Any, Dict, List, Optional, Tuple
+
+from job_finder.utils.cache_dir import get_cache_dir, read_private_json, write_private_json
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize a log entry with orjson (C-accelerated)."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_dumps = json.dumps
+
+
+# Project root, resolved once at import.
+# File is at: .../job-finder-worker/src/job_finder/logging_config.py
+# Traversal: logging_config.py -> job_finder/ (parents[0]) -> src/ (parents[1])
+# -> job-finder-worker/ (parents[2])
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_CONFIG_PATH = _PROJECT_ROOT / "config" / "logging.yaml"
+_DEFAULT_LOG_PATH = _PROJECT_ROOT / "logs" / "worker.log"
+
+# Defaults for config/logging.yaml, merged under whatever the file provides
+_LOGGING_CONFIG_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "console": {
+        "max_company_name_length": 80,
+        "max_job_title_length": 60,
+        "max_url_length": 50,
+    },
+    "structured": {
+        "include_display_fields": True,
+        "preserve_full_values": True,
+    },
+}
 
 # Global configuration cache
 _logging_config: Optional[Dict] = None
 
+# Suffix appended to truncated display names
+_ELLIPSIS = "..."
+_ELLIPSIS_LENGTH = len(_ELLIPSIS)
+
+# console.max_company_name_length, resolved from config on first use
+_max_company_name_length: Optional[int] = None
+
 # Error message for missing ENVIRONMENT variable
 ENVIRONMENT_REQUIRED_ERROR = (
     "ENVIRONMENT variable is required but not set. "
@@ -20,6 +63,102 @@ ENVIRONMENT_REQUIRED_ERROR = (
     "This prevents accidental production deployments."
 )
 
+# ENVIRONMENT value, read from os.environ on first use (see _get_environment)
+_environment: Optional[str] = None
+
+# Cloud Logging background transport tuning
+CLOUD_LOGGING_BATCH_SIZE = 100  # Entries per API call
+CLOUD_LOGGING_GRACE_PERIOD = 5.0  # Seconds to drain pending entries at exit
+CLOUD_LOGGING_MAX_LATENCY = 1.0  # Seconds to wait for a batch to fill
+
+# Labels attached to every Cloud Logging entry (plus "environment")
+CLOUD_LOGGING_LABELS = {"service": "job-finder", "version": "1.0.0"}
+
+# google.cloud.logging.Client, created on the first setup_logging call that
+# enables Cloud Logging (construction probes the metadata server)
+_cloud_logging_client: Optional[Any] = None
+
+# (settings, handlers) installed by the last setup_logging call
+_installed_handlers: Optional[Tuple[Tuple[Any, ...], list]] = None
+
+# Map Python log levels to Cloud Logging severity, indexed by levelno // 10
+# (NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL+). Custom levels round down
+# to the standard level below them.
+_SEVERITY_BY_DECADE = ("INFO", "DEBUG", "INFO", "WARNING", "ERROR", "ERROR")
+_MAX_SEVERITY_INDEX = len(_SEVERITY_BY_DECADE) - 1
+
+
+def _get_environment() -> str:
+    """
+    Get the ENVIRONMENT name, reading os.environ only once per process.
+
+    The value is read lazily (not at import) so that load_dotenv() calls made
+    after importing this module are still honoured. Once read it is cached,
+    so every StructuredLogger and setup_logging call sees the same value.
+
+    Returns:
+        Environment name (staging, production, development)
+
+    Raises:
+        ValueError: If ENVIRONMENT variable is not set
+    """
+    global _environment
+
+    if _environment is None:
+        environment = os.environ.get("ENVIRONMENT")
+        if not environment:
+            raise ValueError(ENVIRONMENT_REQUIRED_ERROR)
+        _environment = environment
+
+    return _environment
+
+
+def _read_yaml_with_json_cache(config_path: Path) -> Any:
+    """
+    Read a YAML file, preferring a JSON cache when it matches the file.
+
+    The cache lives in the per-user cache directory (see get_cache_dir) and
+    records the YAML file's path, st_mtime_ns and st_size; it is only used
+    when all three still match exactly. JSON parsing is much faster than
+    PyYAML, so warm starts skip YAML entirely. A stale or missing cache is
+    rewritten atomically; failure to write it is ignored.
+
+    Args:
+        config_path: Path to the YAML file.
+
+    Returns:
+        Parsed YAML content.
+    """
+    cache_dir = get_cache_dir()
+    cache_path = cache_dir / f"{config_path.name}.cache.json" if cache_dir else None
+
+    st = config_path.stat()
+    source = {"path": str(config_path), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+    if cache_path is not None:
+        try:
+            cached = read_private_json(cache_path)
+            if isinstance(cached, dict) and cached.get("source") == source:
+                return cached.get("data")
+        except (OSError, ValueError):
+            pass  # Missing, foreign or corrupt cache - fall back to YAML
+
+    # Deferred so warm starts never pay for importing PyYAML
+    import yaml
+
+    # Prefer the libyaml C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # Hand libyaml the raw bytes in one buffer rather than a text file object
+    data = yaml.load(config_path.read_bytes(), Loader=loader)  # nosec B506 - safe loader
+
+    if cache_path is not None:
+        try:
+            write_private_json(cache_path, {"source": source, "data": data})
+        except (OSError, TypeError, ValueError):
+            pass  # Cache is an optimization only
+
+    return data
+
 
 def _load_logging_config() -> Dict:
     """
@@ -34,33 +173,37 @@ def _load_logging_config() -> Dict:
         return _logging_config
 
     # Try to load from config file
-    config_path = Path(__file__).parent.parent.parent / "config" / "logging.yaml"
+    config_path = _CONFIG_PATH
+    loaded: Dict = {}
 
     if config_path.exists():
         try:
-            with open(config_path, "r") as f:
-                _logging_config = yaml.safe_load(f) or {}
+            loaded = _read_yaml_with_json_cache(config_path) or {}
         except Exception as e:
             print(f"⚠️  Failed to load logging config from {config_path}: {e}", file=sys.stderr)
-            _logging_config = {}
-    else:
-        _logging_config = {}
-
-    # Apply defaults if keys are missing
-    if "console" not in _logging_config:
-        _logging_config["console"] = {}
-    if "structured" not in _logging_config:
-        _logging_config["structured"] = {}
 
-    _logging_config["console"].setdefault("max_company_name_length", 80)
-    _logging_config["console"].setdefault("max_job_title_length", 60)
-    _logging_config["console"].setdefault("max_url_length", 50)
-    _logging_config["structured"].setdefault("include_display_fields", True)
-    _logging_config["structured"].setdefault("preserve_full_values", True)
+    # Apply defaults for missing keys (file values win)
+    _logging_config = {
+        **loaded,
+        "console": {**_LOGGING_CONFIG_DEFAULTS["console"], **(loaded.get("console") or {})},
+        "structured": {
+            **_LOGGING_CONFIG_DEFAULTS["structured"],
+            **(loaded.get("structured") or {}),
+        },
+    }
 
     return _logging_config
 
 
+def _resolve_max_company_name_length() -> int:
+    """Read console.max_company_name_length from config and cache it."""
+    global _max_company_name_length
+
+    config = _load_logging_config()
+    _max_company_name_length = config["console"]["max_company_name_length"]
+    return _max_company_name_length
+
+
 def format_company_name(company_name: str, max_length: Optional[int] = None) -> Tuple[str, str]:
     """
     Format a company name for logging with both full and display versions.
@@ -78,18 +221,38 @@ def format_company_name(company_name: str, max_length: Optional[int] = None) ->
     full_name = company_name.strip()
 
     if max_length is None:
-        config = _load_logging_config()
-        max_length = config["console"]["max_company_name_length"]
+        max_length = _max_company_name_length
+        if max_length is None:
+            max_length = _resolve_max_company_name_length()
 
-    if max_length <= 0 or len(full_name) <= max_length:
+    # Common case first: short names are returned as-is (same object twice)
+    if len(full_name) <= max_length or max_length <= 0:
         return full_name, full_name
 
-    if max_length <= 3:
-        display_name = full_name[:max_length]
-    else:
-        display_name = full_name[: max_length - 3] + "..."
+    if max_length <= _ELLIPSIS_LENGTH:
+        return full_name, full_name[: _safe_cut(full_name, max_length)]
 
-    return full_name, display_name
+    cut = _safe_cut(full_name, max_length - _ELLIPSIS_LENGTH)
+    return full_name, f"{full_name[:cut]}{_ELLIPSIS}"
+
+
+def _safe_cut(text: str, index: int) -> int:
+    """
+    Move a slice index back so it doesn't split a combining mark from its base.
+
+    Args:
+        text: String being truncated
+        index: Proposed end index for ``text[:index]``
+
+    Returns:
+        End index that keeps combining marks (category M*) with their base
+        character. ASCII strings are returned unchanged.
+    """
+    if text.isascii():
+        return index
+    while index > 0 and unicodedata.category(text[index])[0] == "M":
+        index -= 1
+    return index
 
 
 class JSONFormatter(logging.Formatter):
@@ -100,6 +263,10 @@ class JSONFormatter(logging.Formatter):
     from @jsdubzw/job-finder-shared-types.
     """
 
+    # logging.Formatter still provides a __dict__; slots make our own
+    # per-record attribute reads descriptor lookups.
+    __slots__ = ("environment", "_base", "_base_fragment", "_second_prefix")
+
     def __init__(self, environment: str = "development"):
         """
         Initialize JSON formatter.
@@ -109,6 +276,33 @@ class JSONFormatter(logging.Formatter):
         """
         super().__init__()
         self.environment = environment
+        # Fields that never change after init. They are encoded once and
+        # spliced into every entry as a pre-rendered JSON fragment.
+        self._base = {"environment": environment, "service": "worker"}
+        self._base_fragment = _json_dumps(self._base)[1:-1]
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent record
+        self._second_prefix = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format a record timestamp as ISO 8601 UTC with microseconds.
+
+        The "YYYY-MM-DDTHH:MM:SS" prefix is reused for records within the
+        same second, so most records only format the microsecond suffix.
+
+        Args:
+            created: Record creation time (seconds since epoch)
+
+        Returns:
+            Timestamp string such as "2025-01-01T12:00:00.123456Z"
+        """
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            # Single tuple assignment keeps second/prefix consistent across threads
+            self._second_prefix = (second, prefix)
+        return "%s.%06dZ" % (prefix, int((created - second) * 1_000_000))
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -120,28 +314,18 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON string conforming to StructuredLogEntry schema
         """
-        # Map Python log levels to Cloud Logging severity
-        severity_map = {
-            logging.DEBUG: "DEBUG",
-            logging.INFO: "INFO",
-            logging.WARNING: "WARNING",
-            logging.ERROR: "ERROR",
-            logging.CRITICAL: "ERROR",
-        }
-        severity = severity_map.get(record.levelno, "INFO")
-
         # Build structured log entry
         log_entry: Dict[str, Any] = {
-            "severity": severity,
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
-            "environment": self.environment,
-            "service": "worker",
+            "severity": _SEVERITY_BY_DECADE[min(record.levelno // 10, _MAX_SEVERITY_INDEX)],
+            "timestamp": self._format_timestamp(record.created),
         }
 
-        # Check if record has structured fields (from StructuredLogger)
-        if hasattr(record, "structured_fields"):
+        # Check if record has structured fields (from StructuredLogger).
+        # __dict__.get avoids hasattr's exception-based miss path.
+        structured_fields = record.__dict__.get("structured_fields")
+        if structured_fields is not None:
             # Merge structured fields from StructuredLogger
-            log_entry.update(record.structured_fields)
+            log_entry.update(structured_fields)
         else:
             # Fallback to simple logging
             log_entry.update(
@@ -161,7 +345,169 @@ class JSONFormatter(logging.Formatter):
                 "stack": self.formatException(record.exc_info) if exc_tb else None,
             }
 
-        return json.dumps(log_entry)
+        if "environment" in log_entry or "service" in log_entry:
+            # Structured fields override the constants - encode the merged entry
+            return _json_dumps({**self._base, **log_entry})
+
+        encoded = _json_dumps(log_entry)
+        return encoded[:-1] + "," + self._base_fragment + "}"
+
+
+class BackgroundFileHandler(logging.Handler):
+    """
+    File handler that formats records on the calling thread and writes them
+    from a single background thread.
+
+    logging.FileHandler holds the handler lock for the whole format + write,
+    so concurrent worker threads serialize on file I/O. Here callers only
+    format and enqueue the line (no handler lock), and the writer thread
+    drains everything queued so far into one write.
+
+    The file is opened with a 64 KiB buffer and is only flushed to the OS when
+    an ERROR (or higher) record is written, when flush()/close() is called, or
+    after the queue has been idle for ``flush_interval`` seconds.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, filename: str, encoding: str = "utf-8", flush_interval: float = 1.0):
+        """
+        Initialize background file handler.
+
+        Args:
+            filename: Path to the log file (opened in append mode)
+            encoding: File encoding
+            flush_interval: Seconds of inactivity before buffered lines are flushed
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self.flush_interval = flush_interval
+        self._stream = open(self.baseFilename, "ab", buffering=self.BUFFER_SIZE)
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._closed = False
+        # Orders enqueues against close(): nothing is enqueued after the stop
+        # sentinel. Separate from the handler lock so emit never waits on I/O.
+        self._closed_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._writer_loop, name="log-file-writer", daemon=True
+        )
+        # logging.shutdown() (registered via atexit) flushes and closes us
+        self._thread.start()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filter and emit without taking the handler lock (emit only enqueues)."""
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv  # Python 3.12+ filters may return a replacement record
+        if rv:
+            self.emit(record)
+        return bool(rv)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format the record and hand it to the writer thread."""
+        try:
+            line = self.format(record) + "\n"
+            with self._closed_lock:
+                if not self._closed:
+                    self._queue.put((line, record.levelno >= logging.ERROR))
+                    return
+            # No writer thread any more - append directly, like FileHandler
+            # reopening its stream after close()
+            self._write_direct([line])
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Block until everything queued before this call has been written."""
+        done = threading.Event()
+        with self._closed_lock:
+            if self._closed or not self._thread.is_alive():
+                return
+            self._queue.put(done)
+        done.wait(timeout=5.0)
+
+    def close(self) -> None:
+        """
+        Drain pending records and stop the writer thread.
+
+        The stop sentinel is enqueued under the same lock emit() and flush()
+        enqueue under, so every record queued before close() reaches the
+        writer and later records are written directly by emit(). The writer
+        thread closes the file itself once it has drained the queue, so a
+        join that times out never closes the file under it.
+        """
+        with self._closed_lock:
+            stopping = not self._closed
+            if stopping:
+                self._closed = True
+                self._queue.put(None)
+        if stopping:
+            self._thread.join(timeout=5.0)
+        super().close()
+
+    def _writer_loop(self) -> None:
+        """Drain the queue, writing all available lines in a single call."""
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        unflushed = False
+        while True:
+            try:
+                # Only wake up on a timer when there is buffered data to flush
+                item = get(timeout=self.flush_interval) if unflushed else get()
+            except queue.Empty:
+                self._write(b"", flush=True)
+                unflushed = False
+                continue
+
+            lines = []
+            events = []
+            urgent = False
+            stop = False
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    lines.append(item[0])
+                    urgent = urgent or item[1]
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+
+            flush = urgent or stop or bool(events)
+            self._write("".join(lines).encode(self.encoding, "backslashreplace"), flush)
+            unflushed = not flush
+            for event in events:
+                event.set()
+            if stop:
+                self._stream.close()
+                return
+
+    def _write_direct(self, lines: List[str]) -> None:
+        """Append lines to the log file without the writer thread (after close)."""
+        self.acquire()
+        try:
+            with open(self.baseFilename, "ab") as stream:
+                stream.write("".join(lines).encode(self.encoding, "backslashreplace"))
+        finally:
+            self.release()
+
+    def _write(self, data: bytes, flush: bool) -> None:
+        """Write (and optionally flush) data to the buffered file."""
+        try:
+            if data:
+                self._stream.write(data)
+            if flush:
+                self._stream.flush()
+        except Exception:
+            # Mirror logging's behaviour: never let log I/O kill the process
+            if logging.raiseExceptions:
+                import traceback
+
+                traceback.print_exc(file=sys.stderr)
 
 
 def setup_logging(
@@ -189,21 +535,29 @@ def setup_logging(
         enable_cloud_logging = True
 
     log_level = os.getenv("LOG_LEVEL", log_level).upper()
+    level = getattr(logging, log_level)
     # Default to centralized log directory
     if log_file is None and "LOG_FILE" not in os.environ:
-        # Calculate path to service logs directory
-        # File is at: .../job-finder-worker/src/job_finder/logging_config.py
-        # Logs are at: .../job-finder-worker/logs/
-        # Traversal: logging_config.py -> job_finder/ (P1) -> src/ (P2) -> job-finder-worker/ (P3) -> logs/
-        centralized_logs = Path(__file__).parent.parent.parent / "logs" / "worker.log"
-        log_file = str(centralized_logs)
+        log_file = str(_DEFAULT_LOG_PATH)
     else:
         log_file = os.getenv("LOG_FILE", log_file)
 
     # REQUIRED: Environment must be explicitly set (staging, production, development)
-    environment = os.getenv("ENVIRONMENT")
-    if not environment:
-        raise ValueError(ENVIRONMENT_REQUIRED_ERROR)
+    environment = _get_environment()
+
+    global _installed_handlers, _cloud_logging_client
+
+    # Called again with the same settings: keep the open file and handlers
+    # rather than closing and reopening them
+    root_logger = logging.getLogger()
+    settings = (log_file, level, enable_cloud_logging, environment)
+    if (
+        _installed_handlers is not None
+        and _installed_handlers[0] == settings
+        and root_logger.handlers == _installed_handlers[1]
+    ):
+        root_logger.setLevel(level)
+        return
 
     # Create logs directory if it doesn't exist
     log_path = Path(log_file)
@@ -213,18 +567,18 @@ def setup_logging(
     json_formatter = JSONFormatter(environment=environment)
 
     # Configure handlers
-    handlers = []
+    handlers: List[logging.Handler] = []
 
     # Console handler (JSON output)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(json_formatter)
-    console_handler.setLevel(getattr(logging, log_level))
+    console_handler.setLevel(level)
     handlers.append(console_handler)
 
-    # File handler (JSON output)
-    file_handler = logging.FileHandler(log_file)
+    # File handler (JSON output, written from a background thread)
+    file_handler = BackgroundFileHandler(log_file)
     file_handler.setFormatter(json_formatter)
-    file_handler.setLevel(getattr(logging, log_level))
+    file_handler.setLevel(level)
     handlers.append(file_handler)
 
     # Set up Cloud Logging if enabled
@@ -232,33 +586,44 @@ def setup_logging(
         try:
             import google.cloud.logging
             from google.cloud.logging.handlers import CloudLoggingHandler
+            from google.cloud.logging.handlers.transports import BackgroundThreadTransport
 
-            # Initialize Cloud Logging client
-            client = google.cloud.logging.Client()
+            # Initialize Cloud Logging client (once per process)
+            if _cloud_logging_client is None:
+                _cloud_logging_client = google.cloud.logging.Client()
+            client = _cloud_logging_client
 
             # Create Cloud Logging handler with environment labels
-            labels = {
-                "environment": environment,
-                "service": "job-finder",
-                "version": "1.0.0",
-            }
-
+            labels = {"environment": environment, **CLOUD_LOGGING_LABELS}
+
+            # Ship entries from a background thread in batches rather than
+            # one API call per record. The transport flushes on exit itself.
+            transport = functools.partial(
+                BackgroundThreadTransport,
+                batch_size=CLOUD_LOGGING_BATCH_SIZE,
+                grace_period=CLOUD_LOGGING_GRACE_PERIOD,
+                max_latency=CLOUD_LOGGING_MAX_LATENCY,
+            )
             cloud_handler = CloudLoggingHandler(
                 client,
                 name="job-finder",
                 labels=labels,
+                transport=transport,
             )
-            cloud_handler.setLevel(getattr(logging, log_level))
+            cloud_handler.setLevel(level)
             # Cloud handler will receive structured fields automatically
             cloud_handler.setFormatter(json_formatter)
             handlers.append(cloud_handler)
 
-            print(f"✅ Google Cloud Logging enabled")
-            print(f"   Project: {client.project}")
-            print(f"   Log name: job-finder")
-            print(f"   Environment: {environment}")
-            print(f"   Log level: {log_level}")
-            print(f"   Labels: {labels}")
+            # One write (and one stdout lock) for the whole banner
+            sys.stdout.write(
+                f"✅ Google Cloud Logging enabled\n"
+                f"   Project: {client.project}\n"
+                f"   Log name: job-finder\n"
+                f"   Environment: {environment}\n"
+                f"   Log level: {log_level}\n"
+                f"   Labels: {labels}\n"
+            )
 
         except ImportError:
             print(
@@ -274,12 +639,12 @@ def setup_logging(
             )
             print("   Falling back to file and console logging only.", file=sys.stderr)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        handlers=handlers,
-        force=True,
-    )
+    # Configure root logger, replacing (and closing) any previous handlers
+    for old_handler in root_logger.handlers:
+        old_handler.close()
+    root_logger.handlers = handlers
+    root_logger.setLevel(level)
+    _installed_handlers = (settings, handlers[:])
 
     # Log startup info
     logger = logging.getLogger(__name__)
@@ -308,6 +673,15 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# StructuredLogger level names -> logging level numbers
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
 class StructuredLogger:
     """
     Helper class for structured logging with JSON output.
@@ -315,6 +689,8 @@ class StructuredLogger:
     Conforms to StructuredLogEntry schema from @jsdubzw/job-finder-shared-types.
     """
 
+    __slots__ = ("logger", "environment")
+
     def __init__(self, logger: logging.Logger):
         """
         Initialize structured logger.
@@ -326,9 +702,7 @@ class StructuredLogger:
             ValueError: If ENVIRONMENT variable is not set
         """
         self.logger = logger
-        self.environment = os.getenv("ENVIRONMENT")
-        if not self.environment:
-            raise ValueError(ENVIRONMENT_REQUIRED_ERROR)
+        self.environment = _get_environment()
 
     def _log(self, level: str, structured_fields: Dict[str, Any]) -> None:
         """
@@ -338,9 +712,19 @@ class StructuredLogger:
             level: Log level (debug, info, warning, error)
             structured_fields: Structured log entry fields
         """
-        # Create log record
-        log_method = getattr(self.logger, level.lower())
+        levelno = _LEVELS[level.lower()]
+        if not self.logger.isEnabledFor(levelno):
+            return
+        self._emit(levelno, structured_fields)
 
+    def _emit(self, levelno: int, structured_fields: Dict[str, Any]) -> None:
+        """
+        Log structured fields at a level the caller has already checked is enabled.
+
+        Args:
+            levelno: Numeric log level
+            structured_fields: Structured log entry fields
+        """
         # Get message for log record (used by some handlers)
         message = structured_fields.get("message", "")
 
@@ -348,7 +732,7 @@ class StructuredLogger:
         extra = {"structured_fields": structured_fields}
 
         # Log with structured fields
-        log_method(message, extra=extra)
+        self.logger.log(levelno, message, extra=extra)
 
     def queue_item_processing(
         self, item_id: str, item_type: str, action: str, details: Optional[Dict] = None
@@ -362,6 +746,9 @@ class StructuredLogger:
             action: Action being performed (processing, completed, failed)
             details: Optional additional details
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         structured_fields = {
             "category": "queue",
             "action": action,
@@ -370,7 +757,7 @@ class StructuredLogger:
             "queueItemType": item_type.lower(),
             "details": details or {},
         }
-        self._log("info", structured_fields)
+        self._emit(logging.INFO, structured_fields)
 
     def pipeline_stage(
         self, item_id: str, stage: str, status: str, details: Optional[Dict] = None
@@ -384,6 +771,16 @@ class StructuredLogger:
             status: Stage status (started, completed, failed, skipped)
             details: Optional additional details
         """
+        # Determine log level based on status
+        levelno = logging.INFO
+        status_lower = status.lower()
+        if status_lower in ("failed", "error"):
+            levelno = logging.ERROR
+        elif status_lower == "skipped":
+            levelno = logging.WARNING
+        if not self.logger.isEnabledFor(levelno):
+            return
+
         structured_fields = {
             "category": "pipeline",
             "action": status,
@@ -392,15 +789,7 @@ class StructuredLogger:
             "pipelineStage": stage.lower(),
             "details": details or {},
         }
-
-        # Determine log level based on status
-        level = "info"
-        if status.lower() in ["failed", "error"]:
-            level = "error"
-        elif status.lower() == "skipped":
-            level = "warning"
-
-        self._log(level, structured_fields)
+        self._emit(levelno, structured_fields)
 
     def scrape_activity(self, source: str, action: str, details: Optional[Dict] = None) -> None:
         """
@@ -411,13 +800,16 @@ class StructuredLogger:
             action: Action being performed
             details: Optional additional details
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         structured_fields = {
             "category": "scrape",
             "action": action,
             "message": f"Scraping {source}",
             "details": {"source": source, **(details or {})},
         }
-        self._log("info", structured_fields)
+        self._emit(logging.INFO, structured_fields)
 
     def company_activity(
         self, company_name: str, action: str, details: Optional[Dict] = None, truncate: bool = True
@@ -431,6 +823,9 @@ class StructuredLogger:
             details: Optional additional details
             truncate: Whether to truncate for display (unused in JSON mode)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         full_name, display_name = format_company_name(company_name)
 
         structured_fields = {
@@ -443,7 +838,7 @@ class StructuredLogger:
                 **(details or {}),
             },
         }
-        self._log("info", structured_fields)
+        self._emit(logging.INFO, structured_fields)
 
     def ai_activity(self, operation: str, status: str, details: Optional[Dict] = None) -> None:
         """
@@ -454,13 +849,16 @@ class StructuredLogger:
             status: Operation status
             details: Optional additional details (model, tokens, cost)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         structured_fields = {
             "category": "ai",
             "action": operation.lower(),
             "message": f"AI {operation} {status}",
             "details": details or {},
         }
-        self._log("info", structured_fields)
+        self._emit(logging.INFO, structured_fields)
 
     def database_activity(
         self, operation: str, collection: str, status: str, details: Optional[Dict] = None
@@ -474,13 +872,16 @@ class StructuredLogger:
             status: Operation status
             details: Optional additional details
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         structured_fields = {
             "category": "database",
             "action": operation.lower(),
             "message": f"Database {operation} on {collection}: {status}",
             "details": {"collection": collection, "status": status, **(details or {})},
         }
-        self._log("info", structured_fields)
+        self._emit(logging.INFO, structured_fields)
 
     def worker_status(self, status: str, details: Optional[Dict] = None) -> None:
         """
@@ -490,13 +891,16 @@ class StructuredLogger:
             status: Worker status (started, stopping, idle, processing)
             details: Optional additional details
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         structured_fields = {
             "category": "worker",
             "action": status.lower(),
             "message": f"Worker {status}",
             "details": details or {},
         }
-        self._log("info", structured_fields)
+        self._emit(logging.INFO, structured_fields)
 
 
 def get_structured_logger(name: str) -> StructuredLogger:
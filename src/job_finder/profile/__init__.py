@@ -1,6 +1,5 @@
 """Profile data management for job matching."""
 
-from job_finder.profile.firestore_loader import FirestoreProfileLoader
 from job_finder.profile.loader import ProfileLoader
 from job_finder.profile.schema import Education, Experience, Preferences, Profile, Project, Skill
 
@@ -14,3 +13,12 @@ __all__ = [
     "ProfileLoader",
     "FirestoreProfileLoader",
 ]
+
+
+def __getattr__(name: str):
+    """Import FirestoreProfileLoader (and google.cloud.firestore) on first access."""
+    if name == "FirestoreProfileLoader":
+        from job_finder.profile.firestore_loader import FirestoreProfileLoader
+
+        return FirestoreProfileLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,10 @@
 """Load profile data from Firestore database."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
 from google.cloud import firestore as gcloud_firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
@@ -12,6 +15,42 @@ from job_finder.storage.firestore_client import FirestoreClient
 
 logger = logging.getLogger(__name__)
 
+# Denormalized per-user profile documents (profiles/{user_id}) that embed
+# experiences and blurbs; see _load_profile_aggregate
+PROFILE_AGGREGATE_COLLECTION = "profiles"
+
+# "Stack: ...", "Technologies: ..." or "Tech Stack: ..." up to end of line.
+# "Tech Stack" is listed first so it isn't also matched as a bare "Stack".
+_STACK_RE = re.compile(r"(?:Tech Stack|Stack|Technologies):\s*([^\n]+)", re.IGNORECASE)
+
+# Comma separator with the surrounding whitespace, so split() yields trimmed items
+_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+def _parse_experience_date(value: Optional[str]) -> Optional[date]:
+    """
+    Parse an experience date string (YYYY-MM-DD, YYYY-MM or YYYY).
+
+    Partial dates resolve to the first day of the month/year.
+
+    Args:
+        value: Date string from Firestore
+
+    Returns:
+        Parsed date, or None if the value is empty or not in a supported format
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        if len(value) == 4:
+            return date(int(value), 1, 1)
+        if len(value) == 7:
+            return date(int(value[:4]), int(value[5:7]), 1)
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
 
 class FirestoreProfileLoader:
     """Loads profile data from Firestore database."""
@@ -47,13 +86,26 @@ class FirestoreProfileLoader:
 
         logger.info(f"Loading profile from Firestore (user_id: {user_id})")
 
-        # Load experience entries
-        experiences = self._load_experiences(user_id)
-        logger.info(f"Loaded {len(experiences)} experience entries")
+        # Prefer the denormalized profiles/{user_id} document (one read)
+        aggregate = self._load_profile_aggregate(user_id) if user_id else None
 
-        # Load experience blurbs (skills/highlights)
-        blurbs = self._load_experience_blurbs(user_id)
-        logger.info(f"Loaded {len(blurbs)} experience blurbs")
+        if aggregate is not None:
+            experiences, blurbs = aggregate
+            blurb_count = len(blurbs)
+        else:
+            # Experience entries and the blurb count are independent queries, so
+            # run them concurrently (the Firestore client is thread-safe and
+            # releases the GIL while waiting on gRPC)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                experiences_future = executor.submit(self._load_experiences, user_id)
+                blurb_count_future = executor.submit(self._count_experience_blurbs, user_id)
+                experiences = experiences_future.result()
+                blurb_count = blurb_count_future.result()
+            # Blurb bodies aren't fetched - nothing below reads them
+            blurbs = []
+
+        logger.info(f"Loaded {len(experiences)} experience entries")
+        logger.info(f"Found {blurb_count} experience blurbs")
 
         # Extract skills from experiences and blurbs
         skills = self._extract_skills(experiences, blurbs)
@@ -85,28 +137,59 @@ class FirestoreProfileLoader:
         )
         return profile
 
+    def _load_profile_aggregate(
+        self, user_id: str
+    ) -> Optional[Tuple[List[Experience], List[Dict[str, Any]]]]:
+        """
+        Load experiences and blurbs from the denormalized profiles/{user_id} document.
+
+        The aggregate document embeds an "experiences" array (entries in the
+        content-items company shape: company, role, startDate, endDate,
+        location, accomplishments, technologies) and a "blurbs" array. Reading
+        it costs a single document read instead of two collection scans.
+
+        Args:
+            user_id: User ID (document id in the profiles collection)
+
+        Returns:
+            Tuple of (experiences, blurbs), or None if the aggregate document
+            doesn't exist or can't be read (callers fall back to the collections)
+        """
+        try:
+            doc = self.db.collection(PROFILE_AGGREGATE_COLLECTION).document(user_id).get()
+        except Exception as e:
+            logger.warning(f"Error loading profile aggregate, using collections: {e}")
+            return None
+
+        if not doc.exists:
+            return None
+
+        data = doc.to_dict() or {}
+        logger.info("Loading from denormalized profile document")
+        build = self._build_content_item_experience
+        built = (
+            build(item, f"{user_id}/experiences[{index}]")
+            for index, item in enumerate(data.get("experiences") or [])
+        )
+        experiences = [exp for exp in built if exp is not None]
+        return experiences, list(data.get("blurbs") or [])
+
     def _load_experiences(self, user_id: Optional[str] = None) -> List[Experience]:
         """Load experience entries from Firestore."""
-        experiences = []
-
         try:
             # Try new schema first (content-items)
             docs = list(self._query_content_items("company", user_id))
 
             if docs:
-                # New schema
+                # New schema (invalid items come back as None and are dropped)
                 logger.info("Loading from new content-items schema")
-                for doc in docs:
-                    experience = self._process_content_item_doc(doc)
-                    if experience:
-                        experiences.append(experience)
+                process_doc = self._process_content_item_doc
+                experiences = [exp for exp in map(process_doc, docs) if exp is not None]
             else:
                 # Fallback to old schema (experience-entries)
                 logger.info("Falling back to old experience-entries schema")
-                docs = self._query_experience_docs(user_id)
-                for doc in docs:
-                    experience = self._process_experience_doc(doc)
-                    experiences.append(experience)
+                process_doc = self._process_experience_doc
+                experiences = list(map(process_doc, self._query_experience_docs(user_id)))
 
         except (RuntimeError, ValueError, AttributeError, KeyError) as e:
             # Firestore query errors, validation errors, or missing data fields
@@ -170,8 +253,21 @@ class FirestoreProfileLoader:
         Returns:
             Experience object or None if invalid
         """
-        data = doc.to_dict()
+        return self._build_content_item_experience(doc.to_dict(), doc.id)
+
+    def _build_content_item_experience(
+        self, data: Dict[str, Any], item_id: str
+    ) -> Optional[Experience]:
+        """
+        Map content-items company data (also used by profile aggregates) to an Experience.
+
+        Args:
+            data: Content item fields
+            item_id: Identifier used in the skip warning
 
+        Returns:
+            Experience object or None if invalid
+        """
         # New schema has: company, role, technologies, accomplishments, etc.
         company = data.get("company", "")
         title = data.get("role", "")
@@ -179,7 +275,7 @@ class FirestoreProfileLoader:
         accomplishments = data.get("accomplishments", [])
 
         if not company or not title:
-            logger.warning(f"Skipping content-item {doc.id}: missing company or role")
+            logger.warning(f"Skipping content-item {item_id}: missing company or role")
             return None
 
         # Build description from accomplishments
@@ -244,63 +340,49 @@ class FirestoreProfileLoader:
         - "Stack: Docker, React, ..."
         - "Technologies: Python, AWS, ..."
         """
-        import re
+        # Every section label ends in a colon; skip the regex for bodies without one
+        if ":" not in body:
+            return []
 
         technologies = []
 
-        # Look for "Stack:" or "Technologies:" sections
-        patterns = [
-            r"Stack:\s*([^\n]+)",
-            r"Technologies:\s*([^\n]+)",
-            r"Tech Stack:\s*([^\n]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, body, re.IGNORECASE)
-            if match:
-                # Extract comma-separated technologies
-                tech_string = match.group(1).strip()
-                # Split by comma and clean up
-                techs = [t.strip() for t in tech_string.split(",")]
-                technologies.extend(techs)
+        # Single pass over the body for every "Stack:"/"Technologies:" section
+        for tech_string in _STACK_RE.findall(body):
+            # Split by comma, trimming whitespace and dropping empty items
+            technologies.extend(t for t in _SPLIT_RE.split(tech_string.strip()) if t)
 
         return technologies
 
-    def _load_experience_blurbs(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Load experience blurbs from Firestore.
+    def _count_experience_blurbs(self, user_id: Optional[str] = None) -> int:
+        """Count experience blurbs in Firestore.
 
         Note: These are content sections (biography, education, etc.) for the
-        portfolio website, not skill data. We keep this for potential summary
-        generation but don't extract skills from it.
+        portfolio website, not skill data, and only their number is used. A
+        server-side count() aggregation returns that number without
+        transferring any blurb documents.
         """
-        blurbs = []
-
         try:
             # Query experience-blurbs collection
             query = self.db.collection("experience-blurbs")
             if user_id:
                 query = query.where(filter=FieldFilter("userId", "==", user_id))
 
-            docs = query.stream()
-
-            for doc in docs:
-                data = doc.to_dict()
-                blurbs.append(data)
+            # get() returns one result list per aggregation
+            results = query.count().get()
+            return int(results[0][0].value)
 
         except (RuntimeError, ValueError, AttributeError) as e:
             # Firestore query errors or data access issues
-            logger.error(f"Error loading experience blurbs (database): {str(e)}")
+            logger.error(f"Error counting experience blurbs (database): {str(e)}")
             raise
         except Exception as e:
             # Unexpected errors - log with traceback and re-raise
             logger.error(
-                f"Unexpected error loading experience blurbs ({type(e).__name__}): {str(e)}",
+                f"Unexpected error counting experience blurbs ({type(e).__name__}): {str(e)}",
                 exc_info=True,
             )
             raise
 
-        return blurbs
-
     def _extract_skills(
         self, experiences: List[Experience], blurbs: List[Dict[str, Any]]
     ) -> List[Skill]:
@@ -377,7 +459,41 @@ class FirestoreProfileLoader:
         return ". ".join(summary_parts) + "."
 
     def _calculate_years_experience(self, experiences: List[Experience]) -> float:
-        """Calculate total years of professional experience."""
-        # This is a simplified calculation
-        # In production, you'd want to parse dates and calculate actual duration
-        return float(len(experiences))
+        """
+        Calculate total years of professional experience.
+
+        Each experience is treated as a date interval (current roles run to
+        today). Overlapping or concurrent roles are merged so they are only
+        counted once. Experiences with an unparseable start date are skipped.
+
+        Args:
+            experiences: List of experiences
+
+        Returns:
+            Total years of experience, rounded to one decimal place
+        """
+        today = date.today()
+        intervals = []
+        for exp in experiences:
+            start = _parse_experience_date(exp.start_date)
+            if start is None:
+                continue
+            end = None if exp.is_current else _parse_experience_date(exp.end_date)
+            end = min(end or today, today)
+            if end > start:
+                intervals.append((start, end))
+
+        intervals.sort()
+        total_days = 0
+        merged_start = merged_end = None
+        for start, end in intervals:
+            if merged_end is None or start > merged_end:
+                if merged_end is not None:
+                    total_days += (merged_end - merged_start).days
+                merged_start, merged_end = start, end
+            elif end > merged_end:
+                merged_end = end
+        if merged_end is not None:
+            total_days += (merged_end - merged_start).days
+
+        return round(total_days / 365.25, 1)
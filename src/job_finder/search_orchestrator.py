@@ -564,7 +564,7 @@ class JobSearchOrchestrator:
         existing_jobs = self.job_storage.batch_check_exists(job_urls)
 
         duplicates_count = sum(1 for exists in existing_jobs.values() if exists)
-        new_jobs_count = sum(1 for exists in existing_jobs.values() if not exists)
+        new_jobs_count = len(existing_jobs) - duplicates_count
 
         if duplicates_count > 0:
             logger.info(f"⏭️  Skipping {duplicates_count} duplicate jobs (already in database)")
@@ -4,6 +4,7 @@ This module provides a singleton FirestoreClient that manages Firestore database
 connections across the application, eliminating duplication of initialization logic.
 """
 
+import json
 import logging
 import os
 from pathlib import Path
@@ -154,9 +155,10 @@ class FirestoreClient:
             raise ConfigurationError(f"Credentials file not found: {creds_path}")
 
         try:
-            # Get project ID from credentials
-            cred = credentials.Certificate(creds_path)
-            project_id = cred.project_id
+            # Get project ID straight from the service account JSON. Building a
+            # credentials.Certificate here would also parse the RSA private key,
+            # which is only needed when Firebase Admin is initialized.
+            project_id = cls._read_project_id(creds_path)
 
             # Create client for specific database
             if database_name == "(default)":
@@ -173,6 +175,28 @@ class FirestoreClient:
                 f"Failed to create Firestore client for {database_name}: {str(e)}"
             ) from e
 
+    @staticmethod
+    def _read_project_id(creds_path: str) -> str:
+        """
+        Read the project ID from a service account JSON file.
+
+        Args:
+            creds_path: Path to service account JSON.
+
+        Returns:
+            The file's project_id.
+
+        Raises:
+            ValueError: If the file has no project_id.
+        """
+        with open(creds_path, "r") as f:
+            project_id = json.load(f).get("project_id")
+
+        if not project_id:
+            raise ValueError(f"No project_id in credentials file: {creds_path}")
+
+        return project_id
+
     @classmethod
     def reset_instances(cls) -> None:
         """
@@ -0,0 +1,84 @@
+"""Private per-user cache directory for local JSON caches."""
+
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_DIR_NAME = "job-finder"
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Return True if a file is owned by the current user and not group/other accessible."""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def get_cache_dir() -> Optional[Path]:
+    """
+    Return the per-user cache directory, creating it with mode 0700.
+
+    The directory is $XDG_CACHE_HOME/job-finder (default ~/.cache/job-finder).
+    It is only used when it is a real directory owned by the current user with
+    no group or other permissions, so other local users can't plant caches.
+
+    Returns:
+        Cache directory path, or None if it can't be created or isn't private
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = Path(base) / CACHE_DIR_NAME
+
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(cache_dir)
+    except OSError:
+        return None
+
+    if not stat.S_ISDIR(st.st_mode) or not _is_private(st):
+        return None
+    return cache_dir
+
+
+def read_private_json(path: Path) -> Any:
+    """
+    Read a JSON cache file, refusing files that aren't private to this user.
+
+    Args:
+        path: Cache file path
+
+    Returns:
+        Parsed JSON content
+
+    Raises:
+        OSError: If the file is missing, a symlink or not private
+        ValueError: If the file is not valid JSON
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with os.fdopen(fd, "r") as f:
+        if not _is_private(os.fstat(fd)):
+            raise PermissionError(f"Cache file is not private: {path}")
+        return json.load(f)
+
+
+def write_private_json(path: Path, data: Any) -> None:
+    """
+    Atomically write a JSON cache file readable only by this user.
+
+    Args:
+        path: Cache file path
+        data: JSON-serializable content
+
+    Raises:
+        OSError: If the file can't be written
+        TypeError: If data isn't JSON-serializable
+    """
+    # mkstemp creates the file with mode 0600
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -17,6 +17,12 @@ def set_test_environment(monkeypatch):
     monkeypatch.setenv("ENVIRONMENT", "development")
 
 
+@pytest.fixture(autouse=True)
+def isolate_cache_dir(tmp_path, monkeypatch):
+    """Keep local JSON caches (see utils.cache_dir) out of the real user cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+
+
 @pytest.fixture
 def sample_job():
     """
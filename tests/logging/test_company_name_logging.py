@@ -77,6 +77,15 @@ class TestFormatCompanyName:
         assert len(display) <= 20
         assert display.endswith("...")
 
+    def test_combining_mark_not_split(self):
+        """Truncation should not separate a combining mark from its base character."""
+        # "e" + COMBINING ACUTE ACCENT straddles the cut at index 7
+        name = "Societe\u0301 Generale"
+        full, display = format_company_name(name, max_length=10)
+
+        assert full == name
+        assert display == "Societ..."
+
     def test_emoji_in_name(self):
         """Emoji characters should be handled (some companies use them!)."""
         emoji_name = "🚀 Rocket Corp 🌟"
@@ -244,7 +253,7 @@ class TestLoggingConfigIntegration:
     """Integration tests for logging configuration."""
 
     @patch("job_finder.logging_config._load_logging_config")
-    def test_respects_custom_max_length(self, mock_load_config):
+    def test_respects_custom_max_length(self, mock_load_config, monkeypatch):
         """format_company_name should respect custom max_length from config."""
         # Mock config with custom max length
         mock_load_config.return_value = {
@@ -255,7 +264,8 @@ class TestLoggingConfigIntegration:
         # Clear the cached config
         import job_finder.logging_config as log_config
 
-        log_config._logging_config = None
+        monkeypatch.setattr(log_config, "_logging_config", None)
+        monkeypatch.setattr(log_config, "_max_company_name_length", None)
 
         long_name = "A" * 100
         full, display = format_company_name(long_name)
@@ -0,0 +1,104 @@
+"""Tests for the JSONFormatter used by setup_logging."""
+
+import json
+import logging
+import sys
+
+from job_finder.logging_config import JSONFormatter
+
+
+def _make_record(level=logging.INFO, msg="hello", extra=None, exc_info=None):
+    """Build a LogRecord the same way Logger.makeRecord does."""
+    logger = logging.getLogger("test_json_formatter")
+    return logger.makeRecord(logger.name, level, __file__, 1, msg, (), exc_info, extra=extra)
+
+
+class TestJSONFormatter:
+    """Test JSON output shape of JSONFormatter."""
+
+    def test_plain_record_fallback_fields(self):
+        """Records without structured fields should use the system/log fallback."""
+        formatter = JSONFormatter(environment="staging")
+        entry = json.loads(formatter.format(_make_record(msg="plain message")))
+
+        assert entry["severity"] == "INFO"
+        assert entry["environment"] == "staging"
+        assert entry["service"] == "worker"
+        assert entry["category"] == "system"
+        assert entry["action"] == "log"
+        assert entry["message"] == "plain message"
+        assert entry["timestamp"].endswith("Z")
+
+    def test_structured_fields_merged(self):
+        """Structured fields from StructuredLogger should be merged into the entry."""
+        formatter = JSONFormatter(environment="production")
+        fields = {"category": "queue", "action": "processing", "message": "Queue item processing"}
+        record = _make_record(extra={"structured_fields": fields})
+        entry = json.loads(formatter.format(record))
+
+        assert entry["category"] == "queue"
+        assert entry["action"] == "processing"
+        assert entry["message"] == "Queue item processing"
+        assert entry["environment"] == "production"
+
+    def test_severity_mapping(self):
+        """Python log levels should map to Cloud Logging severities."""
+        formatter = JSONFormatter()
+        expected = {
+            logging.DEBUG: "DEBUG",
+            logging.INFO: "INFO",
+            logging.WARNING: "WARNING",
+            logging.ERROR: "ERROR",
+            logging.CRITICAL: "ERROR",
+            logging.NOTSET: "INFO",
+            25: "INFO",
+            35: "WARNING",
+            60: "ERROR",
+        }
+        for level, severity in expected.items():
+            entry = json.loads(formatter.format(_make_record(level=level)))
+            assert entry["severity"] == severity
+
+    def test_exception_info_included(self):
+        """Exception info should be rendered into the error field."""
+        formatter = JSONFormatter()
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = _make_record(level=logging.ERROR, exc_info=sys.exc_info())
+
+        entry = json.loads(formatter.format(record))
+        assert entry["error"]["type"] == "RuntimeError"
+        assert entry["error"]["message"] == "boom"
+        assert "RuntimeError" in entry["error"]["stack"]
+
+    def test_timestamp_format(self):
+        """Timestamps should be ISO 8601 UTC with microseconds and a Z suffix."""
+        formatter = JSONFormatter()
+        record = _make_record()
+        record.created = 1700000000.25
+
+        entry = json.loads(formatter.format(record))
+        assert entry["timestamp"] == "2023-11-14T22:13:20.250000Z"
+
+    def test_timestamp_prefix_cache_tracks_second(self):
+        """Records in a new second should not reuse the cached prefix."""
+        formatter = JSONFormatter()
+        first = _make_record()
+        first.created = 1700000000.5
+        second = _make_record()
+        second.created = 1700000001.0
+
+        assert json.loads(formatter.format(first))["timestamp"] == "2023-11-14T22:13:20.500000Z"
+        assert json.loads(formatter.format(second))["timestamp"] == "2023-11-14T22:13:21.000000Z"
+
+    def test_structured_fields_can_override_constants(self):
+        """Structured fields that set environment/service should win without duplicate keys."""
+        formatter = JSONFormatter(environment="staging")
+        fields = {"category": "worker", "service": "scheduler"}
+        output = formatter.format(_make_record(extra={"structured_fields": fields}))
+
+        assert output.count('"service"') == 1
+        entry = json.loads(output)
+        assert entry["service"] == "scheduler"
+        assert entry["environment"] == "staging"
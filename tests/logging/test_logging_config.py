@@ -0,0 +1,358 @@
+"""Tests for logging_config config loading and handlers."""
+
+import json
+import logging
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from job_finder import logging_config
+from job_finder.logging_config import (
+    BackgroundFileHandler,
+    _read_yaml_with_json_cache,
+    setup_logging,
+)
+
+
+class TestReadYamlWithJsonCache:
+    """Test the JSON cache for YAML config files."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        return tmp_path / "cache" / "job-finder" / "logging.yaml.cache.json"
+
+    def _write_cache(self, cache_path, config_path, data):
+        st = config_path.stat()
+        source = {"path": str(config_path), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"source": source, "data": data}))
+        cache_path.chmod(0o600)
+
+    def test_parses_yaml_and_writes_cache(self, tmp_path, cache_path):
+        """First read should parse YAML and write the cache outside the config dir."""
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text("console:\n  max_company_name_length: 40\n")
+
+        data = _read_yaml_with_json_cache(config_path)
+
+        assert data == {"console": {"max_company_name_length": 40}}
+        assert json.loads(cache_path.read_text())["data"] == data
+        assert oct(cache_path.parent.stat().st_mode & 0o777) == oct(0o700)
+        assert not (tmp_path / "logging.yaml.cache.json").exists()
+
+    def test_uses_matching_cache(self, tmp_path, cache_path):
+        """A cache recorded for the current file should be used instead of the YAML."""
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text("console:\n  max_company_name_length: 40\n")
+        self._write_cache(cache_path, config_path, {"from": "cache"})
+
+        assert _read_yaml_with_json_cache(config_path) == {"from": "cache"}
+
+    def test_replaced_file_with_older_mtime_is_detected(self, tmp_path, cache_path):
+        """A YAML file replaced by one with an older mtime should not hit the cache."""
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text("console:\n  max_company_name_length: 40\n")
+        self._write_cache(cache_path, config_path, {"from": "cache"})
+        yaml_mtime = config_path.stat().st_mtime
+        os.utime(config_path, (yaml_mtime - 10, yaml_mtime - 10))
+
+        data = _read_yaml_with_json_cache(config_path)
+
+        assert data == {"console": {"max_company_name_length": 40}}
+        assert json.loads(cache_path.read_text())["data"] == data
+
+    def test_corrupt_cache_falls_back_to_yaml(self, tmp_path, cache_path):
+        """An unreadable cache should not break config loading."""
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text("structured:\n  preserve_full_values: false\n")
+        cache_path.parent.mkdir(mode=0o700, parents=True)
+        cache_path.write_text("{not json")
+        cache_path.chmod(0o600)
+
+        data = _read_yaml_with_json_cache(config_path)
+
+        assert data == {"structured": {"preserve_full_values": False}}
+
+    def test_non_private_cache_is_ignored(self, tmp_path, cache_path):
+        """A cache file other users can write should never be trusted."""
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text("console:\n  max_company_name_length: 40\n")
+        self._write_cache(cache_path, config_path, {"from": "cache"})
+        cache_path.chmod(0o666)
+
+        data = _read_yaml_with_json_cache(config_path)
+
+        assert data == {"console": {"max_company_name_length": 40}}
+
+
+class TestBackgroundFileHandler:
+    """Test the background-thread file handler."""
+
+    def _record(self, msg, level=logging.INFO):
+        logger = logging.getLogger("test_background_handler")
+        return logger.makeRecord(logger.name, level, __file__, 1, msg, (), None)
+
+    def _wait_for_lines(self, log_file, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            lines = log_file.read_text().splitlines()
+            if len(lines) >= count:
+                return lines
+            time.sleep(0.01)
+        return log_file.read_text().splitlines()
+
+    def test_flush_writes_records_in_order(self, tmp_path):
+        """Records should be written one per line, in emit order, after flush."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file))
+        try:
+            for i in range(5):
+                handler.handle(self._record(f"line {i}"))
+            handler.flush()
+
+            assert log_file.read_text().splitlines() == [f"line {i}" for i in range(5)]
+        finally:
+            handler.close()
+
+    def test_close_drains_pending_records(self, tmp_path):
+        """Closing the handler should write everything still queued."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file))
+        for i in range(100):
+            handler.handle(self._record(f"line {i}"))
+        handler.close()
+
+        assert len(log_file.read_text().splitlines()) == 100
+
+    def test_emit_after_close_writes_directly(self, tmp_path):
+        """Records logged after close() should still reach the file, not a dead queue."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file))
+        handler.handle(self._record("before"))
+        handler.close()
+
+        handler.handle(self._record("after"))
+
+        assert log_file.read_text().splitlines() == ["before", "after"]
+        assert handler._queue.empty()
+
+    def test_close_racing_with_emit_loses_nothing(self, tmp_path):
+        """Records emitted while another thread closes the handler should all be written."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file))
+        started = threading.Barrier(5)
+
+        def write(thread_id):
+            started.wait()
+            for i in range(200):
+                handler.handle(self._record(f"thread-{thread_id}-{i}"))
+
+        threads = [threading.Thread(target=write, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        started.wait()
+        handler.close()
+        for t in threads:
+            t.join()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 800
+        assert handler._queue.empty()
+
+    def test_close_leaves_file_open_while_writer_is_busy(self, tmp_path):
+        """close() should not close the file under a writer thread that hasn't exited."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file))
+        release = threading.Event()
+        original_write = handler._write
+
+        def slow_write(data, flush):
+            release.wait(timeout=5.0)
+            original_write(data, flush)
+
+        handler._write = slow_write
+        handler.handle(self._record("slow"))
+        with patch.object(handler._thread, "join"):
+            handler.close()
+
+        assert not handler._stream.closed
+        release.set()
+        handler._thread.join(timeout=5.0)
+
+        assert handler._stream.closed
+        assert log_file.read_text().splitlines() == ["slow"]
+
+    def test_concurrent_writers(self, tmp_path):
+        """Lines from concurrent threads should never be interleaved."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file))
+
+        def write(thread_id):
+            for i in range(50):
+                handler.handle(self._record(f"thread-{thread_id}-{i}"))
+
+        threads = [threading.Thread(target=write, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        handler.close()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 200
+        assert all(line.startswith("thread-") for line in lines)
+
+    def test_error_records_flushed_immediately(self, tmp_path):
+        """ERROR records should reach the file without waiting for the idle flush."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file), flush_interval=60)
+        try:
+            handler.handle(self._record("boom", level=logging.ERROR))
+
+            assert self._wait_for_lines(log_file, 1) == ["boom"]
+        finally:
+            handler.close()
+
+    def test_idle_flush(self, tmp_path):
+        """Buffered INFO records should be flushed once the queue goes idle."""
+        log_file = tmp_path / "worker.log"
+        handler = BackgroundFileHandler(str(log_file), flush_interval=0.05)
+        try:
+            handler.handle(self._record("quiet"))
+
+            assert self._wait_for_lines(log_file, 1) == ["quiet"]
+        finally:
+            handler.close()
+
+
+class TestSetupLogging:
+    """Test root logger configuration by setup_logging."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        """Restore root logger handlers and level after each test."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        yield
+        for handler in root.handlers:
+            if handler not in saved_handlers:
+                handler.close()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+    def test_installs_console_and_file_handlers(self, tmp_path, monkeypatch):
+        """setup_logging should install a console and a file handler on the root logger."""
+        monkeypatch.delenv("LOG_FILE", raising=False)
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        log_file = tmp_path / "worker.log"
+
+        setup_logging(log_level="DEBUG", log_file=str(log_file))
+
+        root = logging.getLogger()
+        assert root.level == logging.DEBUG
+        assert len(root.handlers) == 2
+        assert any(isinstance(h, BackgroundFileHandler) for h in root.handlers)
+        root.handlers[1].flush()
+        assert "logging_configured" in log_file.read_text()
+
+    def test_reconfiguring_replaces_and_closes_handlers(self, tmp_path, monkeypatch):
+        """Calling setup_logging again should close the handlers it replaces."""
+        monkeypatch.delenv("LOG_FILE", raising=False)
+        setup_logging(log_file=str(tmp_path / "first.log"))
+        first_handlers = logging.getLogger().handlers[:]
+
+        setup_logging(log_file=str(tmp_path / "second.log"))
+
+        root = logging.getLogger()
+        assert len(root.handlers) == 2
+        assert not any(h in root.handlers for h in first_handlers)
+        file_handler = next(h for h in first_handlers if isinstance(h, BackgroundFileHandler))
+        assert file_handler._closed
+
+    def test_same_settings_reuse_handlers(self, tmp_path, monkeypatch):
+        """Calling setup_logging again with the same settings should keep the open handlers."""
+        monkeypatch.delenv("LOG_FILE", raising=False)
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        log_file = str(tmp_path / "worker.log")
+        setup_logging(log_file=log_file)
+        first_handlers = logging.getLogger().handlers[:]
+
+        setup_logging(log_file=log_file)
+
+        assert logging.getLogger().handlers == first_handlers
+        assert not any(h._closed for h in first_handlers if isinstance(h, BackgroundFileHandler))
+
+    def test_handlers_rebuilt_after_external_change(self, tmp_path, monkeypatch):
+        """If something else replaced the root handlers, setup_logging should reinstall."""
+        monkeypatch.delenv("LOG_FILE", raising=False)
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        log_file = str(tmp_path / "worker.log")
+        setup_logging(log_file=log_file)
+        for handler in logging.getLogger().handlers:
+            handler.close()
+        logging.getLogger().handlers = [logging.NullHandler()]
+
+        setup_logging(log_file=log_file)
+
+        root = logging.getLogger()
+        assert len(root.handlers) == 2
+        assert any(isinstance(h, BackgroundFileHandler) for h in root.handlers)
+
+
+class TestGetEnvironment:
+    """Test ENVIRONMENT resolution and caching."""
+
+    def test_missing_environment_raises(self, monkeypatch):
+        """An unset ENVIRONMENT should raise before anything is cached."""
+        monkeypatch.setattr(logging_config, "_environment", None)
+        monkeypatch.delenv("ENVIRONMENT")
+
+        with pytest.raises(ValueError, match="ENVIRONMENT variable is required"):
+            logging_config._get_environment()
+
+    def test_environment_read_once(self, monkeypatch):
+        """The first value read should be reused for the rest of the process."""
+        monkeypatch.setattr(logging_config, "_environment", None)
+        monkeypatch.setenv("ENVIRONMENT", "staging")
+        assert logging_config._get_environment() == "staging"
+
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        assert logging_config._get_environment() == "staging"
+
+
+class TestLoadLoggingConfig:
+    """Test default merging in _load_logging_config."""
+
+    def test_defaults_fill_missing_keys(self, tmp_path, monkeypatch):
+        """Keys missing from the file should come from the defaults."""
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text("console:\n  max_company_name_length: 40\ncomponents:\n  a: INFO\n")
+        monkeypatch.setattr(logging_config, "_CONFIG_PATH", config_path)
+        monkeypatch.setattr(logging_config, "_logging_config", None)
+
+        config = logging_config._load_logging_config()
+
+        assert config["console"] == {
+            "max_company_name_length": 40,
+            "max_job_title_length": 60,
+            "max_url_length": 50,
+        }
+        assert config["structured"] == {
+            "include_display_fields": True,
+            "preserve_full_values": True,
+        }
+        assert config["components"] == {"a": "INFO"}
+
+    def test_missing_file_uses_defaults(self, tmp_path, monkeypatch):
+        """A missing config file should yield the defaults without mutating them."""
+        monkeypatch.setattr(logging_config, "_CONFIG_PATH", tmp_path / "missing.yaml")
+        monkeypatch.setattr(logging_config, "_logging_config", None)
+
+        config = logging_config._load_logging_config()
+        config["console"]["max_company_name_length"] = 1
+
+        assert logging_config._LOGGING_CONFIG_DEFAULTS["console"]["max_company_name_length"] == 80
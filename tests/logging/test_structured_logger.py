@@ -0,0 +1,99 @@
+"""Tests for StructuredLogger field construction."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from job_finder.logging_config import StructuredLogger
+
+
+@pytest.fixture
+def structured_logger():
+    """StructuredLogger bound to a dedicated test logger."""
+    return StructuredLogger(logging.getLogger("test_structured_logger"))
+
+
+class TestStructuredLogger:
+    """Test the structured fields emitted by StructuredLogger methods."""
+
+    def test_queue_item_processing(self, structured_logger, caplog):
+        """Queue item logs should carry the item id and lower-cased type."""
+        with caplog.at_level(logging.INFO):
+            structured_logger.queue_item_processing("abc", "JOB", "processing", {"n": 1})
+
+        fields = caplog.records[0].structured_fields
+        assert fields["category"] == "queue"
+        assert fields["message"] == "Queue item processing"
+        assert fields["queueItemId"] == "abc"
+        assert fields["queueItemType"] == "job"
+        assert fields["details"] == {"n": 1}
+
+    @pytest.mark.parametrize(
+        "status,level",
+        [
+            ("started", logging.INFO),
+            ("completed", logging.INFO),
+            ("failed", logging.ERROR),
+            ("Error", logging.ERROR),
+            ("skipped", logging.WARNING),
+        ],
+    )
+    def test_pipeline_stage_levels(self, structured_logger, caplog, status, level):
+        """Pipeline stage status should determine the log level."""
+        with caplog.at_level(logging.DEBUG):
+            structured_logger.pipeline_stage("abc", "SCRAPE", status)
+
+        record = caplog.records[0]
+        assert record.levelno == level
+        assert record.structured_fields["message"] == f"Pipeline SCRAPE {status}"
+        assert record.structured_fields["pipelineStage"] == "scrape"
+        assert record.structured_fields["action"] == status
+
+    def test_worker_status(self, structured_logger, caplog):
+        """Worker status logs should lower-case the action but not the message."""
+        with caplog.at_level(logging.INFO):
+            structured_logger.worker_status("Started")
+
+        fields = caplog.records[0].structured_fields
+        assert fields["action"] == "started"
+        assert fields["message"] == "Worker Started"
+        assert fields["details"] == {}
+
+    def test_database_activity(self, structured_logger, caplog):
+        """Database logs should include collection and status in details."""
+        with caplog.at_level(logging.INFO):
+            structured_logger.database_activity("UPDATE", "job-queue", "ok", {"id": "1"})
+
+        fields = caplog.records[0].structured_fields
+        assert fields["action"] == "update"
+        assert fields["message"] == "Database UPDATE on job-queue: ok"
+        assert fields["details"] == {"collection": "job-queue", "status": "ok", "id": "1"}
+
+    def test_ai_activity(self, structured_logger, caplog):
+        """AI logs should lower-case the operation as the action."""
+        with caplog.at_level(logging.INFO):
+            structured_logger.ai_activity("MATCH", "completed")
+
+        fields = caplog.records[0].structured_fields
+        assert fields["action"] == "match"
+        assert fields["message"] == "AI MATCH completed"
+
+    def test_disabled_level_skips_work(self, structured_logger, caplog):
+        """Records below the effective level should not be built or emitted."""
+        with caplog.at_level(logging.WARNING):
+            with patch("job_finder.logging_config.format_company_name") as mock_format:
+                structured_logger.company_activity("Acme", "FETCH")
+                structured_logger.worker_status("idle")
+                structured_logger.pipeline_stage("abc", "scrape", "completed")
+
+        mock_format.assert_not_called()
+        assert caplog.records == []
+
+    def test_disabled_level_still_emits_higher_pipeline_levels(self, structured_logger, caplog):
+        """A failed pipeline stage is an ERROR and should pass a WARNING threshold."""
+        with caplog.at_level(logging.WARNING):
+            structured_logger.pipeline_stage("abc", "scrape", "failed")
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].levelno == logging.ERROR
@@ -1,10 +1,14 @@
 """Tests for configuration loader."""
 
+import json
+import os
+import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from job_finder.job_queue.config_loader import ConfigLoader
+from job_finder.job_queue.config_loader import CONFIG_CACHE_TTL_SECONDS, ConfigLoader
 
 
 @pytest.fixture
@@ -23,18 +27,47 @@ def config_loader(mock_firestore_client):
     return loader
 
 
+def _snapshot(doc_id, data):
+    """Build a mock DocumentSnapshot."""
+    snapshot = MagicMock()
+    snapshot.id = doc_id
+    snapshot.to_dict.return_value = data
+    return snapshot
+
+
+def _stream(loader):
+    """Return the mocked collection stream() used to prefetch config."""
+    return loader.db.collection.return_value.stream
+
+
+def _cache_file(tmp_path):
+    """Return the local cache file for the test-db config (XDG_CACHE_HOME set in conftest)."""
+    return tmp_path / "xdg-cache" / "job-finder" / "job-finder-config-test-db.json"
+
+
+def _set_documents(loader, documents):
+    """Make the config collection stream snapshots for the given {doc_id: data} mapping.
+
+    A value of None means the document doesn't exist and is left out of the stream.
+    """
+    _stream(loader).return_value = [
+        _snapshot(doc_id, data) for doc_id, data in documents.items() if data is not None
+    ]
+
+
 def test_get_stop_list(config_loader):
     """Test loading stop list from Firestore."""
     # Mock Firestore document
-    mock_doc = MagicMock()
-    mock_doc.exists = True
-    mock_doc.to_dict.return_value = {
-        "excludedCompanies": ["BadCorp", "ScamInc"],
-        "excludedKeywords": ["commission only", "unpaid"],
-        "excludedDomains": ["spam.com"],
-    }
-
-    config_loader.db.collection.return_value.document.return_value.get.return_value = mock_doc
+    _set_documents(
+        config_loader,
+        {
+            "stop-list": {
+                "excludedCompanies": ["BadCorp", "ScamInc"],
+                "excludedKeywords": ["commission only", "unpaid"],
+                "excludedDomains": ["spam.com"],
+            }
+        },
+    )
 
     # Load stop list
     stop_list = config_loader.get_stop_list()
@@ -48,38 +81,36 @@ def test_get_stop_list(config_loader):
 
     # Verify Firestore calls
     config_loader.db.collection.assert_called_with("job-finder-config")
-    config_loader.db.collection.return_value.document.assert_called_with("stop-list")
+    _stream(config_loader).assert_called_once()
 
 
 def test_get_stop_list_not_found(config_loader):
     """Test stop list when document doesn't exist."""
     # Mock non-existent document
-    mock_doc = MagicMock()
-    mock_doc.exists = False
-
-    config_loader.db.collection.return_value.document.return_value.get.return_value = mock_doc
+    _set_documents(config_loader, {"stop-list": None})
 
     # Load stop list
     stop_list = config_loader.get_stop_list()
 
     # Should return empty lists
-    assert stop_list["excludedCompanies"] == []
-    assert stop_list["excludedKeywords"] == []
-    assert stop_list["excludedDomains"] == []
+    assert stop_list["excludedCompanies"] == ()
+    assert stop_list["excludedKeywords"] == ()
+    assert stop_list["excludedDomains"] == ()
 
 
 def test_get_queue_settings(config_loader):
     """Test loading queue settings from Firestore."""
     # Mock Firestore document
-    mock_doc = MagicMock()
-    mock_doc.exists = True
-    mock_doc.to_dict.return_value = {
-        "maxRetries": 5,
-        "retryDelaySeconds": 120,
-        "processingTimeout": 600,
-    }
-
-    config_loader.db.collection.return_value.document.return_value.get.return_value = mock_doc
+    _set_documents(
+        config_loader,
+        {
+            "queue-settings": {
+                "maxRetries": 5,
+                "retryDelaySeconds": 120,
+                "processingTimeout": 600,
+            }
+        },
+    )
 
     # Load settings
     settings = config_loader.get_queue_settings()
@@ -93,10 +124,7 @@ def test_get_queue_settings(config_loader):
 def test_get_queue_settings_defaults(config_loader):
     """Test queue settings with default values."""
     # Mock non-existent document
-    mock_doc = MagicMock()
-    mock_doc.exists = False
-
-    config_loader.db.collection.return_value.document.return_value.get.return_value = mock_doc
+    _set_documents(config_loader, {"queue-settings": None})
 
     # Load settings
     settings = config_loader.get_queue_settings()
@@ -110,16 +138,17 @@ def test_get_queue_settings_defaults(config_loader):
 def test_get_ai_settings(config_loader):
     """Test loading AI settings from Firestore."""
     # Mock Firestore document
-    mock_doc = MagicMock()
-    mock_doc.exists = True
-    mock_doc.to_dict.return_value = {
-        "provider": "openai",
-        "model": "gpt-4",
-        "minMatchScore": 80,
-        "costBudgetDaily": 100.0,
-    }
-
-    config_loader.db.collection.return_value.document.return_value.get.return_value = mock_doc
+    _set_documents(
+        config_loader,
+        {
+            "ai-settings": {
+                "provider": "openai",
+                "model": "gpt-4",
+                "minMatchScore": 80,
+                "costBudgetDaily": 100.0,
+            }
+        },
+    )
 
     # Load settings
     settings = config_loader.get_ai_settings()
@@ -134,10 +163,7 @@ def test_get_ai_settings(config_loader):
 def test_get_ai_settings_defaults(config_loader):
     """Test AI settings with default values."""
     # Mock non-existent document
-    mock_doc = MagicMock()
-    mock_doc.exists = False
-
-    config_loader.db.collection.return_value.document.return_value.get.return_value = mock_doc
+    _set_documents(config_loader, {"ai-settings": None})
 
     # Load settings
     settings = config_loader.get_ai_settings()
@@ -148,21 +174,72 @@ def test_get_ai_settings_defaults(config_loader):
     assert settings["minMatchScore"] == 70
 
 
+def test_cached_settings_are_read_only(config_loader):
+    """Cached settings should be shared read-only views, not mutable dicts."""
+    _set_documents(
+        config_loader,
+        {"stop-list": {"excludedCompanies": ["BadCorp"], "excludedKeywords": ["unpaid"]}},
+    )
+
+    stop_list = config_loader.get_stop_list()
+
+    assert config_loader.get_stop_list() is stop_list
+    assert stop_list["excludedCompanies"] == ("BadCorp",)
+    with pytest.raises(TypeError):
+        stop_list["excludedCompanies"] = []
+    with pytest.raises(AttributeError):
+        stop_list["excludedKeywords"].append("scam")
+
+
+def test_defaults_are_shared_read_only(config_loader):
+    """Missing documents should return the same read-only defaults every time."""
+    _set_documents(config_loader, {})
+
+    filters = config_loader.get_job_filters()
+
+    assert config_loader.get_job_filters() is filters
+    assert "sales" in filters["hardRejections"]["excludedJobTypes"]
+    with pytest.raises(TypeError):
+        filters["enabled"] = False
+
+
+def test_get_all_settings(config_loader):
+    """get_all_settings should return every group from a single read."""
+    _set_documents(
+        config_loader,
+        {
+            "queue-settings": {"maxRetries": 5},
+            "scheduler-settings": {"enabled": False},
+        },
+    )
+
+    settings = config_loader.get_all_settings()
+
+    assert set(settings) == {
+        "stop_list",
+        "queue_settings",
+        "ai_settings",
+        "job_filters",
+        "technology_ranks",
+        "scheduler_settings",
+    }
+    assert settings["queue_settings"]["maxRetries"] == 5
+    assert settings["ai_settings"]["provider"] == "claude"
+    assert settings["scheduler_settings"]["enabled"] is False
+    _stream(config_loader).assert_called_once()
+
+
 def test_cache_refresh(config_loader):
     """Test cache refresh functionality."""
     # Mock Firestore document
-    mock_doc = MagicMock()
-    mock_doc.exists = True
-    mock_doc.to_dict.return_value = {"excludedCompanies": ["Test"]}
-
-    config_loader.db.collection.return_value.document.return_value.get.return_value = mock_doc
+    _set_documents(config_loader, {"stop-list": {"excludedCompanies": ["Test"]}})
 
     # Load stop list twice (should use cache)
     config_loader.get_stop_list()
     config_loader.get_stop_list()
 
     # Should only call Firestore once
-    assert config_loader.db.collection.return_value.document.return_value.get.call_count == 1
+    assert _stream(config_loader).call_count == 1
 
     # Refresh cache
     config_loader.refresh_cache()
@@ -171,4 +248,116 @@ def test_cache_refresh(config_loader):
     config_loader.get_stop_list()
 
     # Should call Firestore twice now (once before refresh, once after)
-    assert config_loader.db.collection.return_value.document.return_value.get.call_count == 2
+    assert _stream(config_loader).call_count == 2
+
+
+def test_prefetch_shared_across_getters(config_loader):
+    """All getters should be served by a single batched read."""
+    _set_documents(
+        config_loader,
+        {
+            "stop-list": {"excludedCompanies": ["BadCorp"]},
+            "queue-settings": {"maxRetries": 5},
+            "ai-settings": None,
+        },
+    )
+
+    assert config_loader.get_stop_list()["excludedCompanies"] == ("BadCorp",)
+    assert config_loader.get_queue_settings()["maxRetries"] == 5
+    assert config_loader.get_ai_settings()["provider"] == "claude"
+    assert config_loader.get_scheduler_settings() is None
+
+    _stream(config_loader).assert_called_once()
+    config_loader.db.collection.return_value.document.assert_not_called()
+
+
+def test_prefetch_ignores_unknown_documents(config_loader):
+    """Documents outside CONFIG_DOCUMENTS should not end up in the cache."""
+    _set_documents(
+        config_loader,
+        {"queue-settings": {"maxRetries": 5}, "scratch-notes": {"text": "ignore me"}},
+    )
+
+    config_loader.prefetch_all()
+
+    assert "scratch-notes" not in config_loader._documents
+    assert config_loader.get_queue_settings()["maxRetries"] == 5
+
+
+def test_prefetch_error_returns_defaults(config_loader):
+    """A failed batched read should fall back to defaults and retry on next access."""
+    _stream(config_loader).side_effect = RuntimeError("unavailable")
+
+    settings = config_loader.get_queue_settings()
+
+    assert settings["maxRetries"] == 3
+
+    _stream(config_loader).side_effect = None
+    _set_documents(config_loader, {"queue-settings": {"maxRetries": 7}})
+
+    assert config_loader.get_queue_settings()["maxRetries"] == 7
+
+
+def test_disk_cache_shared_with_new_loader(config_loader, mock_firestore_client, tmp_path):
+    """A second loader should reuse the documents the first one prefetched."""
+    _set_documents(config_loader, {"queue-settings": {"maxRetries": 5}})
+    config_loader.get_queue_settings()
+
+    assert _cache_file(tmp_path).stat().st_mode & 0o777 == 0o600
+
+    second_db = MagicMock()
+    mock_firestore_client.get_client.return_value = second_db
+    second_loader = ConfigLoader(database_name="test-db")
+
+    assert second_loader.get_queue_settings()["maxRetries"] == 5
+    second_db.collection.return_value.stream.assert_not_called()
+
+
+def test_stale_disk_cache_ignored(config_loader, mock_firestore_client, tmp_path):
+    """A cache file older than the TTL should not be used."""
+    _set_documents(config_loader, {"queue-settings": {"maxRetries": 5}})
+    config_loader.get_queue_settings()
+    cache_file = _cache_file(tmp_path)
+    old = time.time() - CONFIG_CACHE_TTL_SECONDS - 10
+    os.utime(cache_file, (old, old))
+
+    second_loader = ConfigLoader(database_name="test-db")
+    _set_documents(second_loader, {"queue-settings": {"maxRetries": 9}})
+
+    assert second_loader.get_queue_settings()["maxRetries"] == 9
+
+
+def test_refresh_cache_removes_disk_cache(config_loader, tmp_path):
+    """refresh_cache should also drop the local cache file."""
+    _set_documents(config_loader, {"stop-list": {"excludedCompanies": ["Test"]}})
+    config_loader.get_stop_list()
+
+    config_loader.refresh_cache()
+
+    assert not _cache_file(tmp_path).exists()
+
+
+def test_disk_cache_restores_timestamps(config_loader, mock_firestore_client, tmp_path):
+    """Timestamps should be stored explicitly and come back as datetimes."""
+    updated_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    _set_documents(config_loader, {"ai-settings": {"provider": "claude", "updatedAt": updated_at}})
+    config_loader.prefetch_all()
+
+    cached = json.loads(_cache_file(tmp_path).read_text())
+    assert cached["ai-settings"]["updatedAt"] == {"__datetime__": updated_at.isoformat()}
+
+    second_loader = ConfigLoader(database_name="test-db")
+
+    assert second_loader._get_document("ai-settings")["updatedAt"] == updated_at
+
+
+def test_non_private_disk_cache_ignored(config_loader, mock_firestore_client, tmp_path):
+    """A cache file other local users could have written should not be trusted."""
+    _set_documents(config_loader, {"queue-settings": {"maxRetries": 5}})
+    config_loader.get_queue_settings()
+    _cache_file(tmp_path).chmod(0o666)
+
+    second_loader = ConfigLoader(database_name="test-db")
+    _set_documents(second_loader, {"queue-settings": {"maxRetries": 9}})
+
+    assert second_loader.get_queue_settings()["maxRetries"] == 9
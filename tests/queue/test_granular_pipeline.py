@@ -113,8 +113,8 @@ class TestJobScrapeProcessor:
             processor._process_job_scrape(item)
 
         # Should spawn next step
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert args["next_sub_task"] == JobSubTask.FILTER
 
     def test_fails_when_no_data_scraped(self, processor):
@@ -132,7 +132,7 @@ class TestJobScrapeProcessor:
             processor._process_job_scrape(item)
 
         # Should NOT spawn next step
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
 
 class TestJobFilterProcessor:
@@ -155,8 +155,8 @@ class TestJobFilterProcessor:
             processor._process_job_filter(item)
 
         # Should spawn ANALYZE
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert args["next_sub_task"] == JobSubTask.ANALYZE
 
     def test_marks_filtered_when_rejected(self, processor):
@@ -176,7 +176,7 @@ class TestJobFilterProcessor:
             processor._process_job_filter(item)
 
         # Should NOT spawn next step
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
 
 class TestJobAnalyzeProcessor:
@@ -211,8 +211,8 @@ class TestJobAnalyzeProcessor:
         processor._process_job_analyze(item)
 
         # Should spawn SAVE
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert args["next_sub_task"] == JobSubTask.SAVE
 
     def test_skips_when_below_threshold(self, processor):
@@ -232,7 +232,7 @@ class TestJobAnalyzeProcessor:
         processor._process_job_analyze(item)
 
         # Should NOT spawn next step
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
 
 class TestJobSaveProcessor:
@@ -305,7 +305,7 @@ class TestPipelineStatePassthrough:
         with patch.object(processor.job_processor, "_scrape_job", return_value=job_data):
             processor._process_job_scrape(item)
 
-        args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        args = processor.queue_manager.complete_and_spawn.call_args[1]
         pipeline_state = args["pipeline_state"]
 
         assert "job_data" in pipeline_state
@@ -327,7 +327,7 @@ class TestPipelineStatePassthrough:
         with patch.object(processor.filter_engine, "evaluate_job", return_value=filter_result):
             processor._process_job_filter(item)
 
-        args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        args = processor.queue_manager.complete_and_spawn.call_args[1]
         pipeline_state = args["pipeline_state"]
 
         # Should preserve original job_data
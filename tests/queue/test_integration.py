@@ -15,6 +15,7 @@ def mock_firestore():
     """Mock Firestore for all components."""
     with patch("job_finder.job_queue.manager.FirestoreClient") as mock_client:
         mock_db = MagicMock()
+        mock_db.collection.return_value.document.return_value.id = "queue-item-123"
         mock_client.get_client.return_value = mock_db
         yield mock_db
 
@@ -49,9 +50,8 @@ class TestQueueWorkflow:
         mock_firestore.collection.return_value.add.return_value = mock_doc_ref
 
         # Mock URL check (no duplicates)
-        limit_stream = (
-            mock_firestore.collection.return_value.where.return_value.limit.return_value.stream
-        )
+        where = mock_firestore.collection.return_value.where
+        limit_stream = where.return_value.limit.return_value.select.return_value.stream
         limit_stream.return_value = []
 
         # Submit job
@@ -100,14 +100,14 @@ class TestQueueWorkflow:
         """Test stop list filtering workflow."""
         # Mock stop list in Firestore
         mock_doc = MagicMock()
-        mock_doc.exists = True
+        mock_doc.id = "stop-list"
         mock_doc.to_dict.return_value = {
             "excludedCompanies": ["BadCorp", "ScamInc"],
             "excludedKeywords": ["commission only"],
             "excludedDomains": ["spam.com"],
         }
 
-        mock_firestore.collection.return_value.document.return_value.get.return_value = mock_doc
+        mock_firestore.collection.return_value.stream.return_value = [mock_doc]
 
         # Load stop list
         stop_list = config_loader.get_stop_list()
@@ -120,9 +120,8 @@ class TestQueueWorkflow:
     def test_duplicate_detection_workflow(self, queue_manager, scraper_intake, mock_firestore):
         """Test duplicate detection prevents duplicate submissions."""
         # First submission - no duplicates
-        limit_stream = (
-            mock_firestore.collection.return_value.where.return_value.limit.return_value.stream
-        )
+        where = mock_firestore.collection.return_value.where
+        limit_stream = where.return_value.limit.return_value.select.return_value.stream
         limit_stream.return_value = []
         mock_doc_ref = (None, MagicMock(id="queue-item-123"))
         mock_firestore.collection.return_value.add.return_value = mock_doc_ref
@@ -139,6 +138,26 @@ class TestQueueWorkflow:
         count2 = scraper_intake.submit_jobs(jobs, source="scraper")
         assert count2 == 0  # Should skip duplicate
 
+    @pytest.mark.parametrize("final_status", [QueueStatus.FILTERED, QueueStatus.SKIPPED])
+    def test_rejected_job_still_deduplicated_after_ttl(
+        self, queue_manager, scraper_intake, mock_firestore, final_status
+    ):
+        """Rejected jobs never reach job-matches, so their queue item must outlive the TTL."""
+        mock_doc = MagicMock(id="queue-item-123")
+        mock_firestore.collection.return_value.document.return_value = mock_doc
+
+        queue_manager.update_status("item-123", final_status)
+
+        # The TTL policy deletes any document with expires_at once it passes
+        survives_ttl = "expires_at" not in mock_doc.update.call_args[0][0]
+        where = mock_firestore.collection.return_value.where
+        limit_stream = where.return_value.limit.return_value.select.return_value.stream
+        limit_stream.return_value = [MagicMock()] if survives_ttl else []
+
+        jobs = [{"title": "Job 1", "url": "https://example.com/job/1", "company": "Test"}]
+
+        assert scraper_intake.submit_jobs(jobs, source="scraper") == 0
+
     def test_queue_status_updates(self, queue_manager, mock_firestore):
         """Test queue item status updates through workflow."""
         mock_doc = MagicMock()
@@ -178,19 +197,17 @@ class TestQueueWorkflow:
 
     def test_queue_statistics_workflow(self, queue_manager, mock_firestore):
         """Test queue statistics gathering."""
-        # Mock queue items with different statuses
-        mock_docs = [
-            MagicMock(to_dict=lambda: {"status": "pending"}),
-            MagicMock(to_dict=lambda: {"status": "pending"}),
-            MagicMock(to_dict=lambda: {"status": "processing"}),
-            MagicMock(to_dict=lambda: {"status": "success"}),
-            MagicMock(to_dict=lambda: {"status": "success"}),
-            MagicMock(to_dict=lambda: {"status": "success"}),
-            MagicMock(to_dict=lambda: {"status": "failed"}),
-            MagicMock(to_dict=lambda: {"status": "skipped"}),
-        ]
+        # Mock count() aggregation results per status
+        counts = {"pending": 2, "processing": 1, "success": 3, "failed": 1, "skipped": 1}
 
-        mock_firestore.collection.return_value.stream.return_value = mock_docs
+        def count_query(value):
+            query = MagicMock()
+            query.count.return_value.get.return_value = [[MagicMock(value=value)]]
+            return query
+
+        collection = mock_firestore.collection.return_value
+        collection.where.side_effect = lambda filter: count_query(counts.get(filter.value, 0))
+        collection.select.return_value.count.return_value.get.return_value = [[MagicMock(value=8)]]
 
         stats = queue_manager.get_queue_stats()
 
@@ -199,7 +216,9 @@ class TestQueueWorkflow:
         assert stats["success"] == 3
         assert stats["failed"] == 1
         assert stats["skipped"] == 1
+        assert stats["filtered"] == 0
         assert stats["total"] == 8
+        collection.stream.assert_not_called()
 
 
 class TestEndToEndScenarios:
@@ -218,9 +237,8 @@ class TestEndToEndScenarios:
         # Step 1: User submits job
         mock_doc_ref = (None, MagicMock(id="user-job-123"))
         mock_firestore.collection.return_value.add.return_value = mock_doc_ref
-        limit_stream = (
-            mock_firestore.collection.return_value.where.return_value.limit.return_value.stream
-        )
+        where = mock_firestore.collection.return_value.where
+        limit_stream = where.return_value.limit.return_value.select.return_value.stream
         limit_stream.return_value = []
 
         jobs = [
@@ -239,7 +257,8 @@ class TestEndToEndScenarios:
         assert count == 1
 
         # Verify queue item structure
-        call_args = mock_firestore.collection.return_value.add.call_args[0][0]
+        mock_firestore.collection.return_value.add.assert_not_called()
+        call_args = mock_firestore.batch.return_value.create.call_args[0][1]
         assert call_args["type"] == "job"
         assert call_args["status"] == "pending"
         assert call_args["source"] == "user_submission"
@@ -258,9 +277,8 @@ class TestEndToEndScenarios:
         mock_firestore.collection.return_value.add.return_value = mock_doc_ref
 
         # First batch - no duplicates
-        limit_stream = (
-            mock_firestore.collection.return_value.where.return_value.limit.return_value.stream
-        )
+        where = mock_firestore.collection.return_value.where
+        limit_stream = where.return_value.limit.return_value.select.return_value.stream
         limit_stream.return_value = []
 
         batch1 = [
@@ -305,9 +323,8 @@ class TestEndToEndScenarios:
         """
         mock_doc_ref = (None, MagicMock(id="item-123"))
         mock_firestore.collection.return_value.add.return_value = mock_doc_ref
-        limit_stream = (
-            mock_firestore.collection.return_value.where.return_value.limit.return_value.stream
-        )
+        where = mock_firestore.collection.return_value.where
+        limit_stream = where.return_value.limit.return_value.select.return_value.stream
         limit_stream.return_value = []
 
         # Step 1: Submit company (using granular pipeline)
@@ -369,17 +386,19 @@ class TestErrorHandling:
 
     def test_scraper_intake_continues_on_individual_errors(self, scraper_intake, mock_firestore):
         """Test that scraper intake continues processing on individual errors."""
-        limit_stream = (
-            mock_firestore.collection.return_value.where.return_value.limit.return_value.stream
-        )
+        where = mock_firestore.collection.return_value.where
+        limit_stream = where.return_value.limit.return_value.select.return_value.stream
         limit_stream.return_value = []
 
-        # First add succeeds, second fails, third succeeds
-        mock_firestore.collection.return_value.add.side_effect = [
-            (None, MagicMock(id="1")),
-            Exception("Error"),
-            (None, MagicMock(id="3")),
+        # The batch commit fails, then the per-item retry: first add succeeds,
+        # second fails, third succeeds
+        refs = {doc_id: MagicMock(id=doc_id) for doc_id in ("1", "2", "3")}
+        refs["2"].create.side_effect = Exception("Error")
+        new_ids = iter(refs)
+        mock_firestore.collection.return_value.document.side_effect = lambda *args: refs[
+            args[0] if args else next(new_ids)
         ]
+        mock_firestore.batch.return_value.commit.side_effect = Exception("Batch error")
 
         jobs = [
             {"title": "Job 1", "url": "https://example.com/1", "company": "Test"},
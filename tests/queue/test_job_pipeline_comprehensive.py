@@ -82,8 +82,8 @@ class TestJobScrapeSuccess:
             processor._process_job_scrape(item)
 
         # Verify spawn called with correct data
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        call_args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        call_args = processor.queue_manager.complete_and_spawn.call_args[1]
 
         assert call_args["current_item"] == item
         assert call_args["next_sub_task"] == JobSubTask.FILTER
@@ -117,8 +117,8 @@ class TestJobScrapeSuccess:
             processor._process_job_scrape(item)
 
         # Should spawn FILTER step
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        call_args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        call_args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert call_args["next_sub_task"] == JobSubTask.FILTER
         assert call_args["pipeline_state"]["scrape_method"] == "generic"
 
@@ -150,7 +150,7 @@ class TestJobScrapeSuccess:
             processor._process_job_scrape(item)
 
         # Verify optional fields preserved
-        call_args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        call_args = processor.queue_manager.complete_and_spawn.call_args[1]
         saved_data = call_args["pipeline_state"]["job_data"]
         assert saved_data["posted_date"] == "2025-01-15"
         assert saved_data["salary"] == "$120k - $150k"
@@ -175,7 +175,7 @@ class TestJobScrapeFailures:
             processor._process_job_scrape(item)
 
         # Should NOT spawn next step
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_scrape_raises_exception(self, processor, mock_managers):
         """Should handle scraping exceptions gracefully."""
@@ -200,7 +200,7 @@ class TestJobScrapeFailures:
                 pass  # Expected
 
         # Should NOT spawn next step since scraping failed
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_scrape_missing_required_fields(self, processor):
         """Should still pass incomplete data through to filter - validation happens there."""
@@ -227,8 +227,8 @@ class TestJobScrapeFailures:
             processor._process_job_scrape(item)
 
         # Scraper doesn't validate - just passes data through to filter
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        call_args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        call_args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert call_args["next_sub_task"] == JobSubTask.FILTER
 
 
@@ -267,8 +267,8 @@ class TestJobFilterPassing:
             processor._process_job_filter(item)
 
         # Should spawn ANALYZE
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        call_args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        call_args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert call_args["next_sub_task"] == JobSubTask.ANALYZE
         assert call_args["pipeline_state"]["job_data"] == job_data
         assert call_args["pipeline_state"]["filter_result"] == filter_result.to_dict()
@@ -300,8 +300,8 @@ class TestJobFilterPassing:
             processor._process_job_filter(item)
 
         # Should still spawn ANALYZE
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        call_args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        call_args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert call_args["next_sub_task"] == JobSubTask.ANALYZE
 
 
@@ -342,7 +342,7 @@ class TestJobFilterRejections:
             processor._process_job_filter(item)
 
         # Should NOT spawn ANALYZE
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_filter_rejects_too_many_strikes(self, processor):
         """Should reject job with too many strikes (≥5)."""
@@ -371,7 +371,7 @@ class TestJobFilterRejections:
             processor._process_job_filter(item)
 
         # Should NOT spawn ANALYZE
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_filter_rejects_management_role(self, processor):
         """Should reject management roles for IC preference."""
@@ -406,7 +406,7 @@ class TestJobFilterRejections:
             processor._process_job_filter(item)
 
         # Should NOT spawn ANALYZE
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
 
 class TestJobFilterEdgeCases:
@@ -426,7 +426,7 @@ class TestJobFilterEdgeCases:
         processor._process_job_filter(item)
 
         # Should NOT spawn next step
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_filter_with_missing_job_data(self, processor):
         """Should handle missing job_data in pipeline_state."""
@@ -442,7 +442,7 @@ class TestJobFilterEdgeCases:
         processor._process_job_filter(item)
 
         # Should NOT spawn next step
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
 
 # ========================================
@@ -494,8 +494,8 @@ class TestJobAnalyzeSuccess:
         processor._process_job_analyze(item)
 
         # Should spawn SAVE
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
-        call_args = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        processor.queue_manager.complete_and_spawn.assert_called_once()
+        call_args = processor.queue_manager.complete_and_spawn.call_args[1]
         assert call_args["next_sub_task"] == JobSubTask.SAVE
         assert call_args["pipeline_state"]["match_result"] == match_result.to_dict()
 
@@ -550,7 +550,7 @@ class TestJobAnalyzeSuccess:
         processor.companies_manager.get_company.assert_called_once()
 
         # Should spawn SAVE
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
+        processor.queue_manager.complete_and_spawn.assert_called_once()
 
 
 class TestJobAnalyzeRejections:
@@ -582,7 +582,7 @@ class TestJobAnalyzeRejections:
         processor._process_job_analyze(item)
 
         # Should NOT spawn SAVE
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_analyze_ai_error_no_spawn(self, processor):
         """Should not spawn SAVE when AI analysis fails."""
@@ -614,7 +614,7 @@ class TestJobAnalyzeRejections:
             pass  # Expected
 
         # Should NOT spawn SAVE
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
 
 class TestJobAnalyzeEdgeCases:
@@ -634,7 +634,7 @@ class TestJobAnalyzeEdgeCases:
         processor._process_job_analyze(item)
 
         # Should NOT spawn SAVE
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_analyze_missing_job_data(self, processor):
         """Should handle missing job_data."""
@@ -650,7 +650,7 @@ class TestJobAnalyzeEdgeCases:
         processor._process_job_analyze(item)
 
         # Should NOT spawn SAVE
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
 
     def test_analyze_portland_office_bonus(self, processor, mock_managers):
         """Should apply Portland office bonus to score."""
@@ -687,7 +687,7 @@ class TestJobAnalyzeEdgeCases:
         processor._process_job_analyze(item)
 
         # Should spawn SAVE (meets threshold with bonus)
-        processor.queue_manager.spawn_next_pipeline_step.assert_called_once()
+        processor.queue_manager.complete_and_spawn.assert_called_once()
 
 
 # ========================================
@@ -894,7 +894,7 @@ class TestPipelineStateManagement:
             processor._process_job_scrape(scrape_item)
 
         # Verify SCRAPE created state
-        scrape_call = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        scrape_call = processor.queue_manager.complete_and_spawn.call_args[1]
         assert "job_data" in scrape_call["pipeline_state"]
         assert scrape_call["pipeline_state"]["scrape_method"] == "generic"
 
@@ -914,7 +914,7 @@ class TestPipelineStateManagement:
             processor._process_job_filter(filter_item)
 
         # Verify FILTER preserved job_data and added filter_result
-        filter_call = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        filter_call = processor.queue_manager.complete_and_spawn.call_args[1]
         assert filter_call["pipeline_state"]["job_data"] == job_data
         assert "filter_result" in filter_call["pipeline_state"]
 
@@ -944,7 +944,7 @@ class TestPipelineStateManagement:
         processor._process_job_analyze(analyze_item)
 
         # Verify ANALYZE preserved all previous state and added match_result
-        analyze_call = processor.queue_manager.spawn_next_pipeline_step.call_args[1]
+        analyze_call = processor.queue_manager.complete_and_spawn.call_args[1]
         assert analyze_call["pipeline_state"]["job_data"] == job_data
         assert "filter_result" in analyze_call["pipeline_state"]
         assert "match_result" in analyze_call["pipeline_state"]
@@ -973,4 +973,4 @@ class TestPipelineStateManagement:
                 pass  # Expected
 
         # Should not spawn (error handled)
-        processor.queue_manager.spawn_next_pipeline_step.assert_not_called()
+        processor.queue_manager.complete_and_spawn.assert_not_called()
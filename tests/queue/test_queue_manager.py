@@ -1,11 +1,14 @@
 """Tests for queue manager."""
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.cloud import firestore as gcloud_firestore
 
+from job_finder.constants import QUEUE_ITEM_TTL_DAYS
 from job_finder.job_queue.manager import QueueManager
-from job_finder.job_queue.models import JobQueueItem, QueueItemType, QueueStatus
+from job_finder.job_queue.models import JobQueueItem, JobSubTask, QueueItemType, QueueStatus
 
 
 @pytest.fixture
@@ -46,13 +49,65 @@ def test_add_item(queue_manager):
     queue_manager.db.collection.assert_called_with("job-queue")
 
 
+def test_add_items_batches_writes(queue_manager):
+    """Test add_items writes every item in one batch with client-side IDs."""
+    collection = queue_manager.db.collection.return_value
+    collection.document.side_effect = lambda *args: MagicMock(id=args[0] if args else "auto-id")
+    batch = queue_manager.db.batch.return_value
+
+    items = [
+        JobQueueItem(type=QueueItemType.JOB, url="https://example.com/job/1", company_name="A"),
+        JobQueueItem(
+            id="reserved-id",
+            type=QueueItemType.JOB,
+            url="https://example.com/job/2",
+            company_name="B",
+        ),
+    ]
+
+    item_ids = queue_manager.add_items(items)
+
+    assert item_ids == ["auto-id", "reserved-id"]
+    assert batch.create.call_count == 2
+    batch.commit.assert_called_once()
+    collection.add.assert_not_called()
+
+    data = batch.create.call_args_list[1][0][1]
+    assert data["url"] == "https://example.com/job/2"
+    assert data["status"] == "pending"
+    assert "id" not in data
+
+
+def test_add_items_falls_back_to_single_creates(queue_manager):
+    """Test a failed batch commit is retried per item and only created IDs are returned."""
+    refs = {doc_id: MagicMock(id=doc_id) for doc_id in ("item-1", "item-2", "item-3")}
+    refs["item-2"].create.side_effect = Exception("Firestore error")
+    queue_manager.db.collection.return_value.document.side_effect = lambda doc_id: refs[doc_id]
+    queue_manager.db.batch.return_value.commit.side_effect = Exception("Batch error")
+
+    items = [
+        JobQueueItem(id=doc_id, type=QueueItemType.JOB, url=f"https://example.com/{doc_id}")
+        for doc_id in refs
+    ]
+
+    item_ids = queue_manager.add_items(items)
+
+    assert item_ids == ["item-1", "item-3"]
+    for ref in refs.values():
+        ref.create.assert_called_once()
+
+
+def _pending_scrape_stream(queue_manager):
+    """Return the mocked stream() of the type/status pending-scrape query."""
+    where = queue_manager.db.collection.return_value.where
+    return where.return_value.where.return_value.limit.return_value.select.return_value.stream
+
+
 def test_has_pending_scrape_returns_true_when_exists(queue_manager):
     """Test has_pending_scrape returns True when pending SCRAPE exists."""
     # Mock query that returns a document
     mock_doc = MagicMock()
-    queue_manager.db.collection.return_value.where.return_value.where.return_value.limit.return_value.stream.return_value = [
-        mock_doc
-    ]
+    _pending_scrape_stream(queue_manager).return_value = [mock_doc]
 
     result = queue_manager.has_pending_scrape()
 
@@ -64,9 +119,7 @@ def test_has_pending_scrape_returns_true_when_exists(queue_manager):
 def test_has_pending_scrape_returns_false_when_none(queue_manager):
     """Test has_pending_scrape returns False when no pending SCRAPE."""
     # Mock query that returns empty list
-    queue_manager.db.collection.return_value.where.return_value.where.return_value.limit.return_value.stream.return_value = (
-        []
-    )
+    _pending_scrape_stream(queue_manager).return_value = []
 
     result = queue_manager.has_pending_scrape()
 
@@ -76,9 +129,7 @@ def test_has_pending_scrape_returns_false_when_none(queue_manager):
 def test_has_pending_scrape_handles_errors(queue_manager):
     """Test has_pending_scrape handles errors gracefully."""
     # Mock query that raises exception
-    queue_manager.db.collection.return_value.where.return_value.where.return_value.limit.return_value.stream.side_effect = Exception(
-        "Firestore error"
-    )
+    _pending_scrape_stream(queue_manager).side_effect = Exception("Firestore error")
 
     result = queue_manager.has_pending_scrape()
 
@@ -131,6 +182,53 @@ def test_get_pending_items(queue_manager):
     assert items[1].id == "doc-2"
 
 
+def _pending_doc(doc_id):
+    doc = MagicMock()
+    doc.id = doc_id
+    doc.to_dict.return_value = {
+        "type": "job",
+        "status": "pending",
+        "url": f"https://example.com/job/{doc_id}",
+        "source": "scraper",
+    }
+    return doc
+
+
+def test_iter_pending_items_paginates_with_cursor(queue_manager):
+    """Test iter_pending_items fetches pages with start_after cursors."""
+    page1 = [_pending_doc("doc-1"), _pending_doc("doc-2")]
+    page2 = [_pending_doc("doc-3")]
+
+    first_query = MagicMock()
+    first_query.stream.return_value = page1
+    first_query.start_after.return_value.stream.return_value = page2
+    limit_mock = (
+        queue_manager.db.collection.return_value.where.return_value.order_by.return_value.limit
+    )
+    limit_mock.return_value = first_query
+
+    items = list(queue_manager.iter_pending_items(page_size=2))
+
+    assert [item.id for item in items] == ["doc-1", "doc-2", "doc-3"]
+    first_query.start_after.assert_called_once_with(page1[-1])
+    assert limit_mock.call_count == 2
+
+
+def test_iter_pending_items_is_lazy(queue_manager):
+    """Test iter_pending_items doesn't fetch the next page until it is needed."""
+    first_query = MagicMock()
+    first_query.stream.return_value = [_pending_doc("doc-1"), _pending_doc("doc-2")]
+    limit_mock = (
+        queue_manager.db.collection.return_value.where.return_value.order_by.return_value.limit
+    )
+    limit_mock.return_value = first_query
+
+    items = queue_manager.get_pending_items(limit=2)
+
+    assert len(items) == 2
+    first_query.start_after.assert_not_called()
+
+
 def test_update_status(queue_manager):
     """Test updating item status."""
     # Mock Firestore update operation
@@ -154,13 +252,49 @@ def test_update_status(queue_manager):
     assert "completed_at" in call_args
 
 
+def test_update_status_sets_ttl_expiry(queue_manager):
+    """Test successful items get expires_at and requeued items have it cleared."""
+    mock_doc = queue_manager.db.collection.return_value.document.return_value
+
+    before = datetime.now(timezone.utc)
+    queue_manager.update_status("test-doc-id", QueueStatus.SUCCESS)
+    expires_at = mock_doc.update.call_args[0][0]["expires_at"]
+    assert expires_at >= before + timedelta(days=QUEUE_ITEM_TTL_DAYS)
+
+    # Filtered/skipped items are intake's only record of a rejected URL; failed
+    # items can still be retried
+    for status in (QueueStatus.FILTERED, QueueStatus.SKIPPED, QueueStatus.FAILED):
+        queue_manager.update_status("test-doc-id", status)
+        assert "expires_at" not in mock_doc.update.call_args[0][0]
+
+    queue_manager.update_status("test-doc-id", QueueStatus.PENDING)
+    assert mock_doc.update.call_args[0][0]["expires_at"] is gcloud_firestore.DELETE_FIELD
+
+
+def test_get_items_single_batched_read(queue_manager):
+    """Test get_items fetches all IDs with one get_all call and skips missing ones."""
+    found = MagicMock(id="item-1", exists=True)
+    found.to_dict.return_value = {"type": "job", "url": "https://example.com/job/1"}
+    missing = MagicMock(id="item-2", exists=False)
+    queue_manager.db.get_all.return_value = [found, missing]
+
+    items = queue_manager.get_items(["item-1", "item-2", "item-1"])
+
+    assert list(items) == ["item-1"]
+    assert items["item-1"].url == "https://example.com/job/1"
+    queue_manager.db.get_all.assert_called_once()
+    assert len(queue_manager.db.get_all.call_args[0][0]) == 2
+    queue_manager.db.collection.return_value.document.return_value.get.assert_not_called()
+
+
 def test_url_exists_in_queue(queue_manager):
     """Test checking if URL exists in queue."""
     # Mock Firestore query for existing URL
     mock_doc = MagicMock()
     mock_query = MagicMock()
     mock_query.stream.return_value = [mock_doc]
-    queue_manager.db.collection.return_value.where.return_value.limit.return_value = mock_query
+    where = queue_manager.db.collection.return_value.where
+    where.return_value.limit.return_value.select.return_value = mock_query
 
     # Check existing URL
     exists = queue_manager.url_exists_in_queue("https://example.com/job/123")
@@ -176,151 +310,386 @@ def test_url_exists_in_queue(queue_manager):
     assert exists is False
 
 
+def _status_snapshot(status, exists=True):
+    """Build a mock snapshot of a status-only read."""
+    snapshot = MagicMock()
+    snapshot.exists = exists
+    snapshot.to_dict.return_value = {"status": status} if exists else None
+    return snapshot
+
+
 def test_retry_item_success(queue_manager):
     """Test successfully retrying a failed item."""
-    # Mock get_item to return a failed item
-    failed_item = JobQueueItem(
-        id="test-doc-id",
-        type=QueueItemType.JOB,
-        url="https://example.com/job/123",
-        company_name="Test Company",
-        source="scraper",
-        status=QueueStatus.FAILED,
-    )
-
-    with patch.object(queue_manager, "get_item", return_value=failed_item):
-        mock_doc = MagicMock()
-        queue_manager.db.collection.return_value.document.return_value = mock_doc
+    mock_doc = MagicMock()
+    mock_doc.get.return_value = _status_snapshot("failed")
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
 
-        # Retry the item
-        result = queue_manager.retry_item("test-doc-id")
+    # Retry the item
+    result = queue_manager.retry_item("test-doc-id")
 
-        # Assertions
-        assert result is True
-        queue_manager.db.collection.assert_called_with("job-queue")
-        queue_manager.db.collection.return_value.document.assert_called_with("test-doc-id")
-        mock_doc.update.assert_called_once()
+    # Assertions
+    assert result is True
+    queue_manager.db.collection.assert_called_with("job-queue")
+    queue_manager.db.collection.return_value.document.assert_called_with("test-doc-id")
+    mock_doc.get.assert_called_once_with(field_paths=["status"])
+    mock_doc.update.assert_called_once()
 
-        # Check update data
-        call_args = mock_doc.update.call_args[0][0]
-        assert call_args["status"] == "pending"
-        assert "updated_at" in call_args
-        # Verify fields are deleted
-        from google.cloud import firestore as gcloud_firestore
+    # Update is conditional on the document not changing since the read
+    queue_manager.db.write_option.assert_called_once_with(
+        last_update_time=mock_doc.get.return_value.update_time
+    )
+    assert mock_doc.update.call_args[1]["option"] == queue_manager.db.write_option.return_value
 
-        assert call_args["processed_at"] == gcloud_firestore.DELETE_FIELD
-        assert call_args["completed_at"] == gcloud_firestore.DELETE_FIELD
-        assert call_args["error_details"] == gcloud_firestore.DELETE_FIELD
+    # Check update data
+    call_args = mock_doc.update.call_args[0][0]
+    assert call_args["status"] == "pending"
+    assert "updated_at" in call_args
+    # Verify fields are deleted
+    assert call_args["processed_at"] == gcloud_firestore.DELETE_FIELD
+    assert call_args["completed_at"] == gcloud_firestore.DELETE_FIELD
+    assert call_args["error_details"] == gcloud_firestore.DELETE_FIELD
 
 
 def test_retry_item_not_found(queue_manager):
     """Test retrying an item that doesn't exist."""
-    # Mock get_item to return None
-    with patch.object(queue_manager, "get_item", return_value=None):
-        result = queue_manager.retry_item("nonexistent-id")
+    mock_doc = MagicMock()
+    mock_doc.get.return_value = _status_snapshot(None, exists=False)
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
 
-        # Should return False when item not found
-        assert result is False
+    result = queue_manager.retry_item("nonexistent-id")
+
+    # Should return False when item not found
+    assert result is False
+    mock_doc.update.assert_not_called()
 
 
 def test_retry_item_not_failed(queue_manager):
     """Test retrying an item that is not in failed status."""
-    # Mock get_item to return a pending item
-    pending_item = JobQueueItem(
-        id="test-doc-id",
-        type=QueueItemType.JOB,
-        url="https://example.com/job/123",
-        company_name="Test Company",
-        source="scraper",
-        status=QueueStatus.PENDING,
-    )
+    mock_doc = MagicMock()
+    mock_doc.get.return_value = _status_snapshot("pending")
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
+
+    result = queue_manager.retry_item("test-doc-id")
+
+    # Should return False when item is not failed
+    assert result is False
+    mock_doc.update.assert_not_called()
 
-    with patch.object(queue_manager, "get_item", return_value=pending_item):
-        result = queue_manager.retry_item("test-doc-id")
 
-        # Should return False when item is not failed
-        assert result is False
+def test_retry_item_modified_concurrently(queue_manager):
+    """Test retry_item returns False if the item changed after it was read."""
+    from google.api_core.exceptions import FailedPrecondition
+
+    mock_doc = MagicMock()
+    mock_doc.get.return_value = _status_snapshot("failed")
+    mock_doc.update.side_effect = FailedPrecondition("update_time mismatch")
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
+
+    assert queue_manager.retry_item("test-doc-id") is False
 
 
 def test_retry_item_exception(queue_manager):
     """Test retry_item handles exceptions gracefully."""
-    # Mock get_item to return a failed item
-    failed_item = JobQueueItem(
-        id="test-doc-id",
-        type=QueueItemType.JOB,
-        url="https://example.com/job/123",
-        company_name="Test Company",
-        source="scraper",
-        status=QueueStatus.FAILED,
-    )
-
-    with patch.object(queue_manager, "get_item", return_value=failed_item):
-        # Mock update to raise exception
-        mock_doc = MagicMock()
-        mock_doc.update.side_effect = Exception("Firestore error")
-        queue_manager.db.collection.return_value.document.return_value = mock_doc
+    # Mock update to raise exception
+    mock_doc = MagicMock()
+    mock_doc.get.return_value = _status_snapshot("failed")
+    mock_doc.update.side_effect = Exception("Firestore error")
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
 
-        result = queue_manager.retry_item("test-doc-id")
+    result = queue_manager.retry_item("test-doc-id")
 
-        # Should return False on exception
-        assert result is False
+    # Should return False on exception
+    assert result is False
 
 
 def test_delete_item_success(queue_manager):
     """Test successfully deleting an item."""
-    # Mock get_item to return an item
-    item = JobQueueItem(
-        id="test-doc-id",
-        type=QueueItemType.JOB,
-        url="https://example.com/job/123",
-        company_name="Test Company",
-        source="scraper",
-        status=QueueStatus.SUCCESS,
-    )
-
-    with patch.object(queue_manager, "get_item", return_value=item):
-        mock_doc = MagicMock()
-        queue_manager.db.collection.return_value.document.return_value = mock_doc
+    mock_doc = MagicMock()
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
 
-        # Delete the item
-        result = queue_manager.delete_item("test-doc-id")
+    # Delete the item
+    result = queue_manager.delete_item("test-doc-id")
 
-        # Assertions
-        assert result is True
-        queue_manager.db.collection.assert_called_with("job-queue")
-        queue_manager.db.collection.return_value.document.assert_called_with("test-doc-id")
-        mock_doc.delete.assert_called_once()
+    # Assertions
+    assert result is True
+    queue_manager.db.collection.assert_called_with("job-queue")
+    queue_manager.db.collection.return_value.document.assert_called_with("test-doc-id")
+    queue_manager.db.write_option.assert_called_once_with(exists=True)
+    mock_doc.delete.assert_called_once_with(option=queue_manager.db.write_option.return_value)
+    # No read before the delete
+    mock_doc.get.assert_not_called()
 
 
 def test_delete_item_not_found(queue_manager):
     """Test deleting an item that doesn't exist."""
-    # Mock get_item to return None
-    with patch.object(queue_manager, "get_item", return_value=None):
-        result = queue_manager.delete_item("nonexistent-id")
+    from google.api_core.exceptions import NotFound
+
+    mock_doc = MagicMock()
+    mock_doc.delete.side_effect = NotFound("No document to update")
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
+
+    result = queue_manager.delete_item("nonexistent-id")
 
-        # Should return False when item not found
-        assert result is False
+    # Should return False when item not found
+    assert result is False
 
 
 def test_delete_item_exception(queue_manager):
     """Test delete_item handles exceptions gracefully."""
-    # Mock get_item to return an item
-    item = JobQueueItem(
-        id="test-doc-id",
+    # Mock delete to raise exception
+    mock_doc = MagicMock()
+    mock_doc.delete.side_effect = Exception("Firestore error")
+    queue_manager.db.collection.return_value.document.return_value = mock_doc
+
+    result = queue_manager.delete_item("test-doc-id")
+
+    # Should return False on exception
+    assert result is False
+
+
+def test_get_items_by_tracking_id_filters_status_on_server(queue_manager):
+    """Test get_items_by_tracking_id pushes the status filter into the query."""
+    tracking_query = queue_manager.db.collection.return_value.where.return_value
+    tracking_query.where.return_value.stream.return_value = [_pending_doc("doc-1")]
+
+    items = queue_manager.get_items_by_tracking_id(
+        "track-1", status_filter=[QueueStatus.PENDING, QueueStatus.PROCESSING]
+    )
+
+    assert [item.id for item in items] == ["doc-1"]
+    status_filter = tracking_query.where.call_args[1]["filter"]
+    assert status_filter.field_path == "status"
+    assert status_filter.op_string == "in"
+    assert status_filter.value == ["pending", "processing"]
+    tracking_query.stream.assert_not_called()
+
+
+def test_get_items_by_tracking_id_without_status_filter(queue_manager):
+    """Test get_items_by_tracking_id returns the whole lineage without a status filter."""
+    tracking_query = queue_manager.db.collection.return_value.where.return_value
+    tracking_query.stream.return_value = [_pending_doc("doc-1"), _pending_doc("doc-2")]
+
+    items = queue_manager.get_items_by_tracking_id("track-1")
+
+    assert [item.id for item in items] == ["doc-1", "doc-2"]
+    tracking_query.where.assert_not_called()
+
+
+def _lineage_stream(queue_manager):
+    """Return the mocked stream() of the tracking_id/url/type lineage query."""
+    where = queue_manager.db.collection.return_value.where
+    return where.return_value.where.return_value.where.return_value.select.return_value.stream
+
+
+def _spawning_item(**kwargs):
+    return JobQueueItem(
+        id="parent-id",
         type=QueueItemType.JOB,
         url="https://example.com/job/123",
-        company_name="Test Company",
-        source="scraper",
-        status=QueueStatus.FAILED,
+        tracking_id="track-1",
+        **kwargs,
+    )
+
+
+def _lineage_doc(status, doc_id=None, **fields):
+    doc = MagicMock()
+    if doc_id:
+        doc.id = doc_id
+    doc.to_dict.return_value = {"status": status, **fields}
+    return doc
+
+
+def test_can_spawn_item_allowed(queue_manager):
+    """Test can_spawn_item allows spawning when nothing matches in the lineage."""
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("success", pipeline_stage="filter")]
+
+    can_spawn, reason = queue_manager.can_spawn_item(
+        _spawning_item(), "https://example.com/job/123", QueueItemType.JOB
+    )
+
+    assert can_spawn is True
+    assert reason == "OK"
+    _lineage_stream(queue_manager).assert_called_once()
+    where = queue_manager.db.collection.return_value.where
+    where.return_value.where.return_value.where.return_value.select.assert_called_once_with(
+        ["status", "pipeline_stage"]
+    )
+
+
+def test_can_spawn_item_max_depth(queue_manager):
+    """Test can_spawn_item blocks at the spawn depth limit without querying."""
+    item = _spawning_item(spawn_depth=3, max_spawn_depth=3)
+
+    can_spawn, reason = queue_manager.can_spawn_item(
+        item, "https://example.com/job/123", QueueItemType.JOB
+    )
+
+    assert can_spawn is False
+    assert "Max spawn depth" in reason
+    _lineage_stream(queue_manager).assert_not_called()
+
+
+def test_can_spawn_item_duplicate_pending(queue_manager):
+    """Test can_spawn_item blocks when the same work is already queued."""
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("failed"), _lineage_doc("pending")]
+
+    can_spawn, reason = queue_manager.can_spawn_item(
+        _spawning_item(), "https://example.com/job/123", QueueItemType.JOB
+    )
+
+    assert can_spawn is False
+    assert reason.startswith("Duplicate work")
+
+
+def test_can_spawn_item_terminal_state(queue_manager):
+    """Test can_spawn_item blocks when the same work reached a terminal state."""
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("filtered")]
+
+    can_spawn, reason = queue_manager.can_spawn_item(
+        _spawning_item(), "https://example.com/job/123", QueueItemType.JOB
     )
 
-    with patch.object(queue_manager, "get_item", return_value=item):
-        # Mock delete to raise exception
-        mock_doc = MagicMock()
-        mock_doc.delete.side_effect = Exception("Firestore error")
-        queue_manager.db.collection.return_value.document.return_value = mock_doc
+    assert can_spawn is False
+    assert reason.startswith("Already in terminal state (filtered)")
+
+
+def test_can_spawn_item_already_saved(queue_manager):
+    """Test can_spawn_item blocks when the same work completed the save stage."""
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("success", pipeline_stage="save")]
+
+    can_spawn, reason = queue_manager.can_spawn_item(
+        _spawning_item(), "https://example.com/job/123", QueueItemType.JOB
+    )
+
+    assert can_spawn is False
+    assert reason.startswith("Already saved")
+
+
+def test_can_spawn_item_query_error_allows_spawn(queue_manager):
+    """Test can_spawn_item falls back to allowing the spawn if the lineage query fails."""
+    _lineage_stream(queue_manager).side_effect = Exception("Firestore error")
+
+    can_spawn, _ = queue_manager.can_spawn_item(
+        _spawning_item(), "https://example.com/job/123", QueueItemType.JOB
+    )
+
+    assert can_spawn is True
+
+
+def test_has_pending_work_for_url(queue_manager):
+    """Test has_pending_work_for_url only counts pending or processing items."""
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("processing")]
+    assert queue_manager.has_pending_work_for_url(
+        "https://example.com/job/123", QueueItemType.JOB, "track-1"
+    )
+
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("success")]
+    assert not queue_manager.has_pending_work_for_url(
+        "https://example.com/job/123", QueueItemType.JOB, "track-1"
+    )
+
+
+def test_spawn_items_safely_batches_writes(queue_manager):
+    """Test spawn_items_safely writes allowed items in one batch commit."""
+    _lineage_stream(queue_manager).return_value = []
+    refs = [MagicMock(id="child-1"), MagicMock(id="child-2")]
+    queue_manager.db.collection.return_value.document.side_effect = refs
+    batch = queue_manager.db.batch.return_value
+
+    item_ids = queue_manager.spawn_items_safely(
+        _spawning_item(),
+        [
+            {"type": QueueItemType.COMPANY, "url": "https://a.example.com"},
+            {"type": QueueItemType.COMPANY, "url": "https://b.example.com"},
+            {"type": QueueItemType.COMPANY, "url": "https://a.example.com"},
+        ],
+    )
 
-        result = queue_manager.delete_item("test-doc-id")
+    assert item_ids == ["child-1", "child-2", None]
+    assert batch.create.call_count == 2
+    batch.commit.assert_called_once()
+    queue_manager.db.collection.return_value.add.assert_not_called()
+
+    data = batch.create.call_args_list[0][0][1]
+    assert data["tracking_id"] == "track-1"
+    assert data["ancestry_chain"] == ["parent-id"]
+    assert data["spawn_depth"] == 1
+    assert data["parent_item_id"] == "parent-id"
+    assert data["status"] == "pending"
+
+
+def test_spawn_items_safely_skips_blocked_items(queue_manager):
+    """Test spawn_items_safely returns None for blocked items and writes nothing."""
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("pending")]
+
+    item_ids = queue_manager.spawn_items_safely(
+        _spawning_item(), [{"type": QueueItemType.COMPANY, "url": "https://a.example.com"}]
+    )
+
+    assert item_ids == [None]
+    queue_manager.db.batch.assert_not_called()
+
+
+def test_complete_and_spawn_single_batch(queue_manager):
+    """Test complete_and_spawn commits the status update and child create together."""
+    # The parent is still PROCESSING in Firestore while it spawns its next step
+    _lineage_stream(queue_manager).return_value = [
+        _lineage_doc("success", doc_id="grandparent-id", pipeline_stage="scrape"),
+        _lineage_doc("processing", doc_id="parent-id"),
+    ]
+    queue_manager.db.collection.return_value.document.side_effect = lambda *args: MagicMock(
+        id=args[0] if args else "child-1"
+    )
+    batch = queue_manager.db.batch.return_value
+
+    item_id = queue_manager.complete_and_spawn(
+        _spawning_item(sub_task=JobSubTask.SCRAPE),
+        next_sub_task=JobSubTask.FILTER,
+        pipeline_state={"job_data": {"title": "Engineer"}},
+        result_message="Job data scraped successfully",
+    )
+
+    assert item_id == "child-1"
+    batch.commit.assert_called_once()
+
+    cur_ref, update_data = batch.update.call_args[0]
+    assert cur_ref.id == "parent-id"
+    assert update_data["status"] == "success"
+    assert update_data["result_message"] == "Job data scraped successfully"
+    assert "completed_at" in update_data
+
+    new_ref, data = batch.create.call_args[0]
+    assert new_ref.id == "child-1"
+    assert data["sub_task"] == "filter"
+    assert data["parent_item_id"] == "parent-id"
+    assert data["pipeline_state"] == {"job_data": {"title": "Engineer"}}
+    queue_manager.db.collection.return_value.document.return_value.update.assert_not_called()
+
+
+def test_complete_and_spawn_blocked_by_other_active_item(queue_manager):
+    """Test only the parent's own document is treated as completed."""
+    _lineage_stream(queue_manager).return_value = [
+        _lineage_doc("processing", doc_id="parent-id"),
+        _lineage_doc("pending", doc_id="other-id"),
+    ]
+
+    item_id = queue_manager.complete_and_spawn(_spawning_item(), next_sub_task=JobSubTask.FILTER)
+
+    assert item_id is None
+    queue_manager.db.batch.assert_not_called()
+
+
+def test_complete_and_spawn_blocked_only_updates_status(queue_manager):
+    """Test complete_and_spawn still completes the item when the spawn is blocked."""
+    _lineage_stream(queue_manager).return_value = [_lineage_doc("pending")]
+
+    item_id = queue_manager.complete_and_spawn(
+        _spawning_item(), next_sub_task=JobSubTask.FILTER, result_message="done"
+    )
 
-        # Should return False on exception
-        assert result is False
+    assert item_id is None
+    queue_manager.db.batch.assert_not_called()
+    update_data = queue_manager.db.collection.return_value.document.return_value.update.call_args[
+        0
+    ][0]
+    assert update_data["status"] == "success"
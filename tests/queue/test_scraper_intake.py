@@ -10,7 +10,11 @@ from job_finder.job_queue.scraper_intake import ScraperIntake
 @pytest.fixture
 def mock_queue_manager():
     """Create mock queue manager."""
-    return MagicMock()
+    manager = MagicMock()
+    doc_ids = iter(f"doc-id-{n}" for n in range(1, 100))
+    manager.collection.document.side_effect = lambda: MagicMock(id=next(doc_ids))
+    manager.add_items.side_effect = lambda items: [item.id for item in items]
+    return manager
 
 
 @pytest.fixture
@@ -38,14 +42,17 @@ def test_submit_jobs_success(scraper_intake, mock_queue_manager):
 
     # Mock no duplicates
     mock_queue_manager.url_exists_in_queue.return_value = False
-    mock_queue_manager.add_item.return_value = "doc-id"
 
     # Submit jobs
     count = scraper_intake.submit_jobs(jobs, source="scraper")
 
-    # Should add both jobs
+    # Should add both jobs in one batched call
     assert count == 2
-    assert mock_queue_manager.add_item.call_count == 2
+    mock_queue_manager.add_items.assert_called_once()
+    mock_queue_manager.add_item.assert_not_called()
+    items = mock_queue_manager.add_items.call_args[0][0]
+    assert [item.id for item in items] == ["doc-id-1", "doc-id-2"]
+    assert items[0].ancestry_chain == ["doc-id-1"]
 
 
 def test_submit_jobs_with_duplicates(scraper_intake, mock_queue_manager):
@@ -61,14 +68,27 @@ def test_submit_jobs_with_duplicates(scraper_intake, mock_queue_manager):
         return url == "https://example.com/job/2"
 
     mock_queue_manager.url_exists_in_queue.side_effect = url_exists_side_effect
-    mock_queue_manager.add_item.return_value = "doc-id"
 
     # Submit jobs
     count = scraper_intake.submit_jobs(jobs, source="scraper")
 
     # Should add 2 jobs (skip 1 duplicate)
     assert count == 2
-    assert mock_queue_manager.add_item.call_count == 2
+    assert len(mock_queue_manager.add_items.call_args[0][0]) == 2
+
+
+def test_submit_jobs_skips_repeated_urls(scraper_intake, mock_queue_manager):
+    """Test the same URL twice in one submission is only queued once."""
+    jobs = [
+        {"title": "Job 1", "url": "https://example.com/job/1", "company": "Test"},
+        {"title": "Job 1", "url": "https://example.com/job/1", "company": "Test"},
+    ]
+
+    mock_queue_manager.url_exists_in_queue.return_value = False
+
+    count = scraper_intake.submit_jobs(jobs, source="scraper")
+
+    assert count == 1
 
 
 def test_submit_jobs_with_company_id(scraper_intake, mock_queue_manager):
@@ -78,7 +98,6 @@ def test_submit_jobs_with_company_id(scraper_intake, mock_queue_manager):
     ]
 
     mock_queue_manager.url_exists_in_queue.return_value = False
-    mock_queue_manager.add_item.return_value = "doc-id"
 
     # Submit with company ID
     count = scraper_intake.submit_jobs(jobs, source="scraper", company_id="company-123")
@@ -86,7 +105,7 @@ def test_submit_jobs_with_company_id(scraper_intake, mock_queue_manager):
     assert count == 1
 
     # Check that company_id was passed in queue item
-    call_args = mock_queue_manager.add_item.call_args[0][0]
+    call_args = mock_queue_manager.add_items.call_args[0][0][0]
     assert call_args.company_id == "company-123"
 
 
@@ -94,21 +113,28 @@ def test_submit_jobs_handles_errors(scraper_intake, mock_queue_manager):
     """Test that submission continues on individual errors."""
     jobs = [
         {"title": "Job 1", "url": "https://example.com/job/1", "company": "Test"},
-        {"title": "Job 2", "url": "https://example.com/job/2", "company": "Test"},
+        {"title": "Job 2", "url": 12345, "company": "Test"},  # Malformed
+        {"title": "Job 3", "url": "https://example.com/job/3", "company": "Test"},
     ]
 
     mock_queue_manager.url_exists_in_queue.return_value = False
 
-    # First add succeeds, second fails
-    mock_queue_manager.add_item.side_effect = [
-        "doc-id-1",
-        Exception("Firestore error"),
-    ]
+    # Should skip the malformed job and add the others
+    count = scraper_intake.submit_jobs(jobs, source="scraper")
+
+    assert count == 2
+
+
+def test_submit_jobs_write_failure(scraper_intake, mock_queue_manager):
+    """Test that a failed batch write reports nothing added instead of raising."""
+    jobs = [{"title": "Job 1", "url": "https://example.com/job/1", "company": "Test"}]
+
+    mock_queue_manager.url_exists_in_queue.return_value = False
+    mock_queue_manager.add_items.side_effect = Exception("Firestore error")
 
-    # Should continue and add first job
     count = scraper_intake.submit_jobs(jobs, source="scraper")
 
-    assert count == 1  # Only first succeeded
+    assert count == 0
 
 
 def test_submit_company_success(scraper_intake, mock_queue_manager):
@@ -171,4 +197,4 @@ def test_submit_jobs_empty_list(scraper_intake, mock_queue_manager):
     count = scraper_intake.submit_jobs([], source="scraper")
 
     assert count == 0
-    mock_queue_manager.add_item.assert_not_called()
+    mock_queue_manager.add_items.assert_not_called()
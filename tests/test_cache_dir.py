@@ -0,0 +1,69 @@
+"""Tests for the private per-user cache directory helpers."""
+
+import os
+
+import pytest
+
+from job_finder.utils.cache_dir import get_cache_dir, read_private_json, write_private_json
+
+
+class TestGetCacheDir:
+    """Test cache directory creation and ownership checks."""
+
+    def test_creates_private_directory(self, tmp_path, monkeypatch):
+        """The cache dir should be created under XDG_CACHE_HOME with mode 0700."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        cache_dir = get_cache_dir()
+
+        assert cache_dir == tmp_path / "job-finder"
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+    def test_rejects_shared_directory(self, tmp_path, monkeypatch):
+        """A cache dir with group/other permissions should not be used."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        (tmp_path / "job-finder").mkdir(mode=0o777)
+        (tmp_path / "job-finder").chmod(0o777)
+
+        assert get_cache_dir() is None
+
+    def test_rejects_symlinked_directory(self, tmp_path, monkeypatch):
+        """A symlink in place of the cache dir should not be followed."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        target = tmp_path / "elsewhere"
+        target.mkdir(mode=0o700)
+        (tmp_path / "job-finder").symlink_to(target)
+
+        assert get_cache_dir() is None
+
+
+class TestPrivateJson:
+    """Test reading and writing private JSON cache files."""
+
+    def test_round_trip(self, tmp_path):
+        """Written files should be private and read back unchanged."""
+        path = tmp_path / "cache.json"
+
+        write_private_json(path, {"a": [1, 2]})
+
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert read_private_json(path) == {"a": [1, 2]}
+
+    def test_rejects_non_private_file(self, tmp_path):
+        """Files readable or writable by others should be refused."""
+        path = tmp_path / "cache.json"
+        write_private_json(path, {"a": 1})
+        path.chmod(0o644)
+
+        with pytest.raises(PermissionError):
+            read_private_json(path)
+
+    def test_rejects_symlink(self, tmp_path):
+        """A symlinked cache file should be refused."""
+        target = tmp_path / "target.json"
+        write_private_json(target, {"a": 1})
+        link = tmp_path / "cache.json"
+        os.symlink(target, link)
+
+        with pytest.raises(OSError):
+            read_private_json(link)
@@ -61,18 +61,10 @@ class TestCompanyPipeline:
         # Execute
         processor._process_company_fetch(queue_item)
 
-        # Verify status updated to SUCCESS
-        assert mock_dependencies["queue_manager"].update_status.call_count >= 1
-        success_call = [
-            call
-            for call in mock_dependencies["queue_manager"].update_status.call_args_list
-            if call[0][1] == QueueStatus.SUCCESS
-        ]
-        assert len(success_call) > 0
-
-        # Verify next step spawned (EXTRACT)
-        assert mock_dependencies["queue_manager"].spawn_next_pipeline_step.called
-        spawn_call = mock_dependencies["queue_manager"].spawn_next_pipeline_step.call_args
+        # Verify step completed and next step spawned (EXTRACT)
+        assert mock_dependencies["queue_manager"].complete_and_spawn.called
+        spawn_call = mock_dependencies["queue_manager"].complete_and_spawn.call_args
+        assert "Fetched" in spawn_call[1]["result_message"]
         assert spawn_call[1]["next_sub_task"] == CompanySubTask.EXTRACT
         assert spawn_call[1]["is_company"] is True
         assert "html_content" in spawn_call[1]["pipeline_state"]
@@ -110,8 +102,8 @@ class TestCompanyPipeline:
         assert mock_dependencies["company_info_fetcher"]._extract_company_info.called
 
         # Verify next step spawned (ANALYZE)
-        assert mock_dependencies["queue_manager"].spawn_next_pipeline_step.called
-        spawn_call = mock_dependencies["queue_manager"].spawn_next_pipeline_step.call_args
+        assert mock_dependencies["queue_manager"].complete_and_spawn.called
+        spawn_call = mock_dependencies["queue_manager"].complete_and_spawn.call_args
         assert spawn_call[1]["next_sub_task"] == CompanySubTask.ANALYZE
         assert "extracted_info" in spawn_call[1]["pipeline_state"]
 
@@ -142,7 +134,7 @@ class TestCompanyPipeline:
         processor._process_company_analyze(queue_item)
 
         # Verify tech stack detected
-        spawn_call = mock_dependencies["queue_manager"].spawn_next_pipeline_step.call_args
+        spawn_call = mock_dependencies["queue_manager"].complete_and_spawn.call_args
         analysis_result = spawn_call[1]["pipeline_state"]["analysis_result"]
         assert "python" in analysis_result["tech_stack"]
         assert "react" in analysis_result["tech_stack"]
@@ -299,3 +299,38 @@ class TestFirestoreClient:
         assert "portfolio-staging" in databases
         assert "portfolio" in databases
         assert len(databases) == 2
+
+
+class TestReadProjectId:
+    """Test project ID lookup from the service account file."""
+
+    @patch("job_finder.storage.firestore_client.firebase_admin")
+    @patch("job_finder.storage.firestore_client.gcloud_firestore")
+    @patch("job_finder.storage.firestore_client.credentials")
+    def test_existing_app_skips_certificate(
+        self, mock_creds, mock_firestore, mock_firebase, mock_credentials_path
+    ):
+        """With Firebase Admin already initialized, the key should not be parsed."""
+        mock_firebase.get_app.return_value = Mock()
+
+        FirestoreClient.get_client(
+            database_name="portfolio-staging", credentials_path=mock_credentials_path
+        )
+
+        mock_creds.Certificate.assert_not_called()
+        mock_firestore.Client.assert_called_once_with(
+            project="test-project", database="portfolio-staging"
+        )
+
+    @patch("job_finder.storage.firestore_client.firebase_admin")
+    @patch("job_finder.storage.firestore_client.gcloud_firestore")
+    def test_missing_project_id(self, mock_firestore, mock_firebase, tmp_path):
+        """A credentials file without project_id should fail client creation."""
+        mock_firebase.get_app.return_value = Mock()
+        creds_file = tmp_path / "creds.json"
+        creds_file.write_text('{"type": "service_account"}')
+
+        with pytest.raises(InitializationError, match="No project_id"):
+            FirestoreClient.get_client(
+                database_name="portfolio-staging", credentials_path=str(creds_file)
+            )
@@ -0,0 +1,278 @@
+"""Tests for the Firestore profile loader."""
+
+import threading
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from job_finder.profile.firestore_loader import FirestoreProfileLoader
+from job_finder.profile.schema import Experience, Profile
+
+
+@pytest.fixture
+def loader():
+    """Create a profile loader with a mocked Firestore client."""
+    with patch("job_finder.profile.firestore_loader.FirestoreClient") as mock_client:
+        mock_client.get_client.return_value = MagicMock()
+        loader = FirestoreProfileLoader(database_name="test-db")
+    loader._query_content_items = MagicMock(return_value=[])
+    # No denormalized profiles/{user_id} document unless a test sets one
+    _aggregate_snapshot(loader).exists = False
+    return loader
+
+
+def _aggregate_snapshot(loader):
+    return loader.db.collection.return_value.document.return_value.get.return_value
+
+
+def _experience(company="Acme", technologies=None):
+    return Experience(
+        company=company,
+        title="Engineer",
+        start_date="2020-01",
+        technologies=technologies or [],
+    )
+
+
+def _doc(data, doc_id="doc-1"):
+    doc = MagicMock()
+    doc.id = doc_id
+    doc.to_dict.return_value = data
+    return doc
+
+
+class TestLoadProfile:
+    """Test FirestoreProfileLoader.load_profile."""
+
+    def test_builds_profile(self, loader):
+        """Experiences and blurbs should be combined into a Profile."""
+        experiences = [_experience(technologies=["Python", "GCP"])]
+        loader._load_experiences = MagicMock(return_value=experiences)
+        loader._count_experience_blurbs = MagicMock(return_value=1)
+
+        profile = loader.load_profile(user_id="user-1", name="Test User")
+
+        loader._load_experiences.assert_called_once_with("user-1")
+        loader._count_experience_blurbs.assert_called_once_with("user-1")
+        assert isinstance(profile, Profile)
+        assert profile.name == "Test User"
+        assert profile.experience == experiences
+        assert [s.name for s in profile.skills] == ["Python", "GCP"]
+
+    def test_loads_experiences_and_blurbs_concurrently(self, loader):
+        """The two independent queries should be in flight at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def load_experiences(user_id):
+            barrier.wait()
+            return [_experience()]
+
+        def count_blurbs(user_id):
+            barrier.wait()
+            return 0
+
+        loader._load_experiences = load_experiences
+        loader._count_experience_blurbs = count_blurbs
+
+        profile = loader.load_profile()
+
+        assert len(profile.experience) == 1
+
+    def test_prefers_profile_aggregate(self, loader):
+        """A profiles/{user_id} document should replace the collection queries."""
+        snapshot = _aggregate_snapshot(loader)
+        snapshot.exists = True
+        snapshot.to_dict.return_value = {
+            "experiences": [
+                {"company": "Acme", "role": "Engineer", "technologies": ["Python"]},
+                {"company": "", "role": "Missing company"},
+            ],
+            "blurbs": [{"title": "Bio"}],
+        }
+        loader._load_experiences = MagicMock()
+        loader._count_experience_blurbs = MagicMock()
+
+        profile = loader.load_profile(user_id="user-1")
+
+        loader.db.collection.assert_called_with("profiles")
+        loader.db.collection.return_value.document.assert_called_with("user-1")
+        loader._load_experiences.assert_not_called()
+        loader._count_experience_blurbs.assert_not_called()
+        assert [e.company for e in profile.experience] == ["Acme"]
+        assert [s.name for s in profile.skills] == ["Python"]
+
+    def test_aggregate_error_falls_back_to_collections(self, loader):
+        """If the aggregate read fails, the collection queries should be used."""
+        loader.db.collection.return_value.document.return_value.get.side_effect = RuntimeError(
+            "unavailable"
+        )
+        loader._load_experiences = MagicMock(return_value=[_experience()])
+        loader._count_experience_blurbs = MagicMock(return_value=0)
+
+        profile = loader.load_profile(user_id="user-1")
+
+        loader._load_experiences.assert_called_once_with("user-1")
+        assert len(profile.experience) == 1
+
+    def test_query_error_propagates(self, loader):
+        """Errors from either query should still surface to the caller."""
+        loader._load_experiences = MagicMock(side_effect=RuntimeError("boom"))
+        loader._count_experience_blurbs = MagicMock(return_value=0)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            loader.load_profile()
+
+
+class TestParseTechnologiesFromBody:
+    """Test extraction of technologies from experience body text."""
+
+    def test_stack_section(self, loader):
+        """A Stack: line should be split into technologies."""
+        body = "Built things.\nStack: Python, React , GCP\nMore text"
+
+        assert loader._parse_technologies_from_body(body) == ["Python", "React", "GCP"]
+
+    def test_tech_stack_not_counted_twice(self, loader):
+        """A Tech Stack: line should only be parsed once."""
+        body = "Tech Stack: Go, Rust"
+
+        assert loader._parse_technologies_from_body(body) == ["Go", "Rust"]
+
+    def test_multiple_sections_case_insensitive(self, loader):
+        """Every matching section should be parsed, regardless of case."""
+        body = "technologies: Docker\nStack: Kubernetes"
+
+        assert loader._parse_technologies_from_body(body) == ["Docker", "Kubernetes"]
+
+    def test_empty_items_dropped(self, loader):
+        """Stray or trailing commas should not produce empty technologies."""
+        body = "Stack: Python,, React ,\t"
+
+        assert loader._parse_technologies_from_body(body) == ["Python", "React"]
+
+    def test_no_section(self, loader):
+        """Bodies without a stack section should yield no technologies."""
+        assert loader._parse_technologies_from_body("Led a team of five.") == []
+
+
+class TestCountExperienceBlurbs:
+    """Test FirestoreProfileLoader._count_experience_blurbs."""
+
+    def test_uses_count_aggregation(self, loader):
+        """Blurbs should be counted server-side without streaming documents."""
+        query = loader.db.collection.return_value.where.return_value
+        query.count.return_value.get.return_value = [[MagicMock(value=3)]]
+
+        count = loader._count_experience_blurbs(user_id="user-1")
+
+        loader.db.collection.assert_called_once_with("experience-blurbs")
+        query.stream.assert_not_called()
+        assert count == 3
+
+
+class TestLoadExperiences:
+    """Test FirestoreProfileLoader._load_experiences."""
+
+    def test_content_items_schema_skips_invalid(self, loader):
+        """content-items docs missing company or role should be dropped."""
+        loader._query_content_items.return_value = [
+            _doc({"company": "Acme", "role": "Engineer", "technologies": ["Python"]}),
+            _doc({"company": "", "role": "Engineer"}, doc_id="bad"),
+        ]
+
+        experiences = loader._load_experiences()
+
+        assert [e.company for e in experiences] == ["Acme"]
+        assert experiences[0].technologies == ["Python"]
+
+    def test_falls_back_to_experience_entries(self, loader):
+        """With no content-items, the old experience-entries schema should be used."""
+        loader._query_experience_docs = MagicMock(
+            return_value=[_doc({"title": "Acme", "role": "Engineer", "body": "Stack: Go"})]
+        )
+
+        experiences = loader._load_experiences(user_id="user-1")
+
+        loader._query_experience_docs.assert_called_once_with("user-1")
+        assert [(e.company, e.title) for e in experiences] == [("Acme", "Engineer")]
+        assert experiences[0].technologies == ["Go"]
+
+
+class TestExtractSkills:
+    """Test FirestoreProfileLoader._extract_skills."""
+
+    def test_dedupes_technologies_in_first_seen_order(self, loader):
+        """Technologies repeated across experiences should yield one skill each."""
+        experiences = [
+            _experience(technologies=["Python", "", "GCP"]),
+            _experience(technologies=["GCP", "Python", "React"]),
+        ]
+
+        skills = loader._extract_skills(experiences, [])
+
+        assert [s.name for s in skills] == ["Python", "GCP", "React"]
+        assert all(s.category == "technology" for s in skills)
+
+    def test_skill_group_takes_precedence(self, loader):
+        """Skills from skill-group keep their category over experience technologies."""
+        loader._query_content_items.return_value = [
+            _doc({"subcategories": [{"name": "Languages", "skills": ["Python"]}]})
+        ]
+        experiences = [_experience(technologies=["Python", "Docker"])]
+
+        skills = loader._extract_skills(experiences, [])
+
+        assert [(s.name, s.category) for s in skills] == [
+            ("Python", "Languages"),
+            ("Docker", "technology"),
+        ]
+
+
+class TestCalculateYearsExperience:
+    """Test FirestoreProfileLoader._calculate_years_experience."""
+
+    def _exp(self, start, end=None, is_current=False):
+        return Experience(
+            company="Acme", title="Engineer", start_date=start, end_date=end, is_current=is_current
+        )
+
+    def test_sums_disjoint_roles(self, loader):
+        """Separate roles should add up."""
+        experiences = [
+            self._exp("2018-01-01", "2020-01-01"),
+            self._exp("2021-01-01", "2022-01-01"),
+        ]
+
+        assert loader._calculate_years_experience(experiences) == 3.0
+
+    def test_overlapping_roles_counted_once(self, loader):
+        """Concurrent roles should not double count the overlap."""
+        experiences = [
+            self._exp("2019-01", "2021-01"),
+            self._exp("2018-01", "2020-01"),
+            self._exp("2019-06", "2019-12"),
+        ]
+
+        assert loader._calculate_years_experience(experiences) == 3.0
+
+    def test_current_role_runs_to_today(self, loader):
+        """A current role should count up to today."""
+        start = date.today().replace(year=date.today().year - 2, day=1)
+        experiences = [self._exp(start.isoformat(), is_current=True)]
+
+        assert 1.9 <= loader._calculate_years_experience(experiences) <= 2.0
+
+    def test_unparseable_dates_skipped(self, loader):
+        """Entries with missing or invalid start dates should be ignored."""
+        experiences = [
+            self._exp("", "2020-01"),
+            self._exp("sometime", "2020-01"),
+            self._exp("2016", "2017"),
+        ]
+
+        assert loader._calculate_years_experience(experiences) == 1.0
+
+    def test_no_experiences(self, loader):
+        """No experience should be zero years."""
+        assert loader._calculate_years_experience([]) == 0.0
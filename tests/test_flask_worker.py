@@ -0,0 +1,85 @@
+"""Tests for the Flask worker readiness endpoint and Firestore warm-up."""
+
+import importlib
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("flask")
+
+
+@pytest.fixture
+def flask_worker(monkeypatch):
+    """Import flask_worker without touching real log files and reset its state."""
+    monkeypatch.setattr("job_finder.logging_config.setup_logging", MagicMock())
+    module = importlib.import_module("job_finder.flask_worker")
+
+    for key, value in {
+        "running": False,
+        "shutdown_requested": False,
+        "items_processed_total": 0,
+        "last_error": None,
+        "poll_interval": 0,
+        "iteration": 0,
+        "ready": False,
+    }.items():
+        monkeypatch.setitem(module.worker_state, key, value)
+    monkeypatch.setattr(module, "queue_manager", MagicMock())
+    monkeypatch.setattr(module, "processor", MagicMock())
+    return module
+
+
+class TestReadyEndpoint:
+    """Test /ready across the worker's first poll."""
+
+    def test_not_ready_before_worker_starts(self, flask_worker):
+        """/ready should return 503 while the worker isn't running."""
+        response = flask_worker.app.test_client().get("/ready")
+
+        assert response.status_code == 503
+        assert response.get_json() == {"ready": False}
+
+    def test_ready_only_after_first_successful_poll(self, flask_worker, monkeypatch):
+        """/ready should return 503 until get_pending_items succeeds, then 200."""
+        client = flask_worker.app.test_client()
+        queue_manager = flask_worker.queue_manager
+        queue_manager.get_pending_items.side_effect = [RuntimeError("unavailable"), []]
+        statuses = []
+
+        def fake_sleep(seconds):
+            # Called after every poll - record readiness as seen mid-loop
+            statuses.append(client.get("/ready").status_code)
+            if len(statuses) == 2:
+                flask_worker.worker_state["shutdown_requested"] = True
+
+        monkeypatch.setattr(flask_worker.time, "sleep", fake_sleep)
+
+        flask_worker.worker_loop()
+
+        assert statuses == [503, 200]
+        # Stopped workers are not ready again
+        assert client.get("/ready").status_code == 503
+
+
+class TestWarmUpFirestore:
+    """Test the Firestore warm-up read issued before polling starts."""
+
+    def test_reads_one_queue_document(self, flask_worker):
+        """Warm-up should issue a single limited read against the queue collection."""
+        queue_manager = flask_worker.queue_manager
+        queue_manager.collection_name = "job-queue"
+
+        flask_worker.warm_up_firestore()
+
+        queue_manager.db.collection.assert_called_once_with("job-queue")
+        queue_manager.db.collection.return_value.limit.assert_called_once_with(1)
+        queue_manager.db.collection.return_value.limit.return_value.get.assert_called_once()
+
+    def test_failure_is_not_fatal(self, flask_worker):
+        """A failed warm-up read should be logged, not raised."""
+        limit = flask_worker.queue_manager.db.collection.return_value.limit
+        limit.return_value.get.side_effect = RuntimeError("no credentials")
+
+        flask_worker.warm_up_firestore()
+
+        assert flask_worker.worker_state["ready"] is False
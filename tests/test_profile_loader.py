@@ -478,3 +478,22 @@ class TestCreateTemplate:
         assert isinstance(profile, Profile)
         assert profile.name == "Your Name"
         assert len(profile.skills) > 0
+
+
+class TestProfilePackageExports:
+    """Test the lazily imported exports of job_finder.profile."""
+
+    def test_firestore_loader_resolved_on_access(self):
+        """FirestoreProfileLoader should still be importable from the package."""
+        from job_finder import profile
+        from job_finder.profile.firestore_loader import FirestoreProfileLoader
+
+        assert profile.FirestoreProfileLoader is FirestoreProfileLoader
+        assert "FirestoreProfileLoader" in profile.__all__
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should raise AttributeError."""
+        from job_finder import profile
+
+        with pytest.raises(AttributeError):
+            profile.NotAThing  # noqa: B018